@@ -3,19 +3,28 @@ from .models import (
     BearCase,
     FinalDecision,
     InvestmentDecision,
-    RiskMitigation
+    RiskMitigation,
+    DecisionPatch
 )
 from .agents import (
     optimist_agent,
     skeptic_agent,
-    investment_committee
+    investment_committee,
+    committee_repair_agent
 )
 from .orchestrator import (
     run_vc_debate,
+    run_committee,
     format_verdict,
     format_bull_case,
     format_bear_case
 )
+from .context import DebateContext
+from .archive import DecisionArchive, get_decision_archive, set_decision_archive
+from .singleflight import DebateFlights, get_debate_flights, set_debate_flights
+from .records import DebateRecord, dump_records, load_records
+from .batch import run_vc_debate_batch, load_startups
+from .rendering import RenderCache, export_decisions
 from .app import create_app
 
 __all__ = [
@@ -25,15 +34,37 @@ __all__ = [
     "FinalDecision",
     "InvestmentDecision",
     "RiskMitigation",
+    "DecisionPatch",
     # Agents
     "optimist_agent",
     "skeptic_agent",
     "investment_committee",
+    "committee_repair_agent",
     # Orchestration
     "run_vc_debate",
+    "run_committee",
     "format_verdict",
     "format_bull_case",
     "format_bear_case",
+    "DebateContext",
+    # Archive
+    "DecisionArchive",
+    "get_decision_archive",
+    "set_decision_archive",
+    # Single-flight
+    "DebateFlights",
+    "get_debate_flights",
+    "set_debate_flights",
+    # Records
+    "DebateRecord",
+    "dump_records",
+    "load_records",
+    # Batch
+    "run_vc_debate_batch",
+    "load_startups",
+    # Rendering
+    "RenderCache",
+    "export_decisions",
     # App
     "create_app",
 ]
@@ -1,6 +1,6 @@
 from agents import Agent
-from .models import BullCase, BearCase, FinalDecision
-from .tools import search_startup_info
+from .models import BullCase, BearCase, FinalDecision, DecisionPatch
+from .tools import search_startup_info_async
 
 
 # THE OPTIMIST 
@@ -27,7 +27,7 @@ optimist_agent = Agent(
     instructions=OPTIMIST_PROMPT,
     model="gpt-4o-mini",
     output_type=BullCase,
-    tools=[search_startup_info]
+    tools=[search_startup_info_async]
 )
 
 
@@ -55,7 +55,7 @@ skeptic_agent = Agent(
     instructions=SKEPTIC_PROMPT,
     model="gpt-4o-mini",
     output_type=BearCase,
-    tools=[search_startup_info]
+    tools=[search_startup_info_async]
 )
 
 
@@ -107,3 +107,26 @@ investment_committee = Agent(
     model="gpt-4o-mini",
     output_type=FinalDecision
 )
+
+
+# COMMITTEE REPAIR 
+REPAIR_PROMPT = '''# ROLE
+You are the Investment Committee Chair fixing a decision that failed validation.
+
+# RULES
+- An INVEST decision MUST have an empty `unresolved_risks` list
+- Either move every unresolved risk into `risk_mitigations` with a concrete mitigation,
+  OR change the decision to PASS or FOLLOW_UP and keep the risks listed
+- If you change the decision, rewrite `investment_thesis` so it argues for the new decision
+- Keep everything else about your reasoning unchanged
+
+# OUTPUT
+Return a DecisionPatch with the corrected fields only.
+'''
+
+committee_repair_agent = Agent(
+    name="Investment Committee Repair",
+    instructions=REPAIR_PROMPT,
+    model="gpt-4o-mini",
+    output_type=DecisionPatch
+)
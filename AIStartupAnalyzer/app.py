@@ -1,112 +1,289 @@
 import asyncio
+import json
+import os
+import re
+import time
+from typing import Callable, Optional
+
 import gradio as gr
-from agents import Runner
+from agents import RawResponsesStreamEvent, RunItemStreamEvent, StreamEvent
 
 from .models import BullCase, BearCase, FinalDecision
-from .agents import optimist_agent, skeptic_agent, investment_committee
-from .orchestrator import format_verdict, format_bull_case, format_bear_case
+from .archive import get_decision_archive
+from .context import DebateContext
+from .instrumentation import InMemoryExporter, Tracer, default_exporters, format_timing
+from .singleflight import Flight
+from .orchestrator import (
+    DebateObserver,
+    join_debate,
+    format_verdict,
+    format_bull_case,
+    format_bear_case
+)
+
+
+def _session_results(final_decision: FinalDecision, bull_case: BullCase, bear_case: BearCase) -> dict:
+    return {
+        "bull_case": bull_case,
+        "bear_case": bear_case,
+        "final_decision": final_decision,
+        "verdict": format_verdict(final_decision)  # Store formatted verdict
+    }
+
+
+def _age(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min"
+    if seconds < 2 * 86400:
+        return f"{seconds / 3600:.1f} h"
+    return f"{seconds / 86400:.1f} days"
+
+
+_THESIS = re.compile(r'"investment_thesis"\s*:\s*"((?:[^"\\]|\\.)*)')
+_DECISION = re.compile(r'"decision"\s*:\s*"(\w+)"')
+
+
+def _partial_string(raw: str) -> str:
+    """Decode a JSON string body that may be cut off mid-escape."""
+    for end in range(len(raw), max(-1, len(raw) - 6), -1):
+        try:
+            return json.loads(f'"{raw[:end]}"')
+        except ValueError:
+            continue
+    return raw
+
+
+class LiveStatus:
+    """
+    Streamed agent events turned into the status text, one line per agent.
+
+    - Tool calls show the search query, tool outputs count finished searches
+    - Text deltas show drafting progress; for the committee, its decision and
+      investment thesis as they stream in
+    - Renders are throttled to one per `interval` seconds (default:
+      GRADIO_STREAM_INTERVAL or 0.25); a pending change is published when the
+      interval ends, and `flush()` publishes right away
+    """
+
+    def __init__(self, publish: Callable[[str], None], header: str = "", interval: Optional[float] = None):
+        if interval is None:
+            # Read here, not at import: main.py loads .env after importing the package
+            interval = float(os.getenv("GRADIO_STREAM_INTERVAL", "0.25"))
+        self.publish = publish
+        self.header = header
+        self.interval = interval
+        self.lines: dict[str, str] = {}
+        self._searches: dict[str, int] = {}
+        self._text: dict[str, str] = {}
+        self._last = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def listener(self, label: str, initial: str = "") -> Callable[[StreamEvent], None]:
+        """on_event callback for one agent's run (see orchestrator.run_agent)."""
+        self.lines[label] = f"{label}: {initial}" if initial else label
+        self._searches[label] = 0
+        self._text[label] = ""
+
+        def on_event(event: StreamEvent) -> None:
+            line = self._describe(label, event)
+            if line is not None and line != self.lines[label]:
+                self.lines[label] = line
+                self._changed()
+
+        return on_event
+
+    def _describe(self, label: str, event: StreamEvent) -> Optional[str]:
+        if isinstance(event, RunItemStreamEvent):
+            if event.name == "tool_called":
+                try:
+                    query = json.loads(getattr(event.item.raw_item, "arguments", "") or "{}").get("query")
+                except ValueError:
+                    query = None
+                return f"{label}: 🔎 searching \"{query}\"" if query else f"{label}: 🔎 searching..."
+            if event.name == "tool_output":
+                self._searches[label] += 1
+                return f"{label}: 📄 read {self._searches[label]} search result set(s)"
+            return None
+
+        if isinstance(event, RawResponsesStreamEvent) and event.data.type == "response.output_text.delta":
+            self._text[label] += event.data.delta
+            text = self._text[label]
+            thesis = _THESIS.search(text)
+            if thesis:
+                decision = _DECISION.search(text)
+                prefix = f"{decision.group(1)} - " if decision else ""
+                return f"{label}: {prefix}{_partial_string(thesis.group(1))}…"
+            return f"{label}: ✍️ drafting ({len(text):,} chars)"
+        return None
+
+    def render(self) -> str:
+        return "\n".join(filter(None, [self.header, *self.lines.values()]))
 
+    def _changed(self) -> None:
+        wait = self._last + self.interval - time.monotonic()
+        if wait <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(wait, self.flush)
 
-# Store results globally for button access
-analysis_results = {}
+    def stop(self) -> None:
+        """Drop a pending render (the stage is over and the next one takes the status)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
+    def flush(self) -> None:
+        self.stop()
+        self._last = time.monotonic()
+        self.publish(self.render())
 
-async def analyze_startup(startup_name: str, progress=gr.Progress()):
-    """Run the VC debate and stream updates."""
-    global analysis_results
+
+async def analyze_startup(
+    startup_name: str,
+    results: dict | None = None,
+    fresh: bool = False,
+    progress=gr.Progress()
+):
+    """
+    Run the VC debate and stream updates.
+
+    `results` is the session's gr.State; the finished cases are returned as a new
+    dict in the last output so concurrent sessions never see each other's runs.
+    A fresh-enough archived analysis is shown straight away unless `fresh` is set.
+    Sessions (and CLI or batch requests) asking for the same startup at the
+    same time share one run (see orchestrator.join_debate); every session
+    following it gets the progress its starter publishes.
+    """
+    results = results or {}
     
     if not startup_name.strip():
-        yield "Please enter a startup name.", "", "", "none"
+        yield "Please enter a startup name.", "", "", "none", "", results
         return
     
-    progress(0, desc="Starting analysis...")
-    yield f"🎯 Starting AI-VC analysis for: {startup_name}", "", "", "none"
+    archive = get_decision_archive()
+    if archive is not None and not fresh:
+        archived = await archive.alatest(startup_name)
+        if archived is not None:
+            results = _session_results(archived.final_decision, archived.bull_case, archived.bear_case)
+            progress(1.0, desc="Loaded from archive")
+            yield (
+                f"✅ Analysis Complete! (archived {_age(archived.age_s)} ago - tick 'Re-analyze' to refresh)",
+                results["verdict"], "", "none", "", results
+            )
+            return
     
-    progress(0.2, desc="Running parallel research...")
-    yield f"🐂 Optimist researching bull case...\n🐻 Skeptic researching bear case...", "", "", "none"
+    # Per-run span collector for the timing breakdown (plus any env-configured exporters)
+    spans = InMemoryExporter()
+    context = DebateContext(tracer=Tracer([spans, *default_exporters()]))
     
-    # Run bull and bear in parallel with higher turn limit
-    bull_task = Runner.run(
-        optimist_agent, 
-        f"Analyze startup: {startup_name}. Build the strongest bull case for investment.",
-        max_turns=30
-    )
-    bear_task = Runner.run(
-        skeptic_agent, 
-        f"Analyze startup: {startup_name}. Build the most thorough bear case with all risks.",
-        max_turns=30
-    )
+    progress(0, desc="Starting analysis...")
+    yield f"🎯 Starting AI-VC analysis for: {startup_name}", "", "", "none", "", results
     
-    bull_result, bear_result = await asyncio.gather(bull_task, bear_task)
-    bull_case: BullCase = bull_result.final_output
-    bear_case: BearCase = bear_result.final_output
+    # The same flight as run_vc_debate, so CLI, batch and UI requests for one startup share a run
+    timing = ""
+    async with join_debate(startup_name, context, observer=lambda flight: SessionProgress(flight, spans)) as flight:
+        shared = " (shared with another run)" if flight.context is not context else ""
+        # Progress comes from the run this session started or joined; a session
+        # that falls behind skips straight to the newest status
+        async for fraction, desc, status, timing in flight.updates(latest_only=True):
+            progress(fraction, desc=desc)
+            yield status, "", "", "none", timing, results
+        final_decision, bull_case, bear_case = await flight.result()
+    if not shared:
+        timing = format_timing(spans.spans)
     
-    progress(0.6, desc="Bull & Bear cases complete...")
-    yield (
-        f"✅ Bull Case Complete (Confidence: {bull_case.confidence_score}/10)\n"
-        f"✅ Bear Case Complete (Risk Score: {bear_case.risk_severity_score}/10)\n\n"
-        f"⚖️ Investment Committee deliberating...",
-        "", "", "none"
-    )
+    # Store results in the session state for the buttons
+    results = _session_results(final_decision, bull_case, bear_case)
     
-    # Investment Committee
-    progress(0.8, desc="Investment Committee deliberating...")
-    committee_input = f"""# Startup: {startup_name}
+    progress(1.0, desc="Analysis complete!")
+    yield f"✅ Analysis Complete!{shared}", results["verdict"], "", "none", timing, results
 
-## BULL CASE (from The Optimist)
-{bull_case.model_dump_json(indent=2)}
 
-## BEAR CASE (from The Skeptic)
-{bear_case.model_dump_json(indent=2)}
+class SessionProgress(DebateObserver):
+    """
+    Publishes a debate's progress to its flight as (fraction, description,
+    status, timing) snapshots, so every session following it sees the same updates.
+    """
 
-Based on both cases, make your final investment decision.
-Remember: You CANNOT recommend INVEST if there are unresolved_risks.
-"""
-    
-    committee_result = await Runner.run(investment_committee, committee_input)
-    final_decision: FinalDecision = committee_result.final_output
-    
-    # Store results for buttons
-    verdict = format_verdict(final_decision)
-    analysis_results["bull_case"] = bull_case
-    analysis_results["bear_case"] = bear_case
-    analysis_results["final_decision"] = final_decision
-    analysis_results["verdict"] = verdict  # Store formatted verdict
-    
-    progress(1.0, desc="Analysis complete!")
-    yield "✅ Analysis Complete!", verdict, "", "none"
+    def __init__(self, flight: Flight, spans: InMemoryExporter):
+        self.flight = flight
+        self.spans = spans
+        # Streamed research activity (searches, drafting) replaces the status text as it happens
+        self.research_status = LiveStatus(lambda status: self._emit(0.2, "Running parallel research...", status))
+        self.committee_status: Optional[LiveStatus] = None
+
+    def _emit(self, fraction: float, desc: str, status: str, timing: str = "") -> None:
+        self.flight.emit((fraction, desc, status, timing))
+
+    def research(self, side: str) -> Callable[[StreamEvent], None]:
+        if side == "bull":
+            on_event = self.research_status.listener("🐂 Optimist", "researching bull case...")
+        else:
+            on_event = self.research_status.listener("🐻 Skeptic", "researching bear case...")
+        self.research_status.flush()
+        return on_event
+
+    def committee(self, bull_case: Optional[BullCase], bear_case: Optional[BearCase]) -> Callable[[StreamEvent], None]:
+        self.research_status.stop()
+        # Investment Committee, with its decision and thesis streamed as they are written
+        timing = format_timing(self.spans.spans)
+        bull = f"Confidence: {bull_case.confidence_score}/10" if bull_case else "dropped, did not finish in time"
+        bear = f"Risk Score: {bear_case.risk_severity_score}/10" if bear_case else "dropped, did not finish in time"
+        self.committee_status = LiveStatus(
+            lambda status: self._emit(0.8, "Investment Committee deliberating...", status, timing),
+            header=f"✅ Bull Case Complete ({bull})\n✅ Bear Case Complete ({bear})\n"
+        )
+        on_event = self.committee_status.listener("⚖️ Investment Committee", "deliberating...")
+        self.committee_status.flush()
+        return on_event
 
+    def finished(self) -> None:
+        # No late render once the run has ended, however it ended
+        self.research_status.stop()
+        if self.committee_status is not None:
+            self.committee_status.stop()
 
-def toggle_bull_case(current_view: str):
+
+def toggle_bull_case(current_view: str, results: dict | None):
     """Toggle bull case display - also restores verdict."""
-    if "bull_case" not in analysis_results:
+    if not results or "bull_case" not in results:
         return "", "Run an analysis first!", "none"
     
-    verdict = analysis_results.get("verdict", "")
+    verdict = results.get("verdict", "")
     
     if current_view == "bull":
         return verdict, "", "none"
     else:
-        return verdict, format_bull_case(analysis_results["bull_case"]), "bull"
+        return verdict, format_bull_case(results["bull_case"]), "bull"
 
 
-def toggle_bear_case(current_view: str):
+def toggle_bear_case(current_view: str, results: dict | None):
     """Toggle bear case display - also restores verdict."""
-    if "bear_case" not in analysis_results:
+    if not results or "bear_case" not in results:
         return "", "Run an analysis first!", "none"
     
-    verdict = analysis_results.get("verdict", "")
+    verdict = results.get("verdict", "")
     
     if current_view == "bear":
         return verdict, "", "none"
     else:
-        return verdict, format_bear_case(analysis_results["bear_case"]), "bear"
+        return verdict, format_bear_case(results["bear_case"]), "bear"
+
 
+def create_app(concurrency: Optional[int] = None) -> gr.Blocks:
+    """
+    Create and return the Gradio app.
+
+    Results live in per-session gr.State, and the queue runs up to `concurrency`
+    analyses at once (default: GRADIO_CONCURRENCY or 4); further requests wait in line.
+    """
+    if concurrency is None:
+        # Read here, not at import: main.py loads .env after importing the package
+        concurrency = int(os.getenv("GRADIO_CONCURRENCY", "4"))
 
-def create_app() -> gr.Blocks:
-    """Create and return the Gradio app."""
     with gr.Blocks(title="AI-VC: Multi-Agent Startup Analyzer", theme=gr.themes.Soft()) as demo:
         current_view = gr.State("none")
+        session_results = gr.State({})
         
         gr.Markdown("# 🎯 AI-VC: Multi-Agent Startup Analyzer")
         gr.Markdown("Enter a startup name to run a full bull vs bear debate analysis.")
@@ -118,11 +295,14 @@ def create_app() -> gr.Blocks:
                 scale=3
             )
             analyze_btn = gr.Button("🚀 Analyze", variant="primary", scale=1)
+        fresh_input = gr.Checkbox(label="Re-analyze (ignore archived results)", value=False)
         
         status_output = gr.Textbox(label="Status", interactive=False)
         
-        # Verdict stays visible in its own section
-        verdict_output = gr.Markdown(label="Final Verdict")
+        # Verdict stays visible in its own section, with the run's timing breakdown beside it
+        with gr.Row():
+            verdict_output = gr.Markdown(label="Final Verdict")
+            timing_output = gr.Markdown(label="Timing")
         
         with gr.Row():
             bull_btn = gr.Button("🐂 View Bull Case", variant="secondary")
@@ -134,22 +314,24 @@ def create_app() -> gr.Blocks:
         # Event handlers - verdict_output is NOT cleared by toggle buttons
         analyze_btn.click(
             fn=analyze_startup,
-            inputs=[startup_input],
-            outputs=[status_output, verdict_output, case_output, current_view]
+            inputs=[startup_input, session_results, fresh_input],
+            outputs=[status_output, verdict_output, case_output, current_view, timing_output, session_results],
+            concurrency_limit=concurrency
         )
         
         # Toggle buttons restore verdict and show/hide case
         bull_btn.click(
             fn=toggle_bull_case, 
-            inputs=[current_view], 
+            inputs=[current_view, session_results], 
             outputs=[verdict_output, case_output, current_view]
         )
         bear_btn.click(
             fn=toggle_bear_case, 
-            inputs=[current_view], 
+            inputs=[current_view, session_results], 
             outputs=[verdict_output, case_output, current_view]
         )
     
+    demo.queue(default_concurrency_limit=concurrency)
     return demo
 
 
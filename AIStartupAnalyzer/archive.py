@@ -0,0 +1,386 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from .models import BullCase, BearCase, FinalDecision
+
+
+DEFAULT_ARCHIVE_PATH = Path(__file__).parent / ".cache" / "decisions.sqlite"
+DEFAULT_FRESHNESS = 7 * 24 * 3600
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS decisions ("
+    "id INTEGER PRIMARY KEY, "
+    "startup_name TEXT NOT NULL, "
+    "startup_key TEXT NOT NULL, "
+    "decision TEXT NOT NULL, "
+    "risk_severity_score INTEGER, "
+    "confidence_score INTEGER, "
+    "missing_case TEXT, "
+    "created_at REAL NOT NULL, "
+    "elapsed_s REAL, "
+    "final_decision TEXT NOT NULL, "
+    "bull_case TEXT, "
+    "bear_case TEXT, "
+    "bull_evidence TEXT, "
+    "bear_evidence TEXT)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_startup ON decisions(startup_key, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_decision ON decisions(decision, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_risk ON decisions(risk_severity_score)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_confidence ON decisions(confidence_score)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_created ON decisions(created_at)",
+)
+
+# Columns added after the first release, created on open for older archive files
+_MIGRATIONS = (
+    ("bull_evidence", "ALTER TABLE decisions ADD COLUMN bull_evidence TEXT"),
+    ("bear_evidence", "ALTER TABLE decisions ADD COLUMN bear_evidence TEXT"),
+)
+
+_COLUMNS = (
+    "startup_name, startup_key, decision, risk_severity_score, confidence_score, "
+    "missing_case, created_at, elapsed_s, final_decision, bull_case, bear_case, "
+    "bull_evidence, bear_evidence"
+)
+_INSERT = f"INSERT INTO decisions ({_COLUMNS}) VALUES ({', '.join('?' * 13)})"
+_SELECT = (
+    "SELECT id, startup_name, created_at, elapsed_s, final_decision, bull_case, bear_case, "
+    "bull_evidence, bear_evidence FROM decisions"
+)
+
+
+def normalize_startup(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+@dataclass
+class ArchivedDecision:
+    """One stored debate; the case models are parsed from their JSON columns on first access."""
+    id: int
+    startup_name: str
+    created_at: float
+    elapsed_s: Optional[float]
+    final_decision_json: str
+    bull_case_json: Optional[str]
+    bear_case_json: Optional[str]
+    # Fingerprints of the searches each agent ran (see tools.evidence_changed); None if not recorded
+    bull_evidence_json: Optional[str] = None
+    bear_evidence_json: Optional[str] = None
+
+    @cached_property
+    def final_decision(self) -> FinalDecision:
+        return FinalDecision.model_validate_json(self.final_decision_json)
+
+    @cached_property
+    def bull_case(self) -> Optional[BullCase]:
+        return BullCase.model_validate_json(self.bull_case_json) if self.bull_case_json else None
+
+    @cached_property
+    def bear_case(self) -> Optional[BearCase]:
+        return BearCase.model_validate_json(self.bear_case_json) if self.bear_case_json else None
+
+    @property
+    def bull_evidence(self) -> Optional[list]:
+        return json.loads(self.bull_evidence_json) if self.bull_evidence_json is not None else None
+
+    @property
+    def bear_evidence(self) -> Optional[list]:
+        return json.loads(self.bear_evidence_json) if self.bear_evidence_json is not None else None
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.created_at
+
+    def as_record(self) -> dict:
+        """Same shape as a batch JSONL line, so rendering.export_decisions can render archive queries."""
+        return {
+            "startup_name": self.startup_name,
+            "final_decision": json.loads(self.final_decision_json),
+            "bull_case": json.loads(self.bull_case_json) if self.bull_case_json else None,
+            "bear_case": json.loads(self.bear_case_json) if self.bear_case_json else None,
+            "elapsed_s": self.elapsed_s,
+            "created_at": self.created_at
+        }
+
+
+def _model_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes)):
+        return value.decode() if isinstance(value, bytes) else value
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value.model_dump_json()
+
+
+def _field(value: Any, name: str) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value.get(name)
+    if isinstance(value, (str, bytes)):
+        return json.loads(value).get(name)
+    return getattr(value, name)
+
+
+class DecisionArchive:
+    """
+    Durable archive of debate results (FinalDecision, BullCase, BearCase).
+
+    - SQLite, one row per debate: the models as JSON columns, plus indexed
+      columns for the fields reports filter on (normalized startup name,
+      decision, risk severity, bull confidence, timestamp)
+    - `latest(name)` serves the newest complete result inside the freshness
+      window, so a repeat request skips the three agents
+    - `alatest`/`aput` are the same for the event loop: the SQLite work runs
+      in a thread, so concurrent debates don't stall on disk I/O
+    - `put_many` bulk-inserts in chunked transactions (e.g. batch JSONL files)
+    - `query(...)` streams matches in chunks from its own read connection,
+      so large reports never load the whole archive
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_ARCHIVE_PATH, freshness: float = DEFAULT_FRESHNESS):
+        self.path = Path(path)
+        self.freshness = freshness
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(decisions)")}
+        for column, statement in _MIGRATIONS:
+            if column not in columns:
+                self._db.execute(statement)
+        self._db.commit()
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @staticmethod
+    def _row(
+        startup_name: str,
+        final_decision: Any,
+        bull_case: Any = None,
+        bear_case: Any = None,
+        elapsed_s: Optional[float] = None,
+        created_at: Optional[float] = None,
+        bull_evidence: Optional[list] = None,
+        bear_evidence: Optional[list] = None
+    ) -> tuple:
+        decision = _field(final_decision, "decision")
+        return (
+            startup_name,
+            normalize_startup(startup_name),
+            getattr(decision, "value", decision),
+            _field(bear_case, "risk_severity_score"),
+            _field(bull_case, "confidence_score"),
+            _field(final_decision, "missing_case"),
+            time.time() if created_at is None else created_at,
+            elapsed_s,
+            _model_json(final_decision),
+            _model_json(bull_case),
+            _model_json(bear_case),
+            json.dumps(bull_evidence) if bull_evidence is not None else None,
+            json.dumps(bear_evidence) if bear_evidence is not None else None
+        )
+
+    def put(
+        self,
+        startup_name: str,
+        final_decision: FinalDecision,
+        bull_case: Optional[BullCase] = None,
+        bear_case: Optional[BearCase] = None,
+        elapsed_s: Optional[float] = None,
+        bull_evidence: Optional[list] = None,
+        bear_evidence: Optional[list] = None
+    ) -> int:
+        """Store one debate result, with the agents' search fingerprints if known; returns its row id."""
+        row = self._row(
+            startup_name, final_decision, bull_case, bear_case, elapsed_s,
+            bull_evidence=bull_evidence, bear_evidence=bear_evidence
+        )
+        with self._lock:
+            cursor = self._db.execute(_INSERT, row)
+            self._db.commit()
+        return cursor.lastrowid
+
+    async def aput(self, *args, **kwargs) -> int:
+        """put() in a thread, for async callers."""
+        return await asyncio.to_thread(self.put, *args, **kwargs)
+
+    def put_many(self, records: Iterable[dict], chunk_size: int = 1000) -> int:
+        """
+        Bulk insert batch-style records ({"startup_name", "final_decision", "bull_case",
+        "bear_case", ...} with models or their dumps). Error records are skipped.
+        """
+        inserted = 0
+        chunk = []
+
+        def flush() -> None:
+            nonlocal inserted
+            with self._lock:
+                self._db.executemany(_INSERT, chunk)
+                self._db.commit()
+            inserted += len(chunk)
+            chunk.clear()
+
+        for record in records:
+            if not record.get("final_decision"):
+                continue
+            chunk.append(self._row(
+                record["startup_name"], record["final_decision"], record.get("bull_case"),
+                record.get("bear_case"), record.get("elapsed_s"), record.get("created_at"),
+                record.get("bull_evidence"), record.get("bear_evidence")
+            ))
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+        return inserted
+
+    def latest(self, startup_name: str, max_age: Optional[float] = None) -> Optional[ArchivedDecision]:
+        """
+        Newest complete result for `startup_name` younger than `max_age` seconds
+        (default: the archive's freshness window), else None. Degraded decisions
+        (a case missed the deadline) are never served.
+        """
+        max_age = self.freshness if max_age is None else max_age
+        with self._lock:
+            row = self._db.execute(
+                f"{_SELECT} WHERE startup_key = ? AND created_at >= ? AND missing_case IS NULL "
+                "ORDER BY created_at DESC LIMIT 1",
+                (normalize_startup(startup_name), time.time() - max_age)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return ArchivedDecision(*row)
+
+    async def alatest(self, startup_name: str, max_age: Optional[float] = None) -> Optional[ArchivedDecision]:
+        """latest() in a thread, for async callers."""
+        return await asyncio.to_thread(self.latest, startup_name, max_age)
+
+    @staticmethod
+    def _where(
+        startup_name: Optional[str] = None,
+        decision: Optional[str] = None,
+        min_risk: Optional[int] = None,
+        max_risk: Optional[int] = None,
+        min_confidence: Optional[int] = None,
+        max_confidence: Optional[int] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        for clause, value in (
+            ("startup_key = ?", normalize_startup(startup_name) if startup_name else None),
+            ("decision = ?", getattr(decision, "value", decision)),
+            ("risk_severity_score >= ?", min_risk),
+            ("risk_severity_score <= ?", max_risk),
+            ("confidence_score >= ?", min_confidence),
+            ("confidence_score <= ?", max_confidence),
+            ("created_at >= ?", since),
+            ("created_at < ?", until),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        startup_name: Optional[str] = None,
+        decision: Optional[str] = None,
+        min_risk: Optional[int] = None,
+        max_risk: Optional[int] = None,
+        min_confidence: Optional[int] = None,
+        max_confidence: Optional[int] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        newest_first: bool = True,
+        limit: Optional[int] = None,
+        chunk_size: int = 500
+    ) -> Iterator[ArchivedDecision]:
+        """Stream archived debates matching every given filter (timestamps are epoch seconds)."""
+        where, params = self._where(
+            startup_name, decision, min_risk, max_risk, min_confidence, max_confidence, since, until
+        )
+        sql = (
+            f"{_SELECT}{where} ORDER BY created_at {'DESC' if newest_first else 'ASC'}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        # A private read connection: the stream can be consumed slowly without holding the writer's lock
+        db = sqlite3.connect(str(self.path))
+        try:
+            cursor = db.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield ArchivedDecision(*row)
+        finally:
+            db.close()
+
+    def count(self, **filters) -> int:
+        """Number of archived debates matching the `query` filters."""
+        where, params = self._where(**filters)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM decisions{where}", params).fetchone()[0]
+
+    def prune(self, older_than: float) -> int:
+        """Delete entries older than `older_than` seconds; returns how many."""
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM decisions WHERE created_at < ?", (time.time() - older_than,))
+            self._db.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# DEFAULT ARCHIVE
+_UNSET = object()
+_default_archive: Any = _UNSET
+_default_lock = threading.Lock()
+
+
+def get_decision_archive() -> Optional[DecisionArchive]:
+    """Return the process-wide archive (None when disabled via DECISION_ARCHIVE_DISABLED=1)."""
+    global _default_archive
+
+    with _default_lock:
+        if _default_archive is _UNSET:
+            if os.environ.get("DECISION_ARCHIVE_DISABLED") == "1":
+                _default_archive = None
+            else:
+                _default_archive = DecisionArchive(
+                    path=os.environ.get("DECISION_ARCHIVE_PATH", DEFAULT_ARCHIVE_PATH),
+                    freshness=float(os.environ.get("DECISION_FRESHNESS", DEFAULT_FRESHNESS))
+                )
+        return _default_archive
+
+
+def set_decision_archive(archive: Optional[DecisionArchive]) -> None:
+    """Swap the process-wide archive; pass None to disable archiving."""
+    global _default_archive
+    with _default_lock:
+        _default_archive = archive
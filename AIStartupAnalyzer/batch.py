@@ -0,0 +1,158 @@
+import asyncio
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .context import DebateContext
+from .orchestrator import run_vc_debate
+from .records import DebateRecord, encode_record, iter_records, record_format, trim_partial_record
+
+
+NAME_KEYS = ("startup_name", "startup", "name", "company")
+
+
+def _normalize_name(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def load_startups(path: str | Path) -> list[str]:
+    """
+    Read startup names from a CSV or JSONL file.
+
+    CSV: a `startup_name`/`startup`/`name`/`company` column, else the first column.
+    JSONL: one object per line with one of those keys, or a bare JSON string.
+    Duplicate names are dropped, keeping input order. A JSONL row without a name
+    raises ValueError.
+    """
+    path = Path(path)
+    names = []
+
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if isinstance(record, str):
+                    names.append(record)
+                    continue
+                name = next((record[k] for k in NAME_KEYS if isinstance(record, dict) and record.get(k)), None)
+                if name is None:
+                    raise ValueError(f"{path}:{line_no}: no startup name (expected one of {', '.join(NAME_KEYS)})")
+                names.append(name)
+    else:
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        if rows:
+            header = [h.strip().lower() for h in rows[0]]
+            column = next((header.index(k) for k in NAME_KEYS if k in header), None)
+            if column is None:
+                column, body = 0, rows
+            else:
+                body = rows[1:]
+            names.extend(row[column] for row in body if len(row) > column)
+
+    seen = set()
+    unique = []
+    for name in (n.strip() for n in names):
+        if name and _normalize_name(name) not in seen:
+            seen.add(_normalize_name(name))
+            unique.append(name)
+    return unique
+
+
+def completed_startups(output_path: str | Path) -> set[str]:
+    """Normalized names that already have a successful result in the output file."""
+    output_path = Path(output_path)
+    done = set()
+    if not output_path.exists():
+        return done
+
+    # A killed run can leave a partial last record - iter_records skips it, so that startup gets re-run
+    for record in iter_records(output_path):
+        done.add(_normalize_name(record.startup_name))
+    return done
+
+
+async def run_vc_debate_batch(
+    startups: Iterable[str],
+    output_path: str | Path,
+    concurrency: int = 8,
+    llm_concurrency: int = 16,
+    search_concurrency: int = 8,
+    resume: bool = True,
+    straggler_timeout: Optional[float] = None,
+    fresh: bool = False,
+    incremental: bool = False
+) -> dict:
+    """
+    Run debates for many startups and stream each result to a JSONL file (or
+    msgpack, for a .msgpack path; see records.py) as it finishes.
+
+    - `concurrency` bounds debates in flight
+    - `llm_concurrency` and `search_concurrency` bound model calls and search calls across all debates
+    - With `resume`, startups that already have a result in `output_path` are skipped
+    - `straggler_timeout`, `fresh` and `incremental` are passed to run_vc_debate (see there)
+
+    Returns a summary dict with completed/failed/skipped counts and elapsed time.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    startups = list(startups)
+    done = completed_startups(output_path) if resume else set()
+    pending = [s for s in startups if _normalize_name(s) not in done]
+    summary = {"completed": 0, "failed": 0, "skipped": len(startups) - len(pending), "elapsed_s": 0.0}
+
+    llm_semaphore = asyncio.Semaphore(llm_concurrency)
+    search_semaphore = asyncio.Semaphore(search_concurrency)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for name in pending:
+        queue.put_nowait(name)
+
+    started = time.perf_counter()
+
+    output_format = record_format(output_path)
+    if resume:
+        # A killed run can leave a partial last record; appending after it would corrupt the next one
+        trim_partial_record(output_path)
+
+    with output_path.open("ab" if resume else "wb") as out:
+
+        def write(record: DebateRecord) -> None:
+            out.write(encode_record(record, output_format))
+            out.flush()
+
+        async def worker() -> None:
+            while True:
+                try:
+                    name = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                context = DebateContext(llm_semaphore=llm_semaphore, search_semaphore=search_semaphore)
+                t0 = time.perf_counter()
+                try:
+                    final_decision, bull_case, bear_case = await run_vc_debate(
+                        name, context, straggler_timeout, fresh=fresh, incremental=incremental
+                    )
+                except Exception as e:
+                    summary["failed"] += 1
+                    write(DebateRecord(startup_name=name, error=f"{type(e).__name__}: {e}"))
+                    continue
+
+                summary["completed"] += 1
+                write(DebateRecord(
+                    startup_name=name,
+                    final_decision=final_decision,
+                    bull_case=bull_case,
+                    bear_case=bear_case,
+                    elapsed_s=round(time.perf_counter() - t0, 3)
+                ))
+
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(pending))))))
+
+    summary["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return summary
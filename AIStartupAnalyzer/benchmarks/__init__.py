@@ -0,0 +1 @@
+"""Offline benchmarks and fixtures for the VC debate pipeline (no API keys needed)."""
@@ -0,0 +1,284 @@
+"""
+Offline benchmark for run_vc_debate and the Gradio analyze_startup generator.
+
+    python -m AIStartupAnalyzer.benchmarks.debate --debates 32 --concurrency 1,4,16
+    python -m AIStartupAnalyzer.benchmarks.debate --compare benchmarks/results/debate-<old>.json
+
+Runs against the local stand-in model and search servers (see stubs.py), so no
+API keys or network access are needed. Reports latency percentiles, throughput
+per concurrency level, event-loop blocking time and peak memory, and writes the
+numbers to JSON for comparison between commits.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from openai import AsyncOpenAI
+from agents import set_default_openai_api, set_default_openai_client, set_tracing_disabled
+
+from .. import tools
+from ..archive import set_decision_archive
+from ..cache import SearchCache, set_search_cache
+from ..orchestrator import run_vc_debate
+from .stubs import LatencyProfile, StubModelServer, StubSearchServer
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class LoopLagMonitor:
+    """Measures how long the event loop was blocked by sleeping `interval` and timing the overshoot."""
+
+    def __init__(self, interval: float = 0.01, threshold: float = 0.005):
+        self.interval = interval
+        self.threshold = threshold
+        self.blocked_s = 0.0
+        self.max_lag_s = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - start - self.interval
+            self.max_lag_s = max(self.max_lag_s, lag)
+            if lag > self.threshold:
+                self.blocked_s += lag
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+
+def percentiles(samples: list[float]) -> dict:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value, "mean": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49], 4),
+        "p95": round(cuts[94], 4),
+        "p99": round(cuts[98], 4),
+        "mean": round(statistics.fmean(samples), 4)
+    }
+
+
+async def _drive(
+    names: list[str],
+    concurrency: int,
+    run_one: Callable[[str], Awaitable[dict]],
+    trace_memory: bool = False
+) -> dict:
+    """
+    Run `run_one` over all names with bounded concurrency and collect timing stats.
+    
+    tracemalloc slows allocation-heavy code noticeably, so Python heap peaks are
+    only measured with `trace_memory`; peak RSS is always reported.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, first_updates, errors = [], [], 0
+
+    async def one(name: str):
+        nonlocal errors
+        async with semaphore:
+            t0 = time.perf_counter()
+            try:
+                timing = await run_one(name)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - t0)
+            if "first_update_s" in timing:
+                first_updates.append(timing["first_update_s"])
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with LoopLagMonitor() as monitor:
+        await asyncio.gather(*(one(n) for n in names))
+    elapsed = time.perf_counter() - started
+    peak_bytes = None
+    if trace_memory:
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    stats = {
+        "debates": len(names),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(len(latencies) / elapsed, 4) if elapsed else 0.0,
+        "latency_s": percentiles(latencies),
+        "loop_blocked_s": round(monitor.blocked_s, 4),
+        "loop_max_lag_s": round(monitor.max_lag_s, 4),
+        "peak_traced_mb": round(peak_bytes / 1e6, 2) if peak_bytes is not None else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2)
+    }
+    if first_updates:
+        stats["first_update_s"] = percentiles(first_updates)
+    return stats
+
+
+async def _run_debate(name: str) -> dict:
+    await run_vc_debate(name)
+    return {}
+
+
+async def _run_gradio(name: str) -> dict:
+    from ..app import analyze_startup
+
+    t0 = time.perf_counter()
+    timing = {}
+    async for _ in analyze_startup(name, {}, progress=lambda *args, **kwargs: None):
+        timing.setdefault("first_update_s", time.perf_counter() - t0)
+    return timing
+
+
+async def run_benchmark(
+    debates: int = 32,
+    concurrency_levels: tuple[int, ...] = (1, 4, 16),
+    model_latency: Optional[LatencyProfile] = None,
+    search_latency: Optional[LatencyProfile] = None,
+    searches_per_agent: int = 2,
+    use_cache: bool = False,
+    trace_memory: bool = False,
+    seed: int = 0
+) -> dict:
+    model_latency = model_latency or LatencyProfile(0.4, 0.4)
+    search_latency = search_latency or LatencyProfile(0.15, 0.3)
+
+    with StubModelServer(model_latency, seed, searches_per_agent) as model_server, \
+            StubSearchServer(search_latency, seed) as search_server:
+        os.environ.setdefault("SERPER_API_KEY", "stub")
+        tools.SERPER_URL = f"{search_server.url}/search"
+        set_default_openai_client(
+            AsyncOpenAI(base_url=f"{model_server.url}/v1", api_key="stub"), use_for_tracing=False
+        )
+        set_default_openai_api("chat_completions")
+        set_tracing_disabled(True)
+        # Every debate must run the agents, not come back from the decision archive
+        set_decision_archive(None)
+
+        results = {}
+        for target, run_one in (("run_vc_debate", _run_debate), ("analyze_startup", _run_gradio)):
+            results[target] = {}
+            for concurrency in concurrency_levels:
+                # Fresh cache per level so levels don't warm each other up
+                set_search_cache(SearchCache(path=None) if use_cache else None)
+                names = [f"Startup {target[:3]}-{concurrency}-{i:04d}" for i in range(debates)]
+                results[target][f"c{concurrency}"] = await _drive(names, concurrency, run_one, trace_memory)
+
+        await tools.close_search_client()
+        results["requests"] = {"model": model_server.requests, "search": search_server.requests}
+
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print p50/p95/throughput deltas against a previous results file."""
+    print(f"\nvs {baseline['meta']['revision']} ({baseline['meta']['timestamp']})")
+    for target in ("run_vc_debate", "analyze_startup"):
+        for level, stats in current["results"].get(target, {}).items():
+            old = baseline["results"].get(target, {}).get(level)
+            if not old:
+                continue
+            for label, new_value, old_value in (
+                ("p50", stats["latency_s"]["p50"], old["latency_s"]["p50"]),
+                ("p95", stats["latency_s"]["p95"], old["latency_s"]["p95"]),
+                ("throughput", stats["throughput_per_s"], old["throughput_per_s"])
+            ):
+                change = (new_value - old_value) / old_value if old_value else 0.0
+                print(f"  {target:<16}{level:<6}{label:<12}{old_value:>10.3f} -> {new_value:>10.3f} ({change:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline VC debate benchmark")
+    parser.add_argument("--debates", type=int, default=32, help="Debates per concurrency level")
+    parser.add_argument("--concurrency", type=str, default="1,4,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--model-latency-ms", type=float, default=400, help="Median stand-in model latency")
+    parser.add_argument("--search-latency-ms", type=float, default=150, help="Median stand-in search latency")
+    parser.add_argument("--sigma", type=float, default=0.4, help="Log-normal latency spread (0 = constant)")
+    parser.add_argument("--searches-per-agent", type=int, default=2)
+    parser.add_argument("--cache", action="store_true", help="Enable the in-memory search cache")
+    parser.add_argument("--trace-memory", action="store_true", help="Measure Python heap peak (slower)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, help="Results JSON (default: benchmarks/results/debate-<rev>.json)")
+    parser.add_argument("--compare", type=str, help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    params = {
+        "debates": args.debates,
+        "concurrency_levels": [int(c) for c in args.concurrency.split(",")],
+        "model_latency_ms": args.model_latency_ms,
+        "search_latency_ms": args.search_latency_ms,
+        "sigma": args.sigma,
+        "searches_per_agent": args.searches_per_agent,
+        "cache": args.cache,
+        "trace_memory": args.trace_memory,
+        "seed": args.seed
+    }
+    results = asyncio.run(run_benchmark(
+        debates=args.debates,
+        concurrency_levels=tuple(params["concurrency_levels"]),
+        model_latency=LatencyProfile(args.model_latency_ms / 1000, args.sigma),
+        search_latency=LatencyProfile(args.search_latency_ms / 1000, args.sigma),
+        searches_per_agent=args.searches_per_agent,
+        use_cache=args.cache,
+        trace_memory=args.trace_memory,
+        seed=args.seed
+    ))
+
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "params": params
+        },
+        "results": results
+    }
+
+    for target in ("run_vc_debate", "analyze_startup"):
+        print(f"\n{target}")
+        print(f"  {'level':<6}{'p50':>8}{'p95':>8}{'p99':>8}{'tput/s':>9}{'blocked':>9}{'RSS MB':>9}")
+        for level, stats in results[target].items():
+            latency = stats["latency_s"]
+            print(
+                f"  {level:<6}{latency['p50']:>8.3f}{latency['p95']:>8.3f}{latency['p99']:>8.3f}"
+                f"{stats['throughput_per_s']:>9.2f}{stats['loop_blocked_s']:>9.3f}{stats['peak_rss_mb']:>9.1f}"
+            )
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"debate-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from ..models import BullCase, BearCase, FinalDecision, InvestmentDecision, RiskMitigation
+
+
+# Fixed, realistic-length cases so benchmark numbers are comparable between commits
+BULL_CASES = [
+    BullCase(
+        startup_name="Acme Robotics",
+        one_liner="Autonomous picking robots for mid-size e-commerce warehouses.",
+        market_opportunity="Warehouse automation TAM of ~$41B by 2027 growing 14% CAGR; mid-size "
+                           "3PLs (SAM ~$6B) are underserved by enterprise vendors.",
+        competitive_moat="Proprietary grasping dataset of 120M picks and a hardware-agnostic "
+                         "control stack that retrofits existing shelving in under a week.",
+        growth_catalysts=[
+            "Labor shortages pushing warehouse wages up 8% YoY",
+            "Robots-as-a-service pricing lowers upfront cost for 3PLs",
+            "Expansion into cold-chain and grocery fulfilment",
+        ],
+        traction_highlights=[
+            "$18M ARR, up 3.2x YoY",
+            "64 live sites across US and EU",
+            "Net revenue retention of 148%",
+        ],
+        team_strengths=[
+            "CEO previously scaled Kiva Systems field operations",
+            "CTO led manipulation research at a top robotics lab",
+        ],
+        comparable_exits=[
+            "Kiva Systems acquired by Amazon for $775M",
+            "6 River Systems acquired by Shopify for $450M",
+        ],
+        confidence_score=8,
+        investment_thesis_summary="Acme sells a proven, fast-to-deploy picking robot into a large, "
+                                  "labor-constrained market with strong retention and a data moat.",
+    ),
+    BullCase(
+        startup_name="Lumen Health",
+        one_liner="AI scribe and coding assistant for outpatient clinics.",
+        market_opportunity="US ambulatory documentation spend exceeds $20B; 1M+ physicians spend "
+                           "two hours a day on notes.",
+        competitive_moat="EHR integrations with 9 vendors and a coding model tuned on 40M claims.",
+        growth_catalysts=[
+            "Physician burnout driving adoption of ambient documentation",
+            "Payer pressure on coding accuracy",
+            "Channel partnership with a top-3 EHR vendor",
+        ],
+        traction_highlights=["4,200 paying clinicians", "$9M ARR", "Gross margin 78%"],
+        team_strengths=["Founders from Epic and Google Health", "Chief Medical Officer is a practising GP"],
+        comparable_exits=["Nuance acquired by Microsoft for $19.7B"],
+        confidence_score=7,
+        investment_thesis_summary="Lumen rides the ambient-scribe wave with deep EHR integration "
+                                  "and a coding wedge that incumbents lack.",
+    ),
+    BullCase(
+        startup_name="Gridline",
+        one_liner="Software that schedules EV fleet charging against real-time grid prices.",
+        market_opportunity="Commercial EV fleets will draw 60 TWh/yr by 2030; charging is the "
+                           "second-largest fleet operating cost.",
+        competitive_moat="Utility demand-response certifications in 14 US markets.",
+        growth_catalysts=[
+            "Fleet electrification mandates in California and the EU",
+            "Utility demand-response payments",
+            "Bundling with charger hardware OEMs",
+        ],
+        traction_highlights=["11,000 vehicles under management", "$4.5M ARR"],
+        team_strengths=["Ex-Tesla energy software leads"],
+        comparable_exits=["EnerNOC acquired by Enel for $250M"],
+        confidence_score=6,
+        investment_thesis_summary="Gridline turns a cost centre into a revenue line for fleets "
+                                  "and has regulatory certifications that take years to replicate.",
+    ),
+]
+
+BEAR_CASES = [
+    BearCase(
+        startup_name="Acme Robotics",
+        market_risks=[
+            "Mid-size 3PL budgets are cyclical and tied to e-commerce volumes",
+            "Amazon and Ocado may sell their in-house robots to third parties",
+        ],
+        execution_risks=[
+            "Field service costs grow linearly with site count",
+            "Hardware supply chain concentrated in a single contract manufacturer",
+        ],
+        competitive_threats=["Locus Robotics", "Berkshire Grey", "Covariant"],
+        financial_concerns=["Burn of $3.1M/month with 16 months of runway", "RaaS contracts defer revenue"],
+        regulatory_risks=None,
+        technology_risks=["Grasp success drops below 95% on deformable packaging"],
+        key_weaknesses=[
+            "Gross margin of 38% is low for a software-valued company",
+            "Top 3 customers are 41% of ARR",
+            "No presence in Asia",
+        ],
+        kill_scenario="A recession cuts 3PL capex while a better-funded competitor prices "
+                      "aggressively, stalling Acme's next raise.",
+        risk_severity_score=6,
+    ),
+    BearCase(
+        startup_name="Lumen Health",
+        market_risks=[
+            "EHR vendors are shipping native ambient scribes",
+            "Clinic purchasing cycles run 9-12 months",
+        ],
+        execution_risks=["Accuracy regressions create malpractice exposure", "Sales team of 6 is thin"],
+        competitive_threats=["Abridge", "Nuance DAX", "Suki"],
+        financial_concerns=["Inference costs are 22% of revenue"],
+        regulatory_risks=["HIPAA and state privacy laws on audio recording", "FDA scrutiny of coding suggestions"],
+        technology_risks=[],
+        key_weaknesses=["Dependence on one EHR channel partner", "Commodity speech models", "Small data moat"],
+        kill_scenario="The channel partner launches a bundled scribe at zero marginal cost.",
+        risk_severity_score=7,
+    ),
+    BearCase(
+        startup_name="Gridline",
+        market_risks=["Fleet electrification timelines keep slipping", "Utility tariffs vary by market"],
+        execution_risks=["Each new utility market needs months of certification", "Small engineering team"],
+        competitive_threats=["ChargePoint", "Charger OEM in-house software"],
+        financial_concerns=["Revenue concentration in California", "Demand-response payments are volatile"],
+        regulatory_risks=["Tariff redesigns can erase arbitrage margins"],
+        technology_risks=None,
+        key_weaknesses=["Low switching costs", "Small ARR base", "Hardware-partner dependence"],
+        kill_scenario="Charger OEMs bundle free scheduling software and Gridline's wedge disappears.",
+        risk_severity_score=6,
+    ),
+]
+
+FINAL_DECISIONS = [
+    FinalDecision(
+        startup_name="Acme Robotics",
+        decision=InvestmentDecision.INVEST,
+        investment_thesis="Strong retention and a data moat outweigh margin and concentration risk.",
+        unresolved_risks=[],
+        risk_mitigations=[
+            RiskMitigation(risk="Low gross margin", mitigation="Second contract manufacturer in 2025"),
+            RiskMitigation(risk="Customer concentration", mitigation="Pipeline of 30 new 3PL logos"),
+        ],
+        bull_case_weight=65,
+        bear_case_weight=35,
+        recommended_check_size="$8M Series B participation",
+        key_due_diligence=["Site-level unit economics", "Service cost per robot"],
+    ),
+    FinalDecision(
+        startup_name="Lumen Health",
+        decision=InvestmentDecision.FOLLOW_UP,
+        investment_thesis="Promising traction but channel dependence needs clarity.",
+        unresolved_risks=["Channel partner may launch a native scribe"],
+        bull_case_weight=50,
+        bear_case_weight=50,
+        follow_up_questions=["What are the exclusivity terms with the EHR partner?"],
+    ),
+    FinalDecision(
+        startup_name="Gridline",
+        decision=InvestmentDecision.PASS,
+        investment_thesis="Wedge is too easy for hardware OEMs to bundle away.",
+        unresolved_risks=["OEM bundling", "Tariff redesign risk"],
+        bull_case_weight=35,
+        bear_case_weight=65,
+    ),
+]
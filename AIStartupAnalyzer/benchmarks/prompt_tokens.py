@@ -0,0 +1,59 @@
+"""
+Token-count report for the committee prompt formats.
+
+    python -m AIStartupAnalyzer.benchmarks.prompt_tokens
+
+Uses tiktoken (o200k_base, the gpt-4o-mini tokenizer) when it is installed and its
+encoding can be loaded, otherwise a ~4 characters/token estimate.
+"""
+import json
+
+from ..orchestrator import build_committee_input, case_section
+from ..serializers import PROMPT_FORMATS
+from .fixtures import BULL_CASES, BEAR_CASES
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")
+except Exception:
+    # Not installed, or the encoding file can't be downloaded (offline)
+    _encoding = None
+
+TOKENIZER = "tiktoken/o200k_base" if _encoding else "estimate (chars/4)"
+
+
+def count_tokens(text: str) -> int:
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return max(1, len(text) // 4)
+
+
+def prompt_token_report() -> dict:
+    """Committee prompt tokens per format, summed over the fixture cases."""
+    report = {}
+    for prompt_format in PROMPT_FORMATS:
+        tokens = sum(
+            count_tokens(build_committee_input(
+                bull.startup_name,
+                case_section("bull", bull, prompt_format),
+                case_section("bear", bear, prompt_format)
+            ))
+            for bull, bear in zip(BULL_CASES, BEAR_CASES)
+        )
+        report[prompt_format] = tokens
+    return report
+
+
+def main():
+    report = prompt_token_report()
+    baseline = report["pretty"]
+
+    print(f"Committee prompt tokens over {len(BULL_CASES)} fixture debates ({TOKENIZER})")
+    print(f"{'format':<10}{'tokens':>10}{'vs pretty':>12}")
+    for prompt_format, tokens in report.items():
+        print(f"{prompt_format:<10}{tokens:>10}{(tokens - baseline) / baseline:>+12.1%}")
+    print(json.dumps({"tokenizer": TOKENIZER, "tokens": report}))
+
+
+if __name__ == "__main__":
+    main()
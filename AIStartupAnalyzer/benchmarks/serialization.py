@@ -0,0 +1,129 @@
+"""
+Dump/load throughput for stored debate records.
+
+    python -m AIStartupAnalyzer.benchmarks.serialization --records 100000
+
+Compares the per-record json + model_dump / model_validate path the batch writer
+and report loader used before records.py with validating straight from bytes,
+the cached list adapter (one call for the whole list) and msgpack (skipped
+when msgpack is not installed). Loads are timed with the garbage collector on,
+as before, and paused, as records.load_records runs them. Everything runs in
+memory, so the numbers are serialization cost only.
+"""
+import argparse
+import gc
+import io
+import json
+import time
+from typing import Callable
+
+from ..models import BullCase, BearCase, FinalDecision
+from ..records import RECORDS, DebateRecord, encode_record, gc_paused, msgpack
+from .fixtures import BULL_CASES, BEAR_CASES, FINAL_DECISIONS
+
+
+def make_records(count: int) -> list[DebateRecord]:
+    n = len(FINAL_DECISIONS)
+    return [
+        DebateRecord(
+            startup_name=f"{FINAL_DECISIONS[i % n].startup_name} {i}",
+            final_decision=FINAL_DECISIONS[i % n],
+            bull_case=BULL_CASES[i % n],
+            bear_case=BEAR_CASES[i % n],
+            elapsed_s=1.5
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy_dump(record: DebateRecord) -> bytes:
+    return (json.dumps({
+        "startup_name": record.startup_name,
+        "final_decision": record.final_decision.model_dump(mode="json"),
+        "bull_case": record.bull_case.model_dump(mode="json"),
+        "bear_case": record.bear_case.model_dump(mode="json"),
+        "elapsed_s": record.elapsed_s
+    }) + "\n").encode()
+
+
+def _legacy_load(line: bytes) -> dict:
+    record = json.loads(line)
+    record["final_decision"] = FinalDecision.model_validate(record["final_decision"])
+    record["bull_case"] = BullCase.model_validate(record["bull_case"])
+    record["bear_case"] = BearCase.model_validate(record["bear_case"])
+    return record
+
+
+def _timed(fn: Callable[[], object], paused: bool = False) -> tuple[float, object]:
+    gc.collect()
+    started = time.perf_counter()
+    if paused:
+        with gc_paused():
+            result = fn()
+    else:
+        result = fn()
+    return time.perf_counter() - started, result
+
+
+def run_benchmark(count: int = 100_000) -> dict:
+    records = make_records(count)
+    results = {}
+
+    def report(name: str, elapsed: float, size: int) -> None:
+        results[name] = {
+            "seconds": round(elapsed, 3),
+            "records_per_s": round(count / elapsed),
+            "bytes_per_record": round(size / count)
+        }
+
+    # DUMP
+    elapsed, legacy_lines = _timed(lambda: [_legacy_dump(r) for r in records])
+    report("dump: json.dumps(model_dump)", elapsed, sum(map(len, legacy_lines)))
+
+    elapsed, lines = _timed(lambda: [encode_record(r) for r in records])
+    report("dump: model_dump_json", elapsed, sum(map(len, lines)))
+
+    elapsed, array = _timed(lambda: RECORDS.dump_json(records, exclude_none=True))
+    report("dump: list adapter", elapsed, len(array))
+
+    packed = None
+    if msgpack is not None:
+        elapsed, packed = _timed(lambda: b"".join(encode_record(r, "msgpack") for r in records))
+        report("dump: msgpack", elapsed, len(packed))
+
+    # LOAD
+    loads = [
+        ("json.loads + model_validate", lambda: [_legacy_load(line) for line in legacy_lines], sum(map(len, legacy_lines))),
+        ("model_validate_json(bytes)", lambda: [DebateRecord.model_validate_json(line) for line in lines], sum(map(len, lines))),
+        ("list adapter", lambda: RECORDS.validate_json(array), len(array)),
+    ]
+    if packed is not None:
+        loads.append((
+            "msgpack + list adapter",
+            lambda: RECORDS.validate_python(list(msgpack.Unpacker(io.BytesIO(packed), raw=False))),
+            len(packed)
+        ))
+    for paused in (False, True):
+        for name, load, size in loads:
+            elapsed, loaded = _timed(load, paused)
+            del loaded
+            report(f"load: {name}{' (gc paused)' if paused else ''}", elapsed, size)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Debate record dump/load throughput")
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.records)
+    print(f"{args.records} records{'' if msgpack is not None else ' (msgpack not installed - skipped)'}")
+    print(f"{'path':<48}{'seconds':>9}{'records/s':>12}{'bytes/rec':>11}")
+    for name, row in results.items():
+        print(f"{name:<48}{row['seconds']:>9.3f}{row['records_per_s']:>12,}{row['bytes_per_record']:>11}")
+    print(json.dumps({"records": args.records, "results": results}))
+
+
+if __name__ == "__main__":
+    main()
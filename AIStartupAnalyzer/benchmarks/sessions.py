@@ -0,0 +1,130 @@
+"""
+Load test for the Gradio app: N concurrent browser sessions, each checked for isolation.
+
+    python -m AIStartupAnalyzer.benchmarks.sessions --sessions 16 --ui-concurrency 4
+    python -m AIStartupAnalyzer.benchmarks.sessions --url http://127.0.0.1:7860 --sessions 8
+
+Without --url the app is launched in-process against the local stand-in model and
+search servers (see stubs.py). Each session runs its own startup through the queue,
+then opens the bull and bear cases and checks they belong to that startup and not
+to another session. Needs gradio_client (installed with gradio).
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from gradio_client import Client
+from openai import AsyncOpenAI
+from agents import set_default_openai_api, set_default_openai_client, set_tracing_disabled
+
+from .. import tools
+from ..archive import set_decision_archive
+from ..app import create_app
+from .debate import percentiles
+from .stubs import LatencyProfile, StubModelServer, StubSearchServer
+
+
+def run_session(url: str, startup_name: str) -> dict:
+    """One browser session: analyze, then toggle both cases and check they are ours."""
+    client = Client(url, verbose=False)
+    t0 = time.perf_counter()
+    status, verdict, *_ = client.predict(startup_name, api_name="/analyze_startup")
+    latency = time.perf_counter() - t0
+
+    # The toggles' inputs are both gr.State, which gradio_client fills in per session
+    _, bull_markdown = client.predict(api_name="/toggle_bull_case")
+    _, bear_markdown = client.predict(api_name="/toggle_bear_case")
+    problems = []
+    if not status.startswith("✅"):
+        problems.append(f"analysis did not finish: {status!r}")
+    if f"BULL CASE: {startup_name}\n" not in bull_markdown:
+        problems.append("bull case belongs to another session")
+    if f"BEAR CASE: {startup_name}\n" not in bear_markdown:
+        problems.append("bear case belongs to another session")
+    return {"startup": startup_name, "latency_s": latency, "verdict": verdict, "problems": problems}
+
+
+def run_load_test(url: str, sessions: int) -> dict:
+    names = [f"Session Startup {i:03d}" for i in range(sessions)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        outcomes = list(pool.map(lambda name: _safe_session(url, name), names))
+    elapsed = time.perf_counter() - started
+
+    failed = [o for o in outcomes if o["problems"]]
+    return {
+        "sessions": sessions,
+        "elapsed_s": round(elapsed, 4),
+        "latency_s": percentiles([o["latency_s"] for o in outcomes if "latency_s" in o]),
+        "isolated": not failed,
+        "failures": {o["startup"]: o["problems"] for o in failed}
+    }
+
+
+def _safe_session(url: str, startup_name: str) -> dict:
+    try:
+        return run_session(url, startup_name)
+    except Exception as e:
+        return {"startup": startup_name, "problems": [f"{type(e).__name__}: {e}"]}
+
+
+def _launch_offline(ui_concurrency: int, model_latency: LatencyProfile, search_latency: LatencyProfile, seed: int):
+    """Stand-in servers plus an in-process app; returns (url, closers)."""
+    model_server = StubModelServer(model_latency, seed).start()
+    search_server = StubSearchServer(search_latency, seed).start()
+    os.environ.setdefault("SERPER_API_KEY", "stub")
+    tools.SERPER_URL = f"{search_server.url}/search"
+    set_default_openai_client(
+        AsyncOpenAI(base_url=f"{model_server.url}/v1", api_key="stub"), use_for_tracing=False
+    )
+    set_default_openai_api("chat_completions")
+    set_tracing_disabled(True)
+    # Repeat load tests use the same names; they must not be answered from the archive
+    set_decision_archive(None)
+
+    app = create_app(ui_concurrency)
+    _, url, _ = app.launch(prevent_thread_lock=True, quiet=True)
+    return url, (app.close, model_server.stop, search_server.stop)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Gradio app")
+    parser.add_argument("--sessions", type=int, default=16, help="Concurrent browser sessions")
+    parser.add_argument("--url", type=str, help="Running app to test (default: launch one offline)")
+    parser.add_argument("--ui-concurrency", type=int, default=4, help="Queue concurrency for the offline app")
+    parser.add_argument("--model-latency-ms", type=float, default=400, help="Median stand-in model latency")
+    parser.add_argument("--search-latency-ms", type=float, default=150, help="Median stand-in search latency")
+    parser.add_argument("--sigma", type=float, default=0.4, help="Log-normal latency spread (0 = constant)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    url: Optional[str] = args.url
+    closers = ()
+    if url is None:
+        url, closers = _launch_offline(
+            args.ui_concurrency,
+            LatencyProfile(args.model_latency_ms / 1000, args.sigma),
+            LatencyProfile(args.search_latency_ms / 1000, args.sigma),
+            args.seed
+        )
+    try:
+        report = run_load_test(url, args.sessions)
+    finally:
+        for close in closers:
+            close()
+
+    latency = report["latency_s"]
+    print(f"{report['sessions']} sessions against {url} in {report['elapsed_s']:.2f}s")
+    print(f"  latency p50 {latency['p50']:.3f}s  p95 {latency['p95']:.3f}s  p99 {latency['p99']:.3f}s")
+    if report["isolated"]:
+        print("  all sessions saw only their own results")
+    else:
+        for startup, problems in report["failures"].items():
+            print(f"  FAIL {startup}: {'; '.join(problems)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
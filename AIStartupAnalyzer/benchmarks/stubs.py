@@ -0,0 +1,235 @@
+"""
+Local stand-ins for the OpenAI Chat Completions API and the Serper search API.
+
+Both run on a background thread, answer deterministically from the fixtures and
+sleep for a latency drawn from a seeded log-normal distribution.
+"""
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .fixtures import BULL_CASES, BEAR_CASES, FINAL_DECISIONS
+
+
+@dataclass
+class LatencyProfile:
+    """Log-normal latency: `median_s` seconds, spread controlled by `sigma` (0 = constant)."""
+    median_s: float = 0.5
+    sigma: float = 0.4
+
+    def sample(self, rng: random.Random) -> float:
+        return self.median_s * math.exp(rng.gauss(0, self.sigma)) if self.sigma else self.median_s
+
+
+class StubServer:
+    """Threaded JSON-over-HTTP server; subclasses implement `respond(path, body)`."""
+
+    def __init__(self, latency: Optional[LatencyProfile] = None, seed: int = 0):
+        self.latency = latency or LatencyProfile()
+        self.requests = 0
+        # Pause between streamed chunks (stream=True requests only)
+        self.chunk_delay_s = 0.0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, path: str, body: dict) -> dict:
+        raise NotImplementedError
+
+    def stream_chunks(self, response: dict):
+        """Streamed form of `respond`'s result, for requests with stream=True."""
+        raise NotImplementedError
+
+    def start(self) -> "StubServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with stub._lock:
+                    stub.requests += 1
+                    delay = stub.latency.sample(stub._rng)
+                time.sleep(delay)
+
+                response = stub.respond(self.path, body)
+                if body.get("stream"):
+                    self._send_stream(stub.stream_chunks(response))
+                    return
+
+                payload = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _send_stream(self, chunks):
+                # Server-sent events over chunked transfer encoding, like the real API
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for chunk in chunks:
+                    data = f"data: {json.dumps(chunk) if isinstance(chunk, dict) else chunk}\n\n".encode()
+                    self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                    self.wfile.flush()
+                    if stub.chunk_delay_s:
+                        time.sleep(stub.chunk_delay_s)
+                self.wfile.write(b"0\r\n\r\n")
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def _pick(fixtures: list, startup_name: str):
+    """Same startup name -> same fixture, renamed to that startup."""
+    fixture = fixtures[zlib.crc32(startup_name.encode()) % len(fixtures)]
+    return fixture.model_copy(update={"startup_name": startup_name})
+
+
+def _text(content) -> str:
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+class StubModelServer(StubServer):
+    """
+    Minimal /chat/completions endpoint that plays every debate agent.
+
+    - Optimist/Skeptic: first turn calls `search_startup_info` `searches_per_agent`
+      times in parallel, second turn returns the fixture BullCase/BearCase
+    - Committee: returns the fixture FinalDecision
+    - stream=True requests get the same answer as server-sent chunk events
+    """
+
+    def __init__(self, latency: Optional[LatencyProfile] = None, seed: int = 0, searches_per_agent: int = 2):
+        super().__init__(latency, seed)
+        self.searches_per_agent = searches_per_agent
+
+    def respond(self, path: str, body: dict) -> dict:
+        messages = body.get("messages", [])
+        system = _text(messages[0].get("content")) if messages and messages[0]["role"] == "system" else ""
+        user = next((_text(m.get("content")) for m in messages if m["role"] == "user"), "")
+        searches_done = sum(1 for m in messages if m["role"] == "tool")
+
+        if '"The Bull"' in system or '"The Bear"' in system:
+            match = re.search(r"Analyze startup: (.+?)\. Build", user)
+            startup_name = match.group(1) if match else "Unknown"
+            if searches_done < self.searches_per_agent:
+                angles = ["funding", "competitors", "news", "team", "market size"]
+                return self._completion(body, messages, tool_calls=[
+                    {
+                        "id": f"call_{uuid.uuid4().hex[:12]}",
+                        "type": "function",
+                        "function": {
+                            "name": "search_startup_info",
+                            "arguments": json.dumps({
+                                "query": f"{startup_name} {angles[i % len(angles)]}",
+                                "num_results": 8
+                            })
+                        }
+                    }
+                    for i in range(self.searches_per_agent)
+                ])
+            fixtures = BULL_CASES if '"The Bull"' in system else BEAR_CASES
+            return self._completion(body, messages, content=_pick(fixtures, startup_name).model_dump_json())
+
+        match = re.search(r"# Startup: (.+)", user)
+        startup_name = match.group(1).strip() if match else "Unknown"
+        if "DecisionPatch" in system:
+            decision = _pick(FINAL_DECISIONS, startup_name)
+            patch = decision.model_dump(mode="json", include={"decision", "unresolved_risks", "risk_mitigations"})
+            return self._completion(body, messages, content=json.dumps(patch))
+        return self._completion(body, messages, content=_pick(FINAL_DECISIONS, startup_name).model_dump_json())
+
+    def stream_chunks(self, response: dict, chunk_chars: int = 48):
+        """A chat.completion as chat.completion.chunk events: content in `chunk_chars` pieces, then usage."""
+        message = response["choices"][0]["message"]
+        base = {k: response[k] for k in ("id", "created", "model")}
+        base["object"] = "chat.completion.chunk"
+
+        def chunk(delta: dict, finish_reason: Optional[str] = None) -> dict:
+            return {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+
+        yield chunk({"role": "assistant", "content": ""})
+        content = message.get("content") or ""
+        for start in range(0, len(content), chunk_chars):
+            yield chunk({"content": content[start:start + chunk_chars]})
+        for i, call in enumerate(message.get("tool_calls") or []):
+            yield chunk({"tool_calls": [{"index": i, **call}]})
+        yield chunk({}, response["choices"][0]["finish_reason"])
+        yield {**base, "choices": [], "usage": response["usage"]}
+        yield "[DONE]"
+
+    def _completion(self, body: dict, messages: list, content: Optional[str] = None, tool_calls=None) -> dict:
+        prompt_tokens = sum(len(json.dumps(m)) for m in messages) // 4
+        completion_tokens = len(content or json.dumps(tool_calls)) // 4
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+
+class StubSearchServer(StubServer):
+    """Serper-shaped /search endpoint with deterministic organic results."""
+
+    def respond(self, path: str, body: dict) -> dict:
+        query = body.get("q", "")
+        return {
+            "organic": [
+                {
+                    "title": f"{query} - result {i}",
+                    "link": f"https://example.com/{zlib.crc32(query.encode())}/{i}",
+                    "snippet": f"Deterministic snippet {i} about {query}.",
+                    "date": "2025-01-01"
+                }
+                for i in range(1, body.get("num", 8) + 1)
+            ]
+        }
@@ -0,0 +1,294 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".cache" / "search_cache.sqlite"
+
+
+def normalize_query(query: str) -> str:
+    """
+    Lowercase, drop punctuation and collapse whitespace so near-identical queries
+    share a key. `#` and `+` are kept so "C#" and "C++" don't collapse into "C".
+    """
+    query = re.sub(r"[^\w\s$%.#+-]", " ", query.lower())
+    return " ".join(query.split())
+
+
+def cache_key(query: str, num_results: int) -> str:
+    return hashlib.sha256(f"{num_results}|{normalize_query(query)}".encode()).hexdigest()
+
+
+class SearchCache:
+    """
+    Two-tier cache for search results.
+
+    - In-memory LRU for hot keys
+    - SQLite file so results survive restarts
+    - Per-entry TTL and size-bounded eviction on both tiers
+    - Concurrent misses for the same key share one fetch
+    - The async path (aget/aset/get_or_fetch) answers memory hits on the event
+      loop and runs SQLite reads and writes in a worker thread
+    """
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = DEFAULT_CACHE_PATH,
+        ttl: float = 24 * 3600,
+        max_memory_entries: int = 512,
+        max_disk_entries: int = 20_000
+    ):
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        # Separate lock so a slow disk write never holds up memory hits
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        # Rows in SQLite, counted once at open and kept up to date by every write and
+        # delete, so a write only evicts when it adds a row past max_disk_entries
+        self._disk_entries = 0
+
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache(accessed_at)"
+            )
+            self._db.commit()
+            (self._disk_entries,) = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory)
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a live entry, promoting disk hits into memory. Expired entries are dropped."""
+        now = time.time()
+        value = self._get_memory(key, now)
+        if value is None:
+            value = self._get_disk(key, now)
+        return self._counted(value)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() for the event loop: memory hits return immediately, disk lookups run in a thread."""
+        return self._counted(await self._lookup(key))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._remember(key, expires_at, value)
+        self._put_disk(key, value, expires_at, now)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """set() for the event loop: memory is updated at once, the SQLite write runs in a thread."""
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        self._remember(key, expires_at, value)
+        if self._db is not None:
+            await asyncio.to_thread(self._put_disk, key, value, expires_at, now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_cache")
+                self._db.commit()
+                self._disk_entries = 0
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    async def get_or_fetch(
+        self,
+        query: str,
+        num_results: int,
+        fetch: Callable[[str, int], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """Return the cached value or run `fetch` once, sharing it with concurrent callers."""
+        key = cache_key(query, num_results)
+
+        while True:
+            cached = await self._lookup(key)
+            if cached is not None:
+                return self._counted(cached)
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._counted(None)
+                break
+
+            # A waiter on someone else's fetch is counted as coalesced, not as a miss
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The caller that owned the fetch was cancelled, not us - take over
+                if pending.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch(query, num_results)
+            await self.aset(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a fetch nobody else waited on doesn't log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        now = time.time()
+        value = self._get_memory(key, now)
+        if value is None and self._db is not None:
+            value = await asyncio.to_thread(self._get_disk, key, now)
+        return value
+
+    def _counted(self, value: Optional[Any]) -> Optional[Any]:
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _get_memory(self, key: str, now: float) -> Optional[Any]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                return value
+            del self._memory[key]
+            return None
+
+    def _get_disk(self, key: str, now: float) -> Optional[Any]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._db.commit()
+                self._disk_entries -= 1
+                return None
+            self._db.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+        value = json.loads(row[0])
+        self._remember(key, row[1], value)
+        return value
+
+    def _put_disk(self, key: str, value: Any, expires_at: float, now: float) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            exists = self._db.execute("SELECT 1 FROM search_cache WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, now)
+            )
+            if exists is None:
+                self._disk_entries += 1
+                if self._disk_entries > self.max_disk_entries:
+                    self._evict_disk(now)
+            self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                self.evictions += 1
+
+    def _evict_disk(self, now: float) -> None:
+        # Called with _db_lock held once an insert takes the table past its bound
+        self._disk_entries -= self._db.execute(
+            "DELETE FROM search_cache WHERE expires_at <= ?", (now,)
+        ).rowcount
+        overflow = self._disk_entries - self.max_disk_entries
+        if overflow > 0:
+            self._db.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            self._disk_entries -= overflow
+            with self._lock:
+                self.evictions += overflow
+
+
+# DEFAULT CACHE
+_UNSET = object()
+_default_cache: Any = _UNSET
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Return the process-wide cache (None when disabled via SEARCH_CACHE_DISABLED=1)."""
+    global _default_cache
+
+    if _default_cache is _UNSET:
+        if os.environ.get("SEARCH_CACHE_DISABLED") == "1":
+            _default_cache = None
+        else:
+            _default_cache = SearchCache(
+                path=os.environ.get("SEARCH_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl=float(os.environ.get("SEARCH_CACHE_TTL", 24 * 3600))
+            )
+
+    return _default_cache
+
+
+def set_search_cache(cache: Optional[SearchCache]) -> None:
+    """Swap the process-wide cache; pass None to disable caching."""
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,48 @@
+import asyncio
+import contextvars
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .instrumentation import Tracer, default_tracer, no_span
+
+
+# Name of the agent whose run the current task belongs to (set by orchestrator.run_agent)
+current_agent: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_agent", default=None)
+
+
+@dataclass
+class DebateContext:
+    """Per-debate state handed to agents and tools through the Agents SDK run context."""
+    # Bounds concurrent model calls (taken per call by orchestrator.SlottedModel)
+    llm_semaphore: Optional[asyncio.Semaphore] = None
+    search_semaphore: Optional[asyncio.Semaphore] = None
+    tracer: Optional[Tracer] = field(default_factory=default_tracer)
+
+    # Guardrail repair counters (see orchestrator.run_committee); the savings are an
+    # estimate that prices a committee re-run at the first run's token usage
+    local_repairs: int = 0
+    llm_repairs: int = 0
+    tokens_saved_estimate: int = 0
+
+    # Model calls made by all agent runs on this context (see orchestrator.run_agent)
+    llm_calls: int = 0
+
+    # Searches each agent ran, by agent name: [query, num_results, fingerprint of the output it read]
+    evidence: dict[str, list] = field(default_factory=dict)
+
+    def search_slot(self):
+        """Bound concurrent search tool calls."""
+        return self.search_semaphore or nullcontext()
+
+    def record_search(self, query: str, num_results: int, fingerprint: str) -> None:
+        """Note a search result the current agent saw (ignored outside an agent run)."""
+        agent = current_agent.get()
+        if agent is not None:
+            self.evidence.setdefault(agent, []).append([query, num_results, fingerprint])
+
+    def span(self, name: str, stage: str, **attributes):
+        """Timed span on the context's tracer; a no-op when tracing is off."""
+        if self.tracer is None:
+            return no_span()
+        return self.tracer.span(name, stage, **attributes)
@@ -0,0 +1,288 @@
+import atexit
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+from agents import RunHooks
+
+
+# SPANS
+@dataclass
+class Span:
+    """One timed stage of a debate: an agent run, an LLM turn, a search, the committee, validation."""
+    name: str
+    stage: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = 0.0
+    duration_s: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def add(self, key: str, amount: int = 1) -> None:
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+
+# The open span in the current task - asyncio copies it into child tasks, so parents link up
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Creates spans and hands finished ones to its exporters."""
+
+    def __init__(self, exporters: Optional[list["SpanExporter"]] = None):
+        self.exporters = list(exporters or [])
+
+    def start_span(self, name: str, stage: str, **attributes) -> Span:
+        """Open a span under the current one without making it current (for callback-style hooks)."""
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            stage=stage,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time(),
+            attributes=dict(attributes)
+        )
+
+    def end_span(self, span: Span) -> None:
+        span.duration_s = time.time() - span.start_time
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, stage: str, **attributes):
+        span = self.start_span(name, stage, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+@contextmanager
+def no_span(*args, **kwargs):
+    """Stand-in for Tracer.span when tracing is off - yields a throwaway span."""
+    yield Span(name="", stage="", trace_id="", span_id="")
+
+
+# EXPORTERS
+class SpanExporter:
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush anything buffered and release resources."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keeps spans in a list - used for the per-run timing breakdown in the UI."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class JsonlExporter(SpanExporter):
+    """
+    Appends one JSON object per span to a file.
+
+    Spans are buffered and written in batches (when a root span ends or the
+    buffer fills) by a single writer thread that keeps the file open, so
+    exporting never blocks the event loop. `close()` writes the rest.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = 256):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+        self._file = self.path.open("a", encoding="utf-8")
+        # One worker, so batches land in the order they were handed off
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="span-jsonl")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(asdict(span), default=str) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if span.parent_id is not None and len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._writer.submit(self._write, batch)
+
+    def _write(self, batch: list[str]) -> None:
+        self._file.writelines(batch)
+        self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._writer.submit(self._write, batch)
+        self._writer.shutdown(wait=True)
+        self._file.close()
+
+
+class OTLPHttpExporter(SpanExporter):
+    """
+    Sends spans to an OpenTelemetry collector over OTLP/HTTP JSON (e.g. http://localhost:4318).
+
+    Spans are buffered and posted from a background thread when a root span ends
+    or the buffer fills, so exporting never blocks the event loop.
+    """
+
+    def __init__(self, endpoint: str = "http://localhost:4318", service_name: str = "ai-vc-debate", batch_size: int = 256):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self._buffer: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._buffer.append(span)
+            if span.parent_id is not None and len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        threading.Thread(target=self._post, args=(batch,), daemon=True).start()
+
+    def _post(self, batch: list[Span]) -> None:
+        try:
+            httpx.post(self.url, json=self.to_otlp(batch), timeout=5.0)
+        except httpx.HTTPError:
+            # Telemetry must never break a debate
+            pass
+
+    def to_otlp(self, spans: list[Span]) -> dict:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "ai_vc_debate"},
+                    "spans": [_otlp_span(span) for span in spans]
+                }]
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> dict:
+    start_ns = int(span.start_time * 1e9)
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(start_ns + int(span.duration_s * 1e9)),
+        "attributes": [_otlp_attribute("stage", span.stage)]
+                      + [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1}
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+@lru_cache(maxsize=1)
+def default_exporters() -> tuple[SpanExporter, ...]:
+    """Process-wide exporters from DEBATE_TRACE_JSONL / DEBATE_TRACE_OTLP_ENDPOINT."""
+    exporters = []
+    if os.environ.get("DEBATE_TRACE_JSONL"):
+        exporters.append(JsonlExporter(os.environ["DEBATE_TRACE_JSONL"]))
+    if os.environ.get("DEBATE_TRACE_OTLP_ENDPOINT"):
+        exporters.append(OTLPHttpExporter(os.environ["DEBATE_TRACE_OTLP_ENDPOINT"]))
+    for exporter in exporters:
+        atexit.register(exporter.close)
+    return tuple(exporters)
+
+
+def default_tracer() -> Optional[Tracer]:
+    """A tracer wired to the env-configured exporters, or None when none are configured."""
+    exporters = default_exporters()
+    return Tracer(list(exporters)) if exporters else None
+
+
+# AGENTS SDK HOOKS
+class TracingHooks(RunHooks):
+    """Records one span per model call (LLM turn) of an agent run, with token counts."""
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._open: dict[int, Span] = {}
+
+    async def on_llm_start(self, context, agent, system_prompt, input_items) -> None:
+        self._open[id(agent)] = self.tracer.start_span(f"llm:{agent.name}", "llm_turn", agent=agent.name)
+
+    async def on_llm_end(self, context, agent, response) -> None:
+        span = self._open.pop(id(agent), None)
+        if span is None:
+            return
+        span.set(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens)
+        self.tracer.end_span(span)
+
+
+# REPORTING
+def timing_breakdown(spans: list[Span]) -> list[dict]:
+    """Per-stage totals (duration, tokens, tool calls, retries) in first-seen order."""
+    stages: dict[str, dict] = {}
+    for span in sorted(spans, key=lambda s: s.start_time):
+        row = stages.setdefault(span.name, {
+            "stage": span.name, "count": 0, "duration_s": 0.0,
+            "tokens": 0, "tool_calls": 0, "retries": 0
+        })
+        row["count"] += 1
+        row["duration_s"] += span.duration_s
+        row["tokens"] += span.attributes.get("input_tokens", 0) + span.attributes.get("output_tokens", 0)
+        row["tool_calls"] += span.attributes.get("tool_calls", 0)
+        row["retries"] += span.attributes.get("retries", 0)
+    return list(stages.values())
+
+
+def format_timing(spans: list[Span]) -> str:
+    """Markdown table of the timing breakdown for the Gradio UI."""
+    rows = timing_breakdown(spans)
+    if not rows:
+        return ""
+
+    lines = [
+        "### ⏱️ Timing",
+        "| Stage | Calls | Time (s) | Tokens | Tool calls | Retries |",
+        "|---|---:|---:|---:|---:|---:|"
+    ]
+    lines.extend(
+        f"| {r['stage']} | {r['count']} | {r['duration_s']:.2f} | {r['tokens']} | {r['tool_calls']} | {r['retries']} |"
+        for r in rows
+    )
+    return "\n".join(lines)
@@ -8,7 +8,10 @@ from dotenv import load_dotenv
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ai_vc_debate import run_vc_debate, format_verdict, create_app
+from ai_vc_debate import run_vc_debate, run_vc_debate_batch, load_startups, format_verdict, create_app
+from ai_vc_debate.archive import get_decision_archive
+from ai_vc_debate.rendering import export_decisions, iter_result_records
+from ai_vc_debate.tools import close_search_client
 
 
 def main():
@@ -16,16 +19,67 @@ def main():
     
     parser = argparse.ArgumentParser(description="AI-VC: Multi-Agent Startup Analyzer")
     parser.add_argument("--startup", "-s", type=str, help="Startup name to analyze")
+    parser.add_argument("--input", "-i", type=str, help="CSV/JSONL file of startups for batch analysis")
+    parser.add_argument("--output", "-o", type=str, help="Batch: results file, .jsonl or .msgpack (default: <input>_results.jsonl); export: report file")
+    parser.add_argument("--concurrency", type=int, default=8, help="Debates in flight (batch mode)")
+    parser.add_argument("--llm-concurrency", type=int, default=16, help="Concurrent LLM calls (batch mode)")
+    parser.add_argument("--search-concurrency", type=int, default=8, help="Concurrent searches (batch mode)")
+    parser.add_argument("--straggler-timeout", type=float, help="Seconds to wait for the slower case before deciding without it")
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite output instead of skipping finished startups")
+    parser.add_argument("--fresh", action="store_true", help="Re-analyze even if the archive has a fresh result")
+    parser.add_argument("--incremental", action="store_true", help="Re-check the archived analysis (even a fresh one) and re-run only the side whose search results changed")
+    parser.add_argument("--export", "-e", type=str, help="Batch results (.jsonl/.msgpack), or 'archive', to render as a report (--output: .md or .html)")
     parser.add_argument("--ui", action="store_true", help="Launch Gradio UI")
     parser.add_argument("--share", action="store_true", help="Create public Gradio link")
+    parser.add_argument("--ui-concurrency", type=int, help="Analyses the UI runs at once (default: GRADIO_CONCURRENCY or 4)")
     args = parser.parse_args()
     
-    if args.ui or not args.startup:
-        app = create_app()
+    if args.export:
+        export_path = Path(args.export)
+        report_path = Path(args.output or export_path.with_name(f"{export_path.stem}_report.md"))
+        report_format = "html" if report_path.suffix.lower() in (".html", ".htm") else "markdown"
+        if args.export == "archive":
+            archive = get_decision_archive()
+            records = (entry.as_record() for entry in archive.query()) if archive else iter(())
+        else:
+            records = iter_result_records(export_path)
+        with report_path.open("w", encoding="utf-8") as out:
+            count = export_decisions(records, out, report_format)
+        print(f"Rendered {count} decisions -> {report_path}")
+    elif args.input:
+        input_path = Path(args.input)
+        output_path = args.output or input_path.with_name(f"{input_path.stem}_results.jsonl")
+        
+        async def run_batch():
+            try:
+                return await run_vc_debate_batch(
+                    load_startups(input_path),
+                    output_path,
+                    concurrency=args.concurrency,
+                    llm_concurrency=args.llm_concurrency,
+                    search_concurrency=args.search_concurrency,
+                    resume=not args.no_resume,
+                    straggler_timeout=args.straggler_timeout,
+                    fresh=args.fresh,
+                    incremental=args.incremental
+                )
+            finally:
+                await close_search_client()
+        
+        summary = asyncio.run(run_batch())
+        print(f"Batch done: {summary} -> {output_path}")
+    elif args.ui or not args.startup:
+        app = create_app(args.ui_concurrency)
         app.launch(share=args.share)
     else:
         async def run():
-            final_decision, bull_case, bear_case = await run_vc_debate(args.startup)
+            try:
+                final_decision, bull_case, bear_case = await run_vc_debate(
+                    args.startup, straggler_timeout=args.straggler_timeout, fresh=args.fresh,
+                    incremental=args.incremental
+                )
+            finally:
+                await close_search_client()
             print("\n" + "="*60)
             print(format_verdict(final_decision))
         
@@ -1,6 +1,7 @@
 from typing import List, Optional, Literal
 from enum import Enum
 from pydantic import BaseModel, Field, model_validator
+from pydantic.json_schema import SkipJsonSchema
 
 
 # BULL CASE
@@ -68,6 +69,12 @@ class FinalDecision(BaseModel):
     key_due_diligence: Optional[List[str]] = Field(default=None, description="What to verify before writing check")
     follow_up_questions: Optional[List[str]] = Field(default=None, description="Questions for founders")
 
+    # Set by the orchestrator, hidden from the committee's output schema
+    missing_case: SkipJsonSchema[Optional[Literal["bull", "bear"]]] = Field(
+        default=None,
+        description="Case that missed the straggler deadline - the decision saw only the other side"
+    )
+
     @model_validator(mode='after')
     def invest_requires_addressed_risks(self) -> 'FinalDecision':
         """Blocks INVEST if unresolved_risks is not empty."""
@@ -85,3 +92,14 @@ class FinalDecision(BaseModel):
             )
         
         return self
+
+
+class DecisionPatch(BaseModel):
+    """Corrected guardrail fields returned by the committee repair turn."""
+    decision: InvestmentDecision
+    unresolved_risks: List[str] = Field(description="MUST be empty for an INVEST decision")
+    risk_mitigations: List[RiskMitigation]
+    investment_thesis: Optional[str] = Field(
+        default=None,
+        description="Rewritten thesis - REQUIRED if `decision` changes, otherwise leave empty"
+    )
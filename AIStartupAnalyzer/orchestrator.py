@@ -1,137 +1,493 @@
 import asyncio
-from agents import Runner
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+from agents import Agent, Model, Runner, RunConfig, RunResult, RunResultStreaming, StreamEvent
+from agents.exceptions import ModelBehaviorError
+from agents.items import ToolCallItem
+from agents.models.multi_provider import MultiProvider
 
 from .models import BullCase, BearCase, FinalDecision
-from .agents import optimist_agent, skeptic_agent, investment_committee
+from .archive import ArchivedDecision, get_decision_archive, normalize_startup
+from .agents import optimist_agent, skeptic_agent, investment_committee, committee_repair_agent
+from .context import DebateContext, current_agent
+from .instrumentation import TracingHooks
+from .rendering import default_render_cache
+from .serializers import serialize_case
+from .singleflight import DebateFlights, Flight, get_debate_flights
+from .tools import evidence_changed
+from .repair import (
+    FinalDecisionDraftSchema,
+    InvalidDecision,
+    apply_patch,
+    normalize_weights,
+    patch_error,
+    repair_prompt,
+    validate_decision
+)
 
 
-async def run_vc_debate(startup_name: str) -> tuple[FinalDecision, BullCase, BearCase]:
+logger = logging.getLogger(__name__)
+
+# Committee variant whose guardrail failures come back as InvalidDecision instead of raising
+draft_committee = investment_committee.clone(output_type=FinalDecisionDraftSchema())
+
+
+class SlottedModel(Model):
     """
-    Run the full multi-agent VC debate for a startup.
-    
-    1. Optimist builds Bull Case
-    2. Skeptic builds Bear Case (in parallel)
-    3. Investment Committee synthesizes and decides
+    Wraps an agent's model so each model call holds an LLM slot, and tool calls
+    (searches) between turns don't keep one busy.
+
+    Only the public Model interface is forwarded; private SDK hooks keep their
+    base-class defaults, which the chat/responses models we wrap don't override.
+    """
+
+    def __init__(self, model: Model, semaphore: asyncio.Semaphore):
+        self.model = model
+        self.semaphore = semaphore
+        self.queue_wait_s = 0.0
+
+    @asynccontextmanager
+    async def _slot(self):
+        queued = time.perf_counter()
+        async with self.semaphore:
+            self.queue_wait_s += time.perf_counter() - queued
+            yield
+
+    async def get_response(self, *args, **kwargs):
+        async with self._slot():
+            return await self.model.get_response(*args, **kwargs)
+
+    async def stream_response(self, *args, **kwargs):
+        async with self._slot():
+            async for event in self.model.stream_response(*args, **kwargs):
+                yield event
+
+    def get_retry_advice(self, request):
+        return self.model.get_retry_advice(request)
+
+    async def close(self) -> None:
+        await self.model.close()
+
+
+def _slotted_model(agent: Agent, context: DebateContext) -> Optional[SlottedModel]:
+    if context.llm_semaphore is None:
+        return None
+    # A fresh provider picks up the current default OpenAI client
+    model = agent.model if isinstance(agent.model, Model) else MultiProvider().get_model(agent.model)
+    return SlottedModel(model, context.llm_semaphore)
+
+
+async def run_agent(
+    agent: Agent,
+    prompt: str,
+    context: Optional[DebateContext] = None,
+    max_turns: int = 20,
+    on_event: Optional[Callable[[StreamEvent], None]] = None
+) -> RunResult | RunResultStreaming:
+    """
+    Runner.run that takes an LLM slot from the context for each model call (see SlottedModel).
     
-    Returns:
-        Tuple of (FinalDecision, BullCase, BearCase)
+    With `on_event`, the run uses Runner.run_streamed and every stream event
+    (model deltas, tool calls, tool outputs) is passed to it as it arrives.
     """
-    # Run Bull and Bear cases in parallel
-    bull_task = Runner.run(
-        optimist_agent, 
-        f"Analyze startup: {startup_name}. Build the strongest bull case for investment.",
-        max_turns=20
-    )
-    bear_task = Runner.run(
-        skeptic_agent, 
-        f"Analyze startup: {startup_name}. Build the most thorough bear case with all risks.",
-        max_turns=20
-    )
+    context = context or DebateContext()
+    hooks = TracingHooks(context.tracer) if context.tracer else None
+    model = _slotted_model(agent, context)
+    run_config = RunConfig(model=model) if model is not None else None
+
+    # Searches made during this run are recorded as the agent's evidence
+    context.evidence[agent.name] = []
+    token = current_agent.set(agent.name)
+
+    with context.span(f"agent:{agent.name}", "agent", agent=agent.name) as span:
+        try:
+            if on_event is None:
+                result = await Runner.run(
+                    agent, prompt, context=context, max_turns=max_turns, hooks=hooks, run_config=run_config
+                )
+            else:
+                result = Runner.run_streamed(
+                    agent, prompt, context=context, max_turns=max_turns, hooks=hooks, run_config=run_config
+                )
+                async for event in result.stream_events():
+                    on_event(event)
+        finally:
+            current_agent.reset(token)
+            if model is not None:
+                span.set(queue_wait_s=round(model.queue_wait_s, 4))
+
+        usage = result.context_wrapper.usage
+        context.llm_calls += usage.requests
+        span.set(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            llm_calls=usage.requests,
+            tool_calls=sum(isinstance(item, ToolCallItem) for item in result.new_items)
+        )
+    return result
+
+
+async def run_committee(
+    committee_input: str,
+    context: Optional[DebateContext] = None,
+    max_repairs: int = 2,
+    on_event: Optional[Callable[[StreamEvent], None]] = None
+) -> FinalDecision:
+    """
+    Run the Investment Committee and repair guardrail failures without a full re-run.
     
-    bull_result, bear_result = await asyncio.gather(bull_task, bear_task)
-    bull_case: BullCase = bull_result.final_output
-    bear_case: BearCase = bear_result.final_output
+    - Weights that don't sum to 100 are rescaled locally (no LLM call)
+    - Guardrail errors get a short repair turn with only the error and the invalid fields,
+      up to `max_repairs` times; a patch that changes the decision must rewrite the thesis
+    - Errors in fields a repair can't change (e.g. a missing investment_thesis) raise at once
     
-    # Investment Committee decision
-    committee_input = f"""# Startup: {startup_name}
-    {bull_case.model_dump_json(indent=2)}
-    {bear_case.model_dump_json(indent=2)}
-    Based on both cases, make your final investment decision.
-    Remember: You CANNOT recommend INVEST if there are unresolved_risks.
+    Repair counts are accumulated on the context, with an estimate of the tokens saved
+    (a committee re-run is priced at the first run's usage). `on_event` streams the
+    committee's own run (see run_agent), not the repair turns.
     """
+    context = context or DebateContext()
 
-    committee_result = await Runner.run(investment_committee, committee_input)
-    final_decision: FinalDecision = committee_result.final_output
-    
-    return final_decision, bull_case, bear_case
+    with context.span("committee", "committee") as committee_span:
+        result = await run_agent(draft_committee, committee_input, context, max_turns=10, on_event=on_event)
+        output = result.final_output
+        full_run_tokens = result.context_wrapper.usage.total_tokens
+        llm_repairs = 0
+        repair_tokens = 0
 
+        while isinstance(output, InvalidDecision):
+            committee_span.add("retries")
+            if not output.repairable:
+                raise ModelBehaviorError(f"Committee output invalid outside the repairable fields: {output.error}")
+
+            if normalize_weights(output.raw):
+                with context.span("validation", "validation", repair="local"):
+                    output = validate_decision(output.raw)
+                context.local_repairs += 1
+                continue
+
+            if llm_repairs >= max_repairs:
+                raise ModelBehaviorError(
+                    f"Committee output still invalid after {llm_repairs} repair attempts: {output.error}"
+                )
+
+            llm_repairs += 1
+            patch_result = await run_agent(committee_repair_agent, repair_prompt(output), context, max_turns=1)
+            repair_tokens += patch_result.context_wrapper.usage.total_tokens
+            patch = patch_result.final_output
+            with context.span("validation", "validation", repair="llm"):
+                rejected = patch_error(output.raw, patch)
+                if rejected:
+                    output = InvalidDecision(raw=output.raw, error=f"{output.error}; your patch {rejected}")
+                else:
+                    output = validate_decision(apply_patch(output.raw, patch))
+            context.llm_repairs += 1
+
+        if output is not result.final_output:
+            context.tokens_saved_estimate += max(0, full_run_tokens - repair_tokens)
+            logger.info(
+                "Committee repaired with %d repair turn(s), %d tokens, vs ~%d (estimated) for a full re-run",
+                llm_repairs, repair_tokens, full_run_tokens
+            )
+
+    return output
+
+
+BULL_PROMPT = "Analyze startup: {startup_name}. Build the strongest bull case for investment."
+BEAR_PROMPT = "Analyze startup: {startup_name}. Build the most thorough bear case with all risks."
+
+
+def case_section(
+    side: str,
+    case: Optional[BullCase | BearCase],
+    prompt_format: Optional[str] = None
+) -> str:
+    """One side of the committee prompt (see serializers.serialize_case). A missing case is stated explicitly."""
+    if side == "bull":
+        title = "BULL CASE (from The Optimist)"
+    else:
+        title = "BEAR CASE (from The Skeptic)"
+
+    if case is None:
+        return (
+            f"## {title}\n"
+            f"UNAVAILABLE - this research did not finish in time. Treat it as missing information: "
+            f"do not assume it is favourable, and prefer FOLLOW_UP over INVEST.\n"
+        )
+    return f"## {title}\n{serialize_case(case, prompt_format)}\n"
 
-def format_verdict(final_decision: FinalDecision) -> str:
-    """Format the final decision as a readable string."""
-    verdict = f"""## 📋 FINAL VERDICT: {final_decision.decision.value}
 
-**Investment Thesis:**
-{final_decision.investment_thesis}
+def build_committee_input(startup_name: str, bull_section: str, bear_section: str) -> str:
+    return f"""# Startup: {startup_name}
 
-**Weighting:** Bull {final_decision.bull_case_weight}% / Bear {final_decision.bear_case_weight}%
+{bull_section}
+{bear_section}
+Based on both cases, make your final investment decision.
+Remember: You CANNOT recommend INVEST if there are unresolved_risks.
 """
+
+
+async def _gather_cases_pipelined(
+    bull_task: asyncio.Task,
+    bear_task: asyncio.Task,
+    straggler_timeout: float,
+    prompt_format: Optional[str] = None
+) -> tuple[dict, dict, Optional[str]]:
+    """
+    Wait for the first case, render its prompt section right away, then give the
+    other case `straggler_timeout` seconds before cancelling it.
     
-    if final_decision.risk_mitigations:
-        verdict += "\n**Risk Mitigations:**\n"
-        for rm in final_decision.risk_mitigations:
-            verdict += f"- {rm.risk}: {rm.mitigation}\n"
+    Returns ({side: case}, {side: prompt section}, missing side or None).
+    """
+    tasks = {bull_task: "bull", bear_task: "bear"}
+    cases, sections = {}, {}
+
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            side = tasks[task]
+            cases[side] = task.result().final_output
+            sections[side] = case_section(side, cases[side], prompt_format)
+
+        missing = None
+        if pending:
+            (straggler,) = pending
+            side = tasks[straggler]
+            try:
+                result = await asyncio.wait_for(straggler, timeout=straggler_timeout)
+                cases[side] = result.final_output
+            except asyncio.TimeoutError:
+                # wait_for has already cancelled the straggler
+                cases[side] = None
+                missing = side
+            sections[side] = case_section(side, cases[side], prompt_format)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return cases, sections, missing
+
+
+class DebateObserver:
+    """
+    Follows a debate as it runs (see join_debate). Each hook may return an
+    on_event callback; the agent it belongs to then runs streamed (see run_agent).
+    """
+
+    def research(self, side: str) -> Optional[Callable[[StreamEvent], None]]:
+        """`side` ("bull" or "bear") is starting its research."""
+        return None
+
+    def committee(
+        self, bull_case: Optional[BullCase], bear_case: Optional[BearCase]
+    ) -> Optional[Callable[[StreamEvent], None]]:
+        """The cases are in (a dropped one is None) and the committee is starting."""
+        return None
+
+    def finished(self) -> None:
+        """The debate ended, whether or not it succeeded."""
+
+
+async def run_vc_debate(
+    startup_name: str,
+    context: Optional[DebateContext] = None,
+    straggler_timeout: Optional[float] = None,
+    prompt_format: Optional[str] = None,
+    fresh: bool = False,
+    incremental: bool = False
+) -> tuple[FinalDecision, Optional[BullCase], Optional[BearCase]]:
+    """
+    Run the full multi-agent VC debate for a startup.
     
-    if final_decision.unresolved_risks:
-        verdict += "\n**Unresolved Risks:**\n"
-        for risk in final_decision.unresolved_risks:
-            verdict += f"- {risk}\n"
+    1. Optimist builds Bull Case
+    2. Skeptic builds Bear Case (in parallel)
+    3. Investment Committee synthesizes and decides
     
-    if final_decision.recommended_check_size:
-        verdict += f"\n**Recommended Check Size:** {final_decision.recommended_check_size}\n"
+    With `straggler_timeout` set, the committee prompt is prepared from whichever
+    case finishes first and the slower agent gets that many extra seconds. If it
+    misses the deadline it is cancelled, the committee decides on one side and
+    `FinalDecision.missing_case` records which side was dropped (that case is None).
     
-    if final_decision.key_due_diligence:
-        verdict += "\n**Key Due Diligence:**\n"
-        for item in final_decision.key_due_diligence:
-            verdict += f"- {item}\n"
+    `prompt_format` picks how the cases are encoded for the committee
+    (pretty/compact/digest/pruned, default from COMMITTEE_PROMPT_FORMAT).
     
-    if final_decision.follow_up_questions:
-        verdict += "\n**Follow-up Questions:**\n"
-        for q in final_decision.follow_up_questions:
-            verdict += f"- {q}\n"
+    A complete result archived within the freshness window (see archive.py) is
+    returned without running the agents, unless `fresh` or `incremental` is
+    set; new results are archived. Concurrent calls for the same startup (and
+    options) share one debate (see singleflight.py); the first caller's
+    context runs it.
     
-    return verdict
+    With `incremental`, a new debate starts from the newest archived one of any
+    age: each agent's recorded searches are re-run, only the side whose results
+    changed is researched again, and the committee only runs if a side was re-run.
+    
+    Returns:
+        Tuple of (FinalDecision, BullCase, BearCase)
+    """
+    context = context or DebateContext()
+    archive = get_decision_archive()
 
+    with context.span("debate", "debate", startup_name=startup_name) as span:
+        if archive is not None and not fresh and not incremental:
+            archived = await archive.alatest(startup_name)
+            span.set(archive_hit=archived is not None)
+            if archived is not None:
+                return archived.final_decision, archived.bull_case, archived.bear_case
 
-def format_bull_case(bull_case: BullCase) -> str:
-    """Format the bull case as markdown."""
-    return f"""## 🐂 BULL CASE: {bull_case.startup_name}
+        async with join_debate(startup_name, context, straggler_timeout, prompt_format, incremental) as flight:
+            span.set(shared_run=flight.context is not context)
+            return await flight.result()
 
-**{bull_case.one_liner}**
 
-### Market Opportunity
-{bull_case.market_opportunity}
+@asynccontextmanager
+async def join_debate(
+    startup_name: str,
+    context: Optional[DebateContext] = None,
+    straggler_timeout: Optional[float] = None,
+    prompt_format: Optional[str] = None,
+    incremental: bool = False,
+    observer: Optional[Callable[[Flight], DebateObserver]] = None
+) -> AsyncIterator[Flight]:
+    """
+    Start the debate for `startup_name`, or join the one in flight with the same
+    options, without the archive fast path (see run_vc_debate, which this backs).
+    `flight.result()` gives (FinalDecision, BullCase, BearCase), and the result
+    is archived.
 
-### Competitive Moat
-{bull_case.competitive_moat}
+    `observer` is called with the flight when this caller starts the run, and
+    the debate reports its progress to the observer it returns (e.g. by
+    publishing it with `flight.emit` for every caller following `flight.updates()`).
+    A caller that joins a run already in flight sees only what its starter publishes.
+    """
+    context = context or DebateContext()
+    archive = get_decision_archive()
+    # With single-flight disabled, a private registry still runs the debate as a flight
+    flights = get_debate_flights() or DebateFlights()
 
-### Growth Catalysts
-{chr(10).join(f'- {c}' for c in bull_case.growth_catalysts)}
+    async def run(flight: Flight):
+        started = time.perf_counter()
+        watcher = observer(flight) if observer is not None else DebateObserver()
+        try:
+            previous = None
+            if archive is not None and incremental:
+                previous = await archive.alatest(startup_name, max_age=math.inf)
+            if previous is not None:
+                result = await _incremental_debate(startup_name, context, previous, prompt_format, watcher)
+            else:
+                result = await _debate(startup_name, context, straggler_timeout, prompt_format, watcher)
+        finally:
+            watcher.finished()
+        if archive is not None:
+            await archive.aput(
+                startup_name, *result, time.perf_counter() - started,
+                bull_evidence=context.evidence.get(optimist_agent.name),
+                bear_evidence=context.evidence.get(skeptic_agent.name)
+            )
+        return result
 
-### Traction
-{chr(10).join(f'- {t}' for t in bull_case.traction_highlights)}
+    key = ("debate", normalize_startup(startup_name), straggler_timeout, prompt_format, incremental)
+    async with flights.join(key, run, context) as flight:
+        yield flight
 
-### Team Strengths
-{chr(10).join(f'- {s}' for s in bull_case.team_strengths)}
 
-### Comparable Exits
-{chr(10).join(f'- {e}' for e in bull_case.comparable_exits)}
+async def _debate(
+    startup_name: str,
+    context: DebateContext,
+    straggler_timeout: Optional[float],
+    prompt_format: Optional[str],
+    observer: DebateObserver
+) -> tuple[FinalDecision, Optional[BullCase], Optional[BearCase]]:
+    # Run Bull and Bear cases in parallel
+    bull_task = asyncio.ensure_future(run_agent(
+        optimist_agent, BULL_PROMPT.format(startup_name=startup_name), context, on_event=observer.research("bull")
+    ))
+    bear_task = asyncio.ensure_future(run_agent(
+        skeptic_agent, BEAR_PROMPT.format(startup_name=startup_name), context, on_event=observer.research("bear")
+    ))
+    
+    if straggler_timeout is None:
+        bull_result, bear_result = await asyncio.gather(bull_task, bear_task)
+        cases = {"bull": bull_result.final_output, "bear": bear_result.final_output}
+        sections = {side: case_section(side, case, prompt_format) for side, case in cases.items()}
+        missing = None
+    else:
+        cases, sections, missing = await _gather_cases_pipelined(
+            bull_task, bear_task, straggler_timeout, prompt_format
+        )
 
-**Confidence Score: {bull_case.confidence_score}/10**
+    bull_case: Optional[BullCase] = cases["bull"]
+    bear_case: Optional[BearCase] = cases["bear"]
+    
+    # Investment Committee decision
+    committee_input = build_committee_input(startup_name, sections["bull"], sections["bear"])
 
-**Thesis:** {bull_case.investment_thesis_summary}
-"""
+    final_decision = await run_committee(committee_input, context, on_event=observer.committee(bull_case, bear_case))
+    if missing is not None:
+        final_decision = final_decision.model_copy(update={"missing_case": missing})
+    
+    return final_decision, bull_case, bear_case
 
 
-def format_bear_case(bear_case: BearCase) -> str:
-    """Format the bear case as markdown."""
-    return f"""## 🐻 BEAR CASE: {bear_case.startup_name}
+async def _incremental_debate(
+    startup_name: str,
+    context: DebateContext,
+    previous: ArchivedDecision,
+    prompt_format: Optional[str],
+    observer: DebateObserver
+) -> tuple[FinalDecision, Optional[BullCase], Optional[BearCase]]:
+    """Refresh `previous`: re-run only the agents whose search results changed (see run_vc_debate)."""
+    sides = {
+        "bull": (optimist_agent, BULL_PROMPT, previous.bull_case, previous.bull_evidence),
+        "bear": (skeptic_agent, BEAR_PROMPT, previous.bear_case, previous.bear_evidence)
+    }
+
+    with context.span("evidence_check", "validation") as span:
+        changed = await asyncio.gather(*(evidence_changed(evidence, context) for *_, evidence in sides.values()))
+        stale = [side for side, side_changed in zip(sides, changed) if side_changed]
+        span.set(changed=",".join(stale) or "none")
 
-### Market Risks
-{chr(10).join(f'- {r}' for r in bear_case.market_risks)}
+    cases = {side: case for side, (_, _, case, _) in sides.items()}
+    for side, (agent, _, _, evidence) in sides.items():
+        if side not in stale:
+            # Carry the unchanged side's fingerprints over to the new archive entry
+            context.evidence[agent.name] = evidence
 
-### Execution Risks
-{chr(10).join(f'- {r}' for r in bear_case.execution_risks)}
+    if not stale:
+        logger.info("Incremental re-analysis of %s: no search results changed, committee skipped", startup_name)
+        return previous.final_decision, cases["bull"], cases["bear"]
 
-### Competitive Threats
-{chr(10).join(f'- {t}' for t in bear_case.competitive_threats)}
+    results = await asyncio.gather(*(
+        run_agent(
+            sides[side][0], sides[side][1].format(startup_name=startup_name), context,
+            on_event=observer.research(side)
+        )
+        for side in stale
+    ))
+    for side, result in zip(stale, results):
+        cases[side] = result.final_output
 
-### Financial Concerns
-{chr(10).join(f'- {c}' for c in bear_case.financial_concerns)}
+    logger.info("Incremental re-analysis of %s: re-ran %s", startup_name, ", ".join(stale))
+    committee_input = build_committee_input(
+        startup_name, case_section("bull", cases["bull"], prompt_format), case_section("bear", cases["bear"], prompt_format)
+    )
+    final_decision = await run_committee(
+        committee_input, context, on_event=observer.committee(cases["bull"], cases["bear"])
+    )
+    return final_decision, cases["bull"], cases["bear"]
 
-### Key Weaknesses
-{chr(10).join(f'- {w}' for w in bear_case.key_weaknesses)}
 
-### Kill Scenario
-{bear_case.kill_scenario}
+def format_verdict(final_decision: FinalDecision) -> str:
+    """Format the final decision as a readable string (memoized, see rendering.RenderCache)."""
+    return default_render_cache.verdict(final_decision)
 
-**Risk Severity Score: {bear_case.risk_severity_score}/10**"""
\ No newline at end of file
+
+def format_bull_case(bull_case: BullCase) -> str:
+    """Format the bull case as markdown (memoized)."""
+    return default_render_cache.bull_case(bull_case)
+
+
+def format_bear_case(bear_case: BearCase) -> str:
+    """Format the bear case as markdown (memoized)."""
+    return default_render_cache.bear_case(bear_case)
@@ -0,0 +1,191 @@
+import gc
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from .models import BullCase, BearCase, FinalDecision
+
+try:
+    import msgpack
+except ImportError:
+    # Optional: only needed for .msgpack result files
+    msgpack = None
+
+
+RecordFormat = Literal["jsonl", "msgpack"]
+MSGPACK_SUFFIXES = (".msgpack", ".mpk")
+
+
+class DebateRecord(BaseModel):
+    """One stored debate, as written by batch.run_vc_debate_batch (error records have only `error`)."""
+    startup_name: str
+    final_decision: Optional[FinalDecision] = None
+    bull_case: Optional[BullCase] = None
+    bear_case: Optional[BearCase] = None
+    elapsed_s: Optional[float] = None
+    error: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def adapter(tp: Any) -> TypeAdapter:
+    """TypeAdapter for `tp`, built once (building one compiles a validator and serializer)."""
+    return TypeAdapter(tp)
+
+
+# Bulk adapter: one validate/dump call for a whole list instead of one per record
+RECORDS = adapter(list[DebateRecord])
+
+
+@contextmanager
+def gc_paused():
+    """
+    Suspend the cyclic garbage collector while building a large list of models.
+    Every allocation burst otherwise triggers collections that rescan the
+    ever-growing list (records have no cycles, so nothing is freed); on 100k
+    records that costs more than validation itself.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def record_format(path: str | Path) -> RecordFormat:
+    return "msgpack" if Path(path).suffix.lower() in MSGPACK_SUFFIXES else "jsonl"
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("msgpack is not installed - pip install msgpack to read or write .msgpack results")
+
+
+def _as_record(record: DebateRecord | dict) -> DebateRecord:
+    return record if isinstance(record, DebateRecord) else DebateRecord.model_validate(record)
+
+
+def encode_record(record: DebateRecord | dict, record_format: RecordFormat = "jsonl") -> bytes:
+    """One record as a JSONL line or a msgpack object; both can be appended to a results file."""
+    record = _as_record(record)
+    if record_format == "msgpack":
+        _require_msgpack()
+        return msgpack.packb(record.model_dump(mode="json", exclude_none=True))
+    return record.model_dump_json(exclude_none=True).encode() + b"\n"
+
+
+def iter_records(path: str | Path, include_errors: bool = False) -> Iterator[DebateRecord]:
+    """
+    Stream records from a JSONL or msgpack results file, validated straight from
+    the raw bytes. A truncated last entry (killed run) is skipped; any other
+    invalid entry raises ValueError naming its line (JSONL) or offset (msgpack).
+    """
+    path = Path(path)
+    with path.open("rb") as f:
+        if record_format(path) == "msgpack":
+            _require_msgpack()
+            records = _iter_msgpack(f, path)
+        else:
+            records = _iter_jsonl(f, path)
+        for record in records:
+            if include_errors or record.final_decision is not None:
+                yield record
+
+
+def _iter_jsonl(f, path: Path) -> Iterator[DebateRecord]:
+    for line_no, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = DebateRecord.model_validate_json(line)
+        except ValueError as e:
+            # Only an unterminated last line is a partial write
+            if not line.endswith(b"\n"):
+                return
+            raise ValueError(f"{path}:{line_no}: invalid record: {e}") from e
+        yield record
+
+
+def _iter_msgpack(f, path: Path) -> Iterator[DebateRecord]:
+    unpacker = msgpack.Unpacker(f, raw=False)
+    while True:
+        offset = unpacker.tell()
+        try:
+            obj = next(unpacker)
+        except (StopIteration, msgpack.OutOfData):
+            # End of file, or an object cut off by a killed run
+            return
+        except ValueError as e:
+            raise ValueError(f"{path}: undecodable record at byte {offset}: {type(e).__name__}") from e
+        try:
+            record = DebateRecord.model_validate(obj)
+        except ValueError as e:
+            raise ValueError(f"{path}: invalid record at byte {offset}: {e}") from e
+        yield record
+
+
+def _after_last_newline(f, size: int, chunk: int = 65536) -> int:
+    """Offset just past the last newline in `f` (0 if there is none), reading back from the end in chunks."""
+    pos = size
+    while pos > 0:
+        start = max(0, pos - chunk)
+        f.seek(start)
+        newline = f.read(pos - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        pos = start
+    return 0
+
+
+def trim_partial_record(path: str | Path) -> None:
+    """Cut a truncated last record (from a killed run) so records appended after it stay readable."""
+    path = Path(path)
+    if not path.exists():
+        return
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        if record_format(path) == "msgpack":
+            _require_msgpack()
+            unpacker = msgpack.Unpacker(f, raw=False)
+            end = 0
+            try:
+                for _ in unpacker:
+                    end = unpacker.tell()
+            except (ValueError, msgpack.UnpackException):
+                pass
+        else:
+            end = _after_last_newline(f, size)
+    if end < size:
+        with path.open("r+b") as f:
+            f.truncate(end)
+
+
+def dump_records(records: Iterable[DebateRecord | dict], path: str | Path) -> int:
+    """Write records to a JSONL or msgpack file (by suffix) in one buffered pass; returns the count."""
+    path = Path(path)
+    fmt = record_format(path)
+    count = 0
+    with path.open("wb") as out:
+        for record in records:
+            out.write(encode_record(record, fmt))
+            count += 1
+    return count
+
+
+def load_records(path: str | Path) -> list[DebateRecord]:
+    """
+    Load a whole results file, with the garbage collector paused. msgpack files
+    are decoded in one call and validated with the cached list adapter; JSONL
+    is validated line by line from bytes. Error records are kept.
+    """
+    path = Path(path)
+    with gc_paused():
+        if record_format(path) == "msgpack":
+            _require_msgpack()
+            with path.open("rb") as f:
+                return RECORDS.validate_python(list(msgpack.Unpacker(f, raw=False)))
+        return list(iter_records(path, include_errors=True))
@@ -0,0 +1,256 @@
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Literal, Optional, TextIO
+
+from pydantic import BaseModel
+
+from .models import BullCase, BearCase, FinalDecision
+from .records import iter_records
+
+
+ReportFormat = Literal["markdown", "html"]
+
+
+# VIEW BUILDERS
+def _bullets(items: Iterable) -> str:
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _bullet_section(parts: list[str], heading: str, items: list) -> None:
+    if items:
+        parts.append(heading)
+        parts.extend(f"- {item}\n" for item in items)
+
+
+def build_verdict(final_decision: FinalDecision) -> str:
+    """Final decision as markdown."""
+    parts = [
+        f"## 📋 FINAL VERDICT: {final_decision.decision.value}\n\n"
+        f"**Investment Thesis:**\n{final_decision.investment_thesis}\n\n"
+        f"**Weighting:** Bull {final_decision.bull_case_weight}% / Bear {final_decision.bear_case_weight}%\n"
+    ]
+
+    if final_decision.missing_case:
+        parts.append(
+            f"\n⚠️ **Degraded decision:** the {final_decision.missing_case} case missed the deadline "
+            f"and was not considered.\n"
+        )
+
+    _bullet_section(
+        parts, "\n**Risk Mitigations:**\n",
+        [f"{rm.risk}: {rm.mitigation}" for rm in final_decision.risk_mitigations]
+    )
+    _bullet_section(parts, "\n**Unresolved Risks:**\n", final_decision.unresolved_risks)
+
+    if final_decision.recommended_check_size:
+        parts.append(f"\n**Recommended Check Size:** {final_decision.recommended_check_size}\n")
+
+    _bullet_section(parts, "\n**Key Due Diligence:**\n", final_decision.key_due_diligence)
+    _bullet_section(parts, "\n**Follow-up Questions:**\n", final_decision.follow_up_questions)
+    return "".join(parts)
+
+
+def build_bull_case(bull_case: BullCase) -> str:
+    """Bull case as markdown."""
+    return "\n".join([
+        f"## 🐂 BULL CASE: {bull_case.startup_name}", "",
+        f"**{bull_case.one_liner}**", "",
+        "### Market Opportunity", bull_case.market_opportunity, "",
+        "### Competitive Moat", bull_case.competitive_moat, "",
+        "### Growth Catalysts", _bullets(bull_case.growth_catalysts), "",
+        "### Traction", _bullets(bull_case.traction_highlights), "",
+        "### Team Strengths", _bullets(bull_case.team_strengths), "",
+        "### Comparable Exits", _bullets(bull_case.comparable_exits), "",
+        f"**Confidence Score: {bull_case.confidence_score}/10**", "",
+        f"**Thesis:** {bull_case.investment_thesis_summary}", ""
+    ])
+
+
+def build_bear_case(bear_case: BearCase) -> str:
+    """Bear case as markdown."""
+    return "\n".join([
+        f"## 🐻 BEAR CASE: {bear_case.startup_name}", "",
+        "### Market Risks", _bullets(bear_case.market_risks), "",
+        "### Execution Risks", _bullets(bear_case.execution_risks), "",
+        "### Competitive Threats", _bullets(bear_case.competitive_threats), "",
+        "### Financial Concerns", _bullets(bear_case.financial_concerns), "",
+        "### Key Weaknesses", _bullets(bear_case.key_weaknesses), "",
+        "### Kill Scenario", bear_case.kill_scenario, "",
+        f"**Risk Severity Score: {bear_case.risk_severity_score}/10**"
+    ])
+
+
+BUILDERS: dict[str, Callable[[BaseModel], str]] = {
+    "verdict": build_verdict,
+    "bull": build_bull_case,
+    "bear": build_bear_case
+}
+
+
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+
+
+def markdown_to_html(markdown: str) -> str:
+    """HTML for the markdown subset the builders emit (headings, bold, bullet lists, paragraphs)."""
+    parts = []
+    in_list = False
+    for line in markdown.split("\n"):
+        marker = re.match(r"(#{1,3} |- )?", line).group(0)
+        text = _BOLD.sub(r"<strong>\1</strong>", html.escape(line[len(marker):].strip(), quote=False))
+        if marker == "- ":
+            if not in_list:
+                parts.append("<ul>")
+                in_list = True
+            parts.append(f"<li>{text}</li>")
+            continue
+        if in_list:
+            parts.append("</ul>")
+            in_list = False
+        if marker.startswith("#"):
+            level = len(marker) - 1
+            parts.append(f"<h{level}>{text}</h{level}>")
+        elif line.strip():
+            parts.append(f"<p>{text}</p>")
+    if in_list:
+        parts.append("</ul>")
+    return "\n".join(parts)
+
+
+# MEMOIZED VIEWS
+class RenderCache:
+    """
+    Memoized markdown views, built once per result content.
+
+    - Keyed on a hash of the model's JSON, so equal copies (e.g. reloaded from
+      disk) share a view and a model edited in place is rendered afresh
+    - LRU-bounded
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._by_hash: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._by_hash)}
+
+    def render(self, view: str, model: BaseModel) -> str:
+        hash_key = (view, hashlib.sha256(model.model_dump_json().encode()).hexdigest())
+        with self._lock:
+            text = self._by_hash.get(hash_key)
+            if text is not None:
+                self._by_hash.move_to_end(hash_key)
+                self.hits += 1
+                return text
+
+        text = BUILDERS[view](model)
+        with self._lock:
+            self.misses += 1
+            self._by_hash[hash_key] = text
+            self._by_hash.move_to_end(hash_key)
+            while len(self._by_hash) > self.max_entries:
+                self._by_hash.popitem(last=False)
+        return text
+
+    def verdict(self, final_decision: FinalDecision) -> str:
+        return self.render("verdict", final_decision)
+
+    def bull_case(self, bull_case: BullCase) -> str:
+        return self.render("bull", bull_case)
+
+    def bear_case(self, bear_case: BearCase) -> str:
+        return self.render("bear", bear_case)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_hash.clear()
+
+
+default_render_cache = RenderCache()
+
+
+# BULK EXPORT
+_MODELS = {"final_decision": FinalDecision, "bull_case": BullCase, "bear_case": BearCase}
+
+_HTML_HEAD = (
+    "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+    "<title>AI-VC Decision Report</title>\n</head>\n<body>\n"
+)
+_HTML_TAIL = "</body>\n</html>\n"
+
+
+def iter_result_records(path: str | Path) -> Iterator[dict]:
+    """
+    Stream successful records from a batch results file (JSONL or msgpack, see
+    batch.run_vc_debate_batch). Each line is validated from bytes in one pass, so
+    the dicts hold the models rather than their dumps.
+    """
+    for record in iter_records(path):
+        yield dict(record)
+
+
+def _as_model(value, model: type[BaseModel]) -> Optional[BaseModel]:
+    if value is None or isinstance(value, BaseModel):
+        return value
+    return model.model_validate(value)
+
+
+def render_record(record: dict, include_cases: bool = True, cache: Optional[RenderCache] = None) -> str:
+    """Markdown for one stored result: verdict, then the bull and bear cases when present."""
+    render = cache.render if cache is not None else (lambda view, model: BUILDERS[view](model))
+    decision = _as_model(record["final_decision"], FinalDecision)
+    sections = [f"# {decision.startup_name}", render("verdict", decision)]
+
+    if include_cases:
+        for key, view in (("bull_case", "bull"), ("bear_case", "bear")):
+            case = _as_model(record.get(key), _MODELS[key])
+            if case is not None:
+                sections.append(render(view, case))
+    return "\n\n".join(sections)
+
+
+def export_decisions(
+    records: Iterable[dict],
+    out: TextIO,
+    report_format: ReportFormat = "markdown",
+    include_cases: bool = True,
+    cache: Optional[RenderCache] = None
+) -> int:
+    """
+    Render stored decisions to `out` in one streaming pass.
+
+    Each record is rendered and written as soon as it is read, so memory stays flat
+    for archives of any size. Records are dicts with a `final_decision` and optional
+    `bull_case`/`bear_case` (models or their JSON dumps). Bulk export skips the view
+    cache by default since each record is rendered exactly once.
+
+    Returns the number of records written.
+    """
+    if report_format not in ("markdown", "html"):
+        raise ValueError(f"Unknown report format {report_format!r} - expected 'markdown' or 'html'")
+
+    if report_format == "html":
+        out.write(_HTML_HEAD)
+
+    count = 0
+    for record in records:
+        markdown = render_record(record, include_cases, cache)
+        if report_format == "html":
+            out.write(f"<section>\n{markdown_to_html(markdown)}\n</section>\n")
+        else:
+            out.write(("\n\n---\n\n" if count else "") + markdown)
+        count += 1
+
+    if report_format == "html":
+        out.write(_HTML_TAIL)
+    elif count:
+        out.write("\n")
+    return count
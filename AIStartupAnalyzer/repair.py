@@ -0,0 +1,107 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from agents.agent_output import AgentOutputSchema
+from agents.exceptions import ModelBehaviorError
+from pydantic import ValidationError
+
+from .models import FinalDecision, DecisionPatch
+
+
+# Fields a DecisionPatch can change, shown to the repair turn. The weights are not
+# among them: a bad sum is rescaled locally (normalize_weights), and a missing or
+# out-of-range weight can't be patched, so it fails at once
+REPAIRABLE_FIELDS = ("decision", "unresolved_risks", "risk_mitigations")
+
+
+@dataclass
+class InvalidDecision:
+    """
+    Committee output that parsed as JSON but failed FinalDecision validation.
+    `repairable` is False when an error concerns a field the repair turn can't change.
+    """
+    raw: dict
+    error: str
+    repairable: bool = True
+
+
+def describe_error(error: ValidationError) -> str:
+    return "; ".join(e["msg"] for e in error.errors())
+
+
+def is_repairable(error: ValidationError) -> bool:
+    """True if every error is the guardrail (model-level, no field) or names a repairable field."""
+    return all(not e["loc"] or e["loc"][0] in REPAIRABLE_FIELDS for e in error.errors())
+
+
+def validate_decision(raw: dict) -> FinalDecision | InvalidDecision:
+    try:
+        return FinalDecision.model_validate(raw)
+    except ValidationError as e:
+        return InvalidDecision(raw=raw, error=describe_error(e), repairable=is_repairable(e))
+
+
+class FinalDecisionDraftSchema(AgentOutputSchema):
+    """
+    FinalDecision output schema that hands back guardrail failures instead of raising,
+    so the orchestrator can repair them without re-running the committee.
+    """
+
+    def __init__(self):
+        super().__init__(FinalDecision)
+
+    def validate_json(self, json_str: str) -> FinalDecision | InvalidDecision:
+        try:
+            raw = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            raise ModelBehaviorError(f"Invalid JSON when parsing committee output: {e}") from e
+
+        if not isinstance(raw, dict):
+            raise ModelBehaviorError(f"Expected a JSON object for FinalDecision, got {type(raw).__name__}")
+
+        return validate_decision(raw)
+
+
+def normalize_weights(raw: dict) -> bool:
+    """Rescale bull/bear weights to sum to 100 in place. Returns True if anything changed."""
+    bull = raw.get("bull_case_weight")
+    bear = raw.get("bear_case_weight")
+    if not isinstance(bull, int) or not isinstance(bear, int) or bull + bear == 100:
+        return False
+
+    total = bull + bear
+    if total <= 0:
+        raw["bull_case_weight"], raw["bear_case_weight"] = 50, 50
+    else:
+        raw["bull_case_weight"] = round(100 * bull / total)
+        raw["bear_case_weight"] = 100 - raw["bull_case_weight"]
+    return True
+
+
+def repair_prompt(invalid: InvalidDecision) -> str:
+    """Short follow-up turn: the validation error plus only the fields it concerns."""
+    fields = {k: invalid.raw.get(k) for k in REPAIRABLE_FIELDS}
+    return f"""Your FinalDecision failed validation:
+{invalid.error}
+
+Current values:
+{json.dumps(fields, separators=(",", ":"))}
+
+Current investment_thesis:
+{invalid.raw.get("investment_thesis", "")}
+
+Return corrected values for these fields only. If you change `decision`, also
+return an `investment_thesis` rewritten to support the new decision.
+"""
+
+
+def patch_error(raw: dict, patch: DecisionPatch) -> Optional[str]:
+    """Why a patch can't be applied: a changed decision needs a thesis that argues for it."""
+    if patch.decision.value != raw.get("decision") and not patch.investment_thesis:
+        return f"decision changed to {patch.decision.value} without a rewritten investment_thesis"
+    return None
+
+
+def apply_patch(raw: dict, patch: DecisionPatch) -> dict:
+    return {**raw, **patch.model_dump(mode="json", exclude_none=True)}
@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+PROMPT_FORMATS: tuple[str, ...] = ("pretty", "compact", "digest", "pruned")
+
+
+def default_prompt_format() -> str:
+    """
+    Format used for the committee prompt unless a caller asks for another one.
+    Read on each call, so COMMITTEE_PROMPT_FORMAT from a .env loaded after import applies.
+    """
+    return os.environ.get("COMMITTEE_PROMPT_FORMAT") or "pruned"
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == [] or value == "" or value == {}
+
+
+def _digest_value(value) -> str:
+    if isinstance(value, dict):
+        return " → ".join(str(v) for v in value.values())
+    return str(value)
+
+
+def to_digest(model: BaseModel) -> str:
+    """Terse markdown: `key: value` lines, lists as bullets, empty fields skipped."""
+    lines = [f"### {type(model).__name__}"]
+    for key, value in model.model_dump(mode="json").items():
+        if _is_empty(value):
+            continue
+        if isinstance(value, list):
+            lines.append(f"{key}:")
+            lines.extend(f"- {_digest_value(v)}" for v in value)
+        else:
+            lines.append(f"{key}: {_digest_value(value)}")
+    return "\n".join(lines)
+
+
+def serialize_case(model: BaseModel, prompt_format: Optional[str] = None) -> str:
+    """
+    Serialize a case model for an LLM prompt.
+
+    - pretty: indented JSON (the original format, kept for comparison)
+    - compact: JSON without whitespace
+    - digest: terse markdown
+    - pruned: compact JSON without None/empty optional fields (e.g. regulatory_risks);
+      required fields are always kept, even when empty
+    """
+    prompt_format = prompt_format or default_prompt_format()
+    if prompt_format not in PROMPT_FORMATS:
+        raise ValueError(
+            f"Unknown prompt format {prompt_format!r} (COMMITTEE_PROMPT_FORMAT or prompt_format) "
+            f"- expected one of {PROMPT_FORMATS}"
+        )
+
+    if prompt_format == "pretty":
+        return model.model_dump_json(indent=2)
+    if prompt_format == "compact":
+        return model.model_dump_json()
+    if prompt_format == "digest":
+        return to_digest(model)
+    # pruned
+    fields = type(model).model_fields
+    data = {
+        k: v for k, v in model.model_dump(mode="json").items()
+        if not _is_empty(v) or (k in fields and fields[k].is_required())
+    }
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
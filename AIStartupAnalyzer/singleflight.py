@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional
+
+from .context import DebateContext
+
+
+logger = logging.getLogger(__name__)
+
+
+class Flight:
+    """
+    One in-flight debate shared by every caller that asked for the same key.
+
+    The debate runs in its own task, so it is not tied to the session that
+    started it. It publishes progress with `emit`; each caller follows with
+    `updates()` (all updates so far, then live ones) and awaits `result()`.
+    """
+
+    def __init__(self, key: Hashable, context: DebateContext):
+        self.key = key
+        self.context = context
+        self.callers = 0
+        self.joined = 0
+        self.task: Optional[asyncio.Task] = None
+        self._updates: list[Any] = []
+        self._changed = asyncio.Event()
+
+    def emit(self, update: Any) -> None:
+        """Publish a progress update to every caller (the run's own coroutine calls this)."""
+        self._updates.append(update)
+        self._notify()
+
+    def _notify(self, *_) -> None:
+        # Wake current followers; later waits use a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def updates(self, latest_only: bool = False) -> AsyncIterator[Any]:
+        """
+        Every update emitted so far, then new ones as they arrive, until the run
+        ends. With `latest_only`, updates that piled up while the caller was busy
+        are skipped in favour of the newest (for full-snapshot updates).
+        """
+        seen = 0
+        while True:
+            if latest_only and seen < len(self._updates):
+                seen = len(self._updates) - 1
+            while seen < len(self._updates):
+                seen += 1
+                yield self._updates[seen - 1]
+            if self.task.done():
+                return
+            await self._changed.wait()
+
+    async def result(self) -> Any:
+        # Shielded: one caller leaving must not cancel the run for the others
+        return await asyncio.shield(self.task)
+
+
+class DebateFlights:
+    """
+    Single-flight registry: concurrent requests for the same key share one debate.
+
+    - `join(key, run)` starts `run(flight)` for the first caller and attaches
+      later callers to the same Flight until it finishes
+    - The run is cancelled only when every caller has left
+    - `stats`: runs started, callers that shared a run, and the LLM calls those
+      callers did not make (the shared run's count, once per extra caller)
+    """
+
+    def __init__(self):
+        self.runs = 0
+        self.shared = 0
+        self.llm_calls_saved = 0
+        self._inflight: dict[Hashable, Flight] = {}
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "shared": self.shared,
+            "llm_calls_saved": self.llm_calls_saved,
+            "in_flight": len(self._inflight)
+        }
+
+    def _start(self, key: Hashable, run: Callable[[Flight], Awaitable[Any]], context: DebateContext) -> Flight:
+        flight = Flight(key, context)
+        flight.task = asyncio.ensure_future(run(flight))
+        flight.task.add_done_callback(flight._notify)
+        flight.task.add_done_callback(lambda task: self._finish(flight, task))
+        self._inflight[key] = flight
+        self.runs += 1
+        return flight
+
+    def _finish(self, flight: Flight, task: asyncio.Task) -> None:
+        if self._inflight.get(flight.key) is flight:
+            del self._inflight[flight.key]
+        if task.cancelled():
+            return
+        if task.exception() is None and flight.joined:
+            saved = flight.joined * flight.context.llm_calls
+            self.llm_calls_saved += saved
+            logger.info("Debate %r shared by %d callers (saved %d LLM calls)", flight.key, flight.joined + 1, saved)
+
+    @asynccontextmanager
+    async def join(
+        self,
+        key: Hashable,
+        run: Callable[[Flight], Awaitable[Any]],
+        context: Optional[DebateContext] = None
+    ) -> AsyncIterator[Flight]:
+        """
+        Attach to the debate in flight for `key`, or start `run(flight)` with
+        `context` (the starting caller's) if there is none.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._start(key, run, context or DebateContext())
+        else:
+            flight.joined += 1
+            self.shared += 1
+
+        flight.callers += 1
+        try:
+            yield flight
+        finally:
+            flight.callers -= 1
+            if flight.callers == 0 and not flight.task.done():
+                flight.task.cancel()
+                # Unregister now, not in the done-callback: a caller arriving
+                # before the task unwinds must start a new run, not join this one
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+
+    async def run(
+        self,
+        key: Hashable,
+        run: Callable[[Flight], Awaitable[Any]],
+        context: Optional[DebateContext] = None
+    ) -> Any:
+        """join() for callers that only want the result."""
+        async with self.join(key, run, context) as flight:
+            return await flight.result()
+
+
+# DEFAULT REGISTRY
+_UNSET = object()
+_default_flights: Any = _UNSET
+
+
+def get_debate_flights() -> Optional[DebateFlights]:
+    """Return the process-wide registry (None when disabled via DEBATE_SINGLE_FLIGHT_DISABLED=1)."""
+    global _default_flights
+
+    if _default_flights is _UNSET:
+        if os.environ.get("DEBATE_SINGLE_FLIGHT_DISABLED") == "1":
+            _default_flights = None
+        else:
+            _default_flights = DebateFlights()
+
+    return _default_flights
+
+
+def set_debate_flights(flights: Optional[DebateFlights]) -> None:
+    """Swap the process-wide registry; pass None so every request runs its own debate."""
+    global _default_flights
+    _default_flights = flights
@@ -1,25 +1,29 @@
+import asyncio
+import hashlib
 import os
+from dataclasses import dataclass, replace
+from typing import Optional
+from urllib.parse import urlsplit
+
 import httpx
-from agents import function_tool
+from agents import RunContextWrapper, function_tool
 
+from .cache import cache_key, get_search_cache
+from .context import DebateContext
 
-@function_tool
-def search_startup_info(query: str, num_results: int = 8) -> str:
-    """Search web for startup info via Serper API (funding, competitors, news)."""
-    
-    response = httpx.post(
-        "https://google.serper.dev/search",
-        json={"q": query, "num": num_results},
-        headers={
-            "X-API-KEY": os.environ["SERPER_API_KEY"],
-            "Content-Type": "application/json"
-        },
-        timeout=10.0
-    )
-    response.raise_for_status()
-    
-    results = response.json().get("organic", [])
-    
+
+SERPER_URL = os.environ.get("SERPER_URL", "https://google.serper.dev/search")
+
+
+def _serper_headers() -> dict:
+    return {
+        "X-API-KEY": os.environ["SERPER_API_KEY"],
+        "Content-Type": "application/json"
+    }
+
+
+def format_search_results(query: str, results: list[dict]) -> str:
+    """Render Serper organic results as the text block the agents read."""
     formatted_results = "\n".join(
         f"{i}. {r.get('title', 'No title')}\n"
         f"   {r.get('link', '')}\n"
@@ -27,5 +31,166 @@ def search_startup_info(query: str, num_results: int = 8) -> str:
         f"   {r.get('date', '')}"
         for i, r in enumerate(results, 1)
     )
-    
+
     return f"Search: {query}\n{'='*50}\n\n{formatted_results}"
+
+
+def fingerprint(output: str) -> str:
+    """Short digest of a search output, to tell whether an agent's evidence has changed."""
+    return hashlib.sha256(output.encode()).hexdigest()[:16]
+
+
+@function_tool
+def search_startup_info(query: str, num_results: int = 8) -> str:
+    """Search web for startup info via Serper API (funding, competitors, news)."""
+
+    cache = get_search_cache()
+    key = cache_key(query, num_results)
+    results = cache.get(key) if cache is not None else None
+
+    if results is None:
+        response = httpx.post(
+            SERPER_URL,
+            json={"q": query, "num": num_results},
+            headers=_serper_headers(),
+            timeout=10.0
+        )
+        response.raise_for_status()
+        results = response.json().get("organic", [])
+        if cache is not None:
+            cache.set(key, results)
+
+    return format_search_results(query, results)
+
+
+# SHARED ASYNC CLIENT
+@dataclass(frozen=True)
+class SearchClientSettings:
+    """Connection pool settings for the shared async search client."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    per_host_limit: int = 8
+    http2: bool = True
+    timeout: float = 10.0
+
+
+_settings = SearchClientSettings()
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_limits: dict[str, asyncio.Semaphore] = {}
+
+
+def configure_search_client(**overrides) -> SearchClientSettings:
+    """Update pool settings. Must run before the first search or after close_search_client()."""
+    global _settings
+
+    if _client is not None:
+        raise RuntimeError("Search client already open - call close_search_client() first.")
+
+    _settings = replace(_settings, **overrides)
+    return _settings
+
+
+def get_search_client() -> httpx.AsyncClient:
+    """Return the long-lived AsyncClient for the running event loop, creating it on first use."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        # Connections and semaphores are bound to the loop that created them
+        _client = httpx.AsyncClient(
+            http2=_settings.http2,
+            timeout=_settings.timeout,
+            limits=httpx.Limits(
+                max_connections=_settings.max_connections,
+                max_keepalive_connections=_settings.max_keepalive_connections,
+                keepalive_expiry=_settings.keepalive_expiry
+            )
+        )
+        _client_loop = loop
+        _host_limits.clear()
+
+    return _client
+
+
+async def close_search_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client, _client_loop
+
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+
+    _client = None
+    _client_loop = None
+    _host_limits.clear()
+
+
+def _host_limit(url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc
+    if host not in _host_limits:
+        _host_limits[host] = asyncio.Semaphore(_settings.per_host_limit)
+    return _host_limits[host]
+
+
+async def fetch_search_results(query: str, num_results: int = 8) -> list[dict]:
+    """Run one Serper query over the pooled client and return the organic results."""
+    client = get_search_client()
+
+    async with _host_limit(SERPER_URL):
+        response = await client.post(
+            SERPER_URL,
+            json={"q": query, "num": num_results},
+            headers=_serper_headers()
+        )
+    response.raise_for_status()
+
+    return response.json().get("organic", [])
+
+
+async def search_results(query: str, num_results: int = 8) -> list[dict]:
+    """Cached search - repeated and concurrent queries for the same key share one Serper call."""
+    cache = get_search_cache()
+    if cache is None:
+        return await fetch_search_results(query, num_results)
+
+    return await cache.get_or_fetch(query, num_results, fetch_search_results)
+
+
+@function_tool(name_override="search_startup_info")
+async def search_startup_info_async(
+    ctx: RunContextWrapper[Optional[DebateContext]], query: str, num_results: int = 8
+) -> str:
+    """Search web for startup info via Serper API (funding, competitors, news)."""
+
+    context = ctx.context if isinstance(ctx.context, DebateContext) else DebateContext()
+    with context.span("search_startup_info", "search", query=query) as span:
+        async with context.search_slot():
+            results = await search_results(query, num_results)
+        span.set(results=len(results))
+    output = format_search_results(query, results)
+    context.record_search(query, num_results, fingerprint(output))
+    return output
+
+
+async def evidence_changed(evidence: Optional[list], context: Optional[DebateContext] = None) -> bool:
+    """
+    Re-run an agent's recorded searches (bypassing the cache, which is refreshed
+    with the new results) and report whether any output differs from its
+    fingerprint. Unrecorded evidence (None) counts as changed.
+    """
+    if evidence is None:
+        return True
+    context = context or DebateContext()
+    cache = get_search_cache()
+
+    async def current(query: str, num_results: int) -> str:
+        with context.span("evidence_check", "search", query=query):
+            async with context.search_slot():
+                results = await fetch_search_results(query, num_results)
+        if cache is not None:
+            await cache.aset(cache_key(query, num_results), results)
+        return fingerprint(format_search_results(query, results))
+
+    digests = await asyncio.gather(*(current(query, num_results) for query, num_results, _ in evidence))
+    return any(digest != old for digest, (_, _, old) in zip(digests, evidence))
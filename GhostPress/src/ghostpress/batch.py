@@ -0,0 +1,162 @@
+import asyncio
+import csv
+import hashlib
+import json
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ghostpress.crew import Ghostpress
+
+
+TOPIC_KEYS = ("topic", "title", "name")
+
+
+def slugify(topic: str) -> str:
+    """Filesystem-safe directory name for a topic."""
+    slug = re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")
+    return slug[:80] or "topic"
+
+
+def topic_dirs(topics: Iterable[str], output_root: str | Path) -> Dict[str, Path]:
+    """
+    Output directory for each topic, in input order. Topics whose slugs collide
+    ("AI & ML", "AI/ML") get a short hash of the topic appended, so every topic
+    has its own directory. Topics differing only in case count as one.
+    """
+    output_root = Path(output_root)
+    dirs: Dict[str, Path] = {}
+    seen, used = set(), set()
+    for topic in topics:
+        if topic.lower() in seen:
+            continue
+        seen.add(topic.lower())
+        name = slugify(topic)
+        if name in used:
+            name = f"{name}-{hashlib.sha1(topic.lower().encode()).hexdigest()[:8]}"
+        used.add(name)
+        dirs[topic] = output_root / name
+    return dirs
+
+
+def load_topics(path: str | Path) -> List[str]:
+    """
+    Read topics from a text, CSV or JSONL file.
+
+    TXT: one topic per line. CSV: a `topic`/`title`/`name` column, else the first
+    column. JSONL: objects with one of those keys, or bare JSON strings; any
+    other row raises ValueError. Blank lines and duplicates are dropped, keeping
+    input order.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    topics = []
+
+    if suffix in (".jsonl", ".ndjson"):
+        with path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if isinstance(record, str):
+                    topics.append(record)
+                    continue
+                topic = next((record[k] for k in TOPIC_KEYS if isinstance(record, dict) and record.get(k)), None)
+                if not isinstance(topic, str):
+                    raise ValueError(f"{path}:{line_no}: no topic (expected one of {', '.join(TOPIC_KEYS)})")
+                topics.append(topic)
+    elif suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        if rows:
+            header = [h.strip().lower() for h in rows[0]]
+            column = next((header.index(k) for k in TOPIC_KEYS if k in header), None)
+            if column is None:
+                column, body = 0, rows
+            else:
+                body = rows[1:]
+            topics.extend(row[column] for row in body if len(row) > column)
+    else:
+        topics = path.read_text(encoding="utf-8").splitlines()
+
+    seen = set()
+    unique = []
+    for topic in (t.strip() for t in topics):
+        if topic and topic.lower() not in seen:
+            seen.add(topic.lower())
+            unique.append(topic)
+    return unique
+
+
+async def _run_topic(
+    topic: str,
+    output_dir: Path,
+    process: str,
+    max_workers: Optional[int],
+    refresh_research: bool,
+    stream: bool
+) -> None:
+    inputs = {
+        'topic': topic,
+        'current_year': str(datetime.now().year),
+        'output_dir': str(output_dir)
+    }
+    kwargs = {"max_workers": max_workers} if max_workers else {}
+    await asyncio.to_thread(
+        Ghostpress().run, inputs, process=process, refresh_research=refresh_research, stream=stream, **kwargs
+    )
+
+
+async def run_topics(
+    topics: Iterable[str],
+    output_root: str | Path = "output",
+    concurrency: int = 4,
+    process: str = "sequential",
+    max_workers: Optional[int] = None,
+    refresh_research: bool = False,
+    stream: bool = False
+) -> dict:
+    """
+    Run one crew per topic, at most `concurrency` at a time.
+
+    Each topic writes blog_post.md and email_campaign.md under
+    `<output_root>/<topic-slug>/` (see topic_dirs). `process` is "sequential" or "dag" (see
+    Ghostpress.kickoff_dag; `max_workers` is its per-crew pool size).
+    Cached research briefs are reused unless `refresh_research` is set; `stream`
+    writes each post and email to `<file>.partial` as tokens arrive.
+
+    Returns a summary with per-topic status and duration, also written to
+    `<output_root>/batch_summary.json`.
+    """
+    output_root = Path(output_root)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = []
+
+    async def one(topic: str, output_dir: Path) -> None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        async with semaphore:
+            t0 = time.perf_counter()
+            record = {"topic": topic, "output_dir": str(output_dir)}
+            try:
+                await _run_topic(topic, output_dir, process, max_workers, refresh_research, stream)
+                record["status"] = "completed"
+            except Exception as e:
+                record["status"] = "failed"
+                record["error"] = f"{type(e).__name__}: {e}"
+            record["duration_s"] = round(time.perf_counter() - t0, 3)
+            results.append(record)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(topic, output_dir) for topic, output_dir in topic_dirs(topics, output_root).items()))
+
+    summary = {
+        "completed": sum(r["status"] == "completed" for r in results),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "topics": results
+    }
+    output_root.mkdir(parents=True, exist_ok=True)
+    (output_root / "batch_summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
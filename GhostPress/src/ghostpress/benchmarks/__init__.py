@@ -0,0 +1 @@
+"""Startup-time benchmarks for the GhostPress CLI."""
@@ -0,0 +1,168 @@
+"""
+Cold-start benchmark for the GhostPress CLI.
+
+    cd GhostPress
+    python -m ghostpress.benchmarks.startup --runs 5
+    python -m ghostpress.benchmarks.startup --compare benchmarks/results/startup-<old>.json
+
+Each stage runs in a fresh interpreter under `python -X importtime`:
+
+- cli: `import ghostpress.main` (what every `ghostpress`/`run_crew` call pays first)
+- crew: building `Ghostpress()` (crewai import plus agents/tasks config)
+- tools: importing the agent tools (crewai_tools, sendgrid, httpx)
+
+Reports median wall time and import time per stage and the slowest imports, writes
+the numbers to JSON (benchmarks/results/ under the working directory, git-ignored,
+or --output), and appends a line to startup_history.jsonl next to it so cold-start
+time can be tracked across commits.
+"""
+import argparse
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+
+# Under the working directory (the project root), never inside the installed package
+RESULTS_DIR = Path("benchmarks") / "results"
+
+STAGES = {
+    "cli": "import ghostpress.main",
+    "crew": "from ghostpress.crew import Ghostpress; Ghostpress()",
+    "tools": "from ghostpress.tools import CachedSerperDevTool, SendEmailTool",
+}
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """`-X importtime` lines as dicts (self/cumulative microseconds, nesting depth, module)."""
+    imports = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2
+            })
+    return imports
+
+
+def run_stage(code: str) -> dict:
+    """Run `code` in a fresh interpreter; wall time plus parsed import timings."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"`{code}` failed:\n{proc.stderr[-2000:]}")
+    imports = parse_importtime(proc.stderr)
+    return {
+        "wall_s": wall,
+        "import_s": sum(i["cumulative_us"] for i in imports if i["depth"] == 0) / 1e6,
+        "imports": imports
+    }
+
+
+def run_benchmark(runs: int = 5, top: int = 15, stages: Optional[list[str]] = None) -> dict:
+    """
+    Median wall and import time per stage over `runs` fresh interpreters.
+
+    One warm-up run per stage fills the bytecode and config caches first, so the
+    numbers reflect a scheduled job on an installed checkout rather than a first run.
+    """
+    results = {}
+    for stage in stages or list(STAGES):
+        code = STAGES[stage]
+        run_stage(code)
+        samples = [run_stage(code) for _ in range(runs)]
+        # Top-level imports and their direct children, so one big package doesn't hide the rest
+        slowest = sorted(
+            (i for i in samples[-1]["imports"] if i["depth"] <= 1),
+            key=lambda i: i["cumulative_us"], reverse=True
+        )[:top]
+        results[stage] = {
+            "wall_s": round(statistics.median(s["wall_s"] for s in samples), 4),
+            "import_s": round(statistics.median(s["import_s"] for s in samples), 4),
+            "modules": len(samples[-1]["imports"]),
+            "slowest_imports": [
+                {"module": i["module"], "cumulative_ms": round(i["cumulative_us"] / 1000, 1)} for i in slowest
+            ]
+        }
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print wall/import time deltas against a previous results file."""
+    print(f"\nvs {baseline['meta']['revision']} ({baseline['meta']['timestamp']})")
+    for stage, stats in current["results"].items():
+        old = baseline["results"].get(stage)
+        if not old:
+            continue
+        for label in ("wall_s", "import_s"):
+            change = (stats[label] - old[label]) / old[label] if old[label] else 0.0
+            print(f"  {stage:<8}{label:<10}{old[label]:>9.3f} -> {stats[label]:>9.3f} ({change:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GhostPress CLI cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per stage")
+    parser.add_argument("--stages", type=str, default=",".join(STAGES), help="Comma-separated stages")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list per stage")
+    parser.add_argument("--output", type=str, help="Results JSON (default: benchmarks/results/startup-<rev>.json)")
+    parser.add_argument("--compare", type=str, help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.runs, args.top, args.stages.split(","))
+    revision = _git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "runs": args.runs
+        },
+        "results": results
+    }
+
+    for stage, stats in results.items():
+        print(f"\n{stage}: wall {stats['wall_s']:.3f}s  imports {stats['import_s']:.3f}s  ({stats['modules']} modules)")
+        for item in stats["slowest_imports"][:5]:
+            print(f"  {item['cumulative_ms']:>8.1f} ms  {item['module']}")
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"startup-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    with (output.parent / "startup_history.jsonl").open("a", encoding="utf-8") as history:
+        history.write(json.dumps({
+            **report["meta"],
+            **{f"{stage}_wall_s": stats["wall_s"] for stage, stats in results.items()}
+        }) + "\n")
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get("GHOSTPRESS_CACHE_PATH", Path(__file__).parents[2] / ".cache" / "ghostpress_cache.sqlite")
+)
+
+# Research briefs go stale slower than raw search results
+BRIEF_TTL = float(os.environ.get("GHOSTPRESS_BRIEF_TTL", 7 * 24 * 3600))
+SEARCH_TTL = float(os.environ.get("GHOSTPRESS_SEARCH_TTL", 24 * 3600))
+
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so near-identical topics share a key."""
+    topic = re.sub(r"[^\w\s]", " ", topic.lower())
+    return " ".join(topic.split())
+
+
+def make_key(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class TTLCache:
+    """
+    SQLite-backed key/value cache with a per-entry TTL and LRU eviction.
+
+    Several caches can share one file; each uses its own `namespace` table.
+    Safe to use from the worker threads crews run on.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl: float = SEARCH_TTL,
+        max_entries: int = 1000
+    ):
+        if not re.fullmatch(r"\w+", namespace):
+            raise ValueError(f"Invalid cache namespace {namespace!r}")
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {namespace} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(f"CREATE INDEX IF NOT EXISTS idx_{namespace}_accessed ON {namespace}(accessed_at)")
+        self._db.commit()
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT value, expires_at FROM {self.namespace} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._db.execute(f"DELETE FROM {self.namespace} WHERE key = ?", (key,))
+                    self._db.commit()
+                self.misses += 1
+                return None
+            self._db.execute(f"UPDATE {self.namespace} SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.namespace} VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl, now)
+            )
+            # Drop expired rows, then the least recently used beyond the size bound
+            self._db.execute(f"DELETE FROM {self.namespace} WHERE expires_at < ?", (now,))
+            self._db.execute(
+                f"DELETE FROM {self.namespace} WHERE key IN ("
+                f"SELECT key FROM {self.namespace} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute(f"DELETE FROM {self.namespace} WHERE key = ?", (key,))
+            self._db.commit()
+
+
+_caches: dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(namespace: str, ttl: float, max_entries: int) -> Optional[TTLCache]:
+    """Shared cache per namespace; None when GHOSTPRESS_CACHE_DISABLED is set."""
+    if os.environ.get("GHOSTPRESS_CACHE_DISABLED"):
+        return None
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = TTLCache(namespace, ttl=ttl, max_entries=max_entries)
+        return _caches[namespace]
+
+
+def brief_cache() -> Optional[TTLCache]:
+    return get_cache("research_briefs", BRIEF_TTL, 200)
+
+
+def search_cache() -> Optional[TTLCache]:
+    return get_cache("serper_search", SEARCH_TTL, 5000)
+
+
+def brief_key(topic: str, current_year: str) -> str:
+    return make_key(normalize_topic(topic), str(current_year))
@@ -0,0 +1,89 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+from ghostpress.cache import DEFAULT_CACHE_PATH
+
+
+CONFIG_CACHE_DIR = DEFAULT_CACHE_PATH.parent / "config"
+
+REQUIRED_KEYS = {
+    "agents.yaml": ("role", "goal", "backstory"),
+    "tasks.yaml": ("description", "expected_output"),
+}
+
+# Parsed configs by resolved path: (mtime_ns, size, data)
+_parsed: Dict[str, Tuple[int, int, dict]] = {}
+_parsed_lock = threading.Lock()
+
+
+def validate_config(path: Path, data: dict) -> dict:
+    """Check every agent/task entry has the keys crewai needs; raise ValueError naming the gaps."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must be a mapping of names to entries")
+    required = REQUIRED_KEYS.get(path.name, ())
+    for name, entry in data.items():
+        missing = [key for key in required if not (isinstance(entry, dict) and entry.get(key))]
+        if missing:
+            raise ValueError(f"{path.name}: '{name}' is missing {', '.join(missing)}")
+    if path.name == "tasks.yaml":
+        for name, entry in data.items():
+            unknown = [c for c in entry.get("context", []) if c not in data]
+            if unknown:
+                raise ValueError(f"tasks.yaml: '{name}' has unknown context {unknown}")
+    return data
+
+
+def _disk_cache_path(path: Path) -> Path:
+    return CONFIG_CACHE_DIR / f"{hashlib.sha256(str(path).encode()).hexdigest()[:16]}.json"
+
+
+def load_yaml_cached(config_path: Path) -> dict:
+    """
+    Parsed and validated YAML config, cached on the file's mtime and size.
+
+    Hits come from memory first, then from a JSON copy under .cache/config, so a
+    fresh process only imports PyYAML and re-parses when the file changed.
+    Callers get their own copy, since CrewBase swaps names for objects in place.
+    """
+    path = Path(config_path).resolve()
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _parsed_lock:
+        cached = _parsed.get(str(path))
+    if cached is not None and cached[:2] == version:
+        return copy.deepcopy(cached[2])
+
+    disk_path = _disk_cache_path(path)
+    data = None
+    if not os.environ.get("GHOSTPRESS_CACHE_DISABLED"):
+        try:
+            stored = json.loads(disk_path.read_text(encoding="utf-8"))
+            if (stored["mtime_ns"], stored["size"]) == version:
+                data = stored["data"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if data is None:
+        import yaml
+
+        with path.open(encoding="utf-8") as f:
+            data = validate_config(path, yaml.safe_load(f) or {})
+        if not os.environ.get("GHOSTPRESS_CACHE_DISABLED"):
+            try:
+                disk_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = disk_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps({"mtime_ns": version[0], "size": version[1], "data": data}), encoding="utf-8")
+                os.replace(tmp, disk_path)
+            except (OSError, TypeError):
+                # Unwritable cache dir or non-JSON YAML values: the parse result is still good
+                pass
+
+    with _parsed_lock:
+        _parsed[str(path)] = (*version, data)
+    return copy.deepcopy(data)
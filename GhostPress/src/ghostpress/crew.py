@@ -1,10 +1,14 @@
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, CrewOutput, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from crewai_tools import SerperDevTool
-from typing import List
+from crewai.tasks.task_output import TaskOutput
+from pathlib import Path
+from typing import List, Optional, Union
 
-from ghostpress.tools import SendEmailTool
+from ghostpress.cache import brief_cache, brief_key
+from ghostpress.config import load_yaml_cached
+from ghostpress.dag import DEFAULT_MAX_WORKERS, DagResult, kickoff_dag
+from ghostpress.streaming import ChunkCallback, enable_streaming, stream_task
 
 
 @CrewBase
@@ -13,20 +17,34 @@ class Ghostpress():
     The Syndicate Crew - 4-Agent Content Creation Pipeline
     
     Sequential Process:
-    1. Insight Researcher -> Research Brief
+    1. Insight Researcher -> Research Brief + Keyword Brief
     2. Content Architect -> Structured Outline
     3. Creative Storyteller -> Blog Post
     4. Delivery Specialist -> Email Campaign
+
+    DAG Process (kickoff_dag): tasks start as soon as their `context` is done,
+    so the research and keyword briefs are gathered concurrently.
+
+    run() reuses a cached research brief for the same topic and year.
     """
 
     agents: List[BaseAgent]
     tasks: List[Task]
 
+    # Tasks whose outputs make up the cached research brief
+    research_tasks = ('research_task', 'keyword_task')
+
+    # Output files (under the `output_dir` input) that can be streamed as tokens arrive
+    output_files = {'writing_task': 'blog_post.md', 'email_task': 'email_campaign.md'}
+
     @agent
     def insight_researcher(self) -> Agent:
+        # Tool dependencies (crewai_tools, sendgrid, httpx) load only when the agent is built
+        from ghostpress.tools import CachedSerperDevTool
+
         return Agent(
             config=self.agents_config['insight_researcher'],
-            tools=[SerperDevTool()], 
+            tools=[CachedSerperDevTool()], 
             verbose=True
         )
 
@@ -46,6 +64,8 @@ class Ghostpress():
 
     @agent
     def delivery_specialist(self) -> Agent:
+        from ghostpress.tools import SendEmailTool
+
         return Agent(
             config=self.agents_config['delivery_specialist'],
             tools=[SendEmailTool()], 
@@ -58,6 +78,12 @@ class Ghostpress():
             config=self.tasks_config['research_task'],
         )
 
+    @task
+    def keyword_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['keyword_task'],
+        )
+
     @task
     def outline_task(self) -> Task:
         return Task(
@@ -68,14 +94,14 @@ class Ghostpress():
     def writing_task(self) -> Task:
         return Task(
             config=self.tasks_config['writing_task'],
-            output_file='output/blog_post.md'
+            output_file=f"{{output_dir}}/{self.output_files['writing_task']}"
         )
 
     @task
     def email_task(self) -> Task:
         return Task(
             config=self.tasks_config['email_task'],
-            output_file='output/email_campaign.md' 
+            output_file=f"{{output_dir}}/{self.output_files['email_task']}"
         )
 
     @crew
@@ -86,3 +112,75 @@ class Ghostpress():
             process=Process.sequential,
             verbose=True,
         )
+
+    def kickoff_dag(self, inputs: dict, max_workers: int = DEFAULT_MAX_WORKERS) -> DagResult:
+        """Run the crew as a dependency graph with up to `max_workers` tasks at once."""
+        return kickoff_dag(self.crew(), inputs, max_workers)
+
+    def run(
+        self,
+        inputs: dict,
+        process: str = 'sequential',
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        refresh_research: bool = False,
+        stream: bool = False,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> Union[CrewOutput, DagResult]:
+        """
+        Kick off the crew, reusing the research brief cached for this topic and year.
+
+        On a cache hit the research tasks are skipped and their stored outputs feed
+        outline_task directly. `refresh_research` forces a fresh brief. `process`
+        is 'sequential' or 'dag' (see kickoff_dag).
+
+        With `stream`, the blog post and email tokens are written to
+        `<file>.partial` (and passed to `on_chunk`) as they arrive; the final
+        files are renamed into place when each task completes.
+        """
+        cache = brief_cache()
+        key = brief_key(inputs['topic'], inputs['current_year'])
+        research = {name: getattr(self, name)() for name in self.research_tasks}
+        brief = None if refresh_research or cache is None else cache.get(key)
+        reused = bool(brief) and all(name in brief for name in research)
+
+        crew = self.crew()
+        if reused:
+            for name, research_task in research.items():
+                research_task.output = TaskOutput(
+                    description=research_task.description,
+                    name=name,
+                    raw=brief[name],
+                    agent=research_task.agent.role
+                )
+            skipped = {id(t) for t in research.values()}
+            crew = Crew(
+                agents=self.agents,
+                tasks=[t for t in self.tasks if id(t) not in skipped],
+                process=Process.sequential,
+                verbose=True,
+            )
+
+        sinks = []
+        if stream:
+            output_dir = Path(inputs.get('output_dir', 'output'))
+            for name, filename in self.output_files.items():
+                output_task = getattr(self, name)()
+                enable_streaming(output_task.agent)
+                sinks.append(stream_task(output_task, name, output_dir / filename, [on_chunk] if on_chunk else []))
+
+        try:
+            if process == 'dag':
+                result = kickoff_dag(crew, inputs, max_workers)
+            else:
+                result = crew.kickoff(inputs=inputs)
+        finally:
+            for sink in sinks:
+                sink.release()
+
+        if cache is not None and not reused and all(t.output is not None for t in research.values()):
+            cache.set(key, {name: t.output.raw for name, t in research.items()})
+        return result
+
+
+# CrewBase re-reads both YAML files for every instance; serve them from the mtime-keyed cache
+Ghostpress.load_yaml = staticmethod(load_yaml_cached)
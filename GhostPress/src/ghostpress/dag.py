@@ -0,0 +1,126 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from crewai import Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
+
+
+# Tasks that may run at once in DAG mode
+DEFAULT_MAX_WORKERS = int(os.environ.get("GHOSTPRESS_MAX_WORKERS", "4"))
+
+
+@dataclass
+class DagResult:
+    """Outputs of a DAG run, keyed by task name, plus per-task and total timings."""
+    outputs: Dict[str, TaskOutput]
+    final_task: str
+    durations: Dict[str, float] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+    @property
+    def raw(self) -> str:
+        return self.outputs[self.final_task].raw
+
+    def __str__(self) -> str:
+        return self.raw
+
+
+def task_name(task: Task) -> str:
+    return task.name or task.description.strip().splitlines()[0][:40]
+
+
+def dependency_graph(tasks: List[Task]) -> Dict[str, List[str]]:
+    """
+    Task name -> names of the tasks it reads, from each task's `context` in tasks.yaml.
+
+    Context tasks outside the crew that already have an output (e.g. a cached
+    research brief) count as done. Raises ValueError on other unknown
+    dependencies or on cycles.
+    """
+    names = {id(task): task_name(task) for task in tasks}
+    graph = {}
+    for task in tasks:
+        context = [
+            t for t in (task.context if isinstance(task.context, list) else [])
+            if id(t) in names or t.output is None
+        ]
+        missing = [t for t in context if id(t) not in names]
+        if missing:
+            raise ValueError(f"{task_name(task)} depends on tasks outside this crew: {[task_name(t) for t in missing]}")
+        graph[names[id(task)]] = [names[id(t)] for t in context]
+
+    # Kahn's algorithm, only to reject cycles up front
+    remaining = {name: set(deps) for name, deps in graph.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between tasks: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return graph
+
+
+def _run_task(crew: Crew, task: Task, inputs: dict) -> TaskOutput:
+    """
+    Run one task as a single-task crew so inputs, tools and output_file are handled as usual.
+
+    The task reads its upstream results through `task.context`, which are already
+    finished by the time it is scheduled.
+    """
+    Crew(
+        agents=[task.agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=crew.verbose,
+    ).kickoff(inputs=inputs)
+    return task.output
+
+
+def kickoff_dag(crew: Crew, inputs: dict, max_workers: int = DEFAULT_MAX_WORKERS) -> DagResult:
+    """
+    Run the crew's tasks as a dependency graph instead of one after another.
+
+    - A task starts as soon as every task in its `context` has finished
+    - Independent tasks (e.g. research_task and keyword_task) run concurrently
+    - At most `max_workers` tasks run at once
+    - Tasks that run concurrently on the same agent each get their own copy of it
+    """
+    tasks = {task_name(task): task for task in crew.tasks}
+    graph = dependency_graph(crew.tasks)
+    done: Dict[str, TaskOutput] = {}
+    durations: Dict[str, float] = {}
+    running: Dict[Future, str] = {}
+    started_at: Dict[str, float] = {}
+    busy_agents = set()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while len(done) < len(tasks):
+            for name, deps in graph.items():
+                if name in done or name in running.values() or not all(d in done for d in deps):
+                    continue
+                task = tasks[name]
+                if id(task.agent) in busy_agents:
+                    task.agent = task.agent.copy()
+                busy_agents.add(id(task.agent))
+                started_at[name] = time.perf_counter()
+                running[pool.submit(_run_task, crew, task, inputs)] = name
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                done[name] = future.result()
+                durations[name] = round(time.perf_counter() - started_at[name], 3)
+                busy_agents.discard(id(tasks[name].agent))
+
+    return DagResult(
+        outputs=done,
+        final_task=task_name(crew.tasks[-1]),
+        durations=durations,
+        elapsed_s=round(time.perf_counter() - started, 3)
+    )
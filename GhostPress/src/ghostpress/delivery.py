@@ -0,0 +1,354 @@
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import httpx
+from sendgrid.helpers.mail import Content, Email, Mail, Personalization, To
+
+from ghostpress.cache import DEFAULT_CACHE_PATH
+
+
+SENDGRID_API_URL = os.environ.get("SENDGRID_API_URL", "https://api.sendgrid.com")
+DEFAULT_OUTBOX_PATH = Path(os.environ.get("GHOSTPRESS_OUTBOX_PATH", DEFAULT_CACHE_PATH.with_name("outbox.sqlite")))
+
+# SendGrid accepts at most 1000 personalizations per request
+MAX_PERSONALIZATIONS = 1000
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class DeliveryError(Exception):
+    """A mail could not be delivered; `queued` is True when it was kept in the outbox for retry."""
+
+    def __init__(self, message: str, status: Optional[int] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.queued = False
+
+
+@dataclass
+class EmailMessage:
+    """One campaign: the same subject and HTML body sent to every recipient separately."""
+    subject: str
+    html_body: str
+    recipients: List[str]
+    from_email: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    def batches(self) -> Iterable[List[str]]:
+        for i in range(0, len(self.recipients), MAX_PERSONALIZATIONS):
+            yield self.recipients[i:i + MAX_PERSONALIZATIONS]
+
+    def payload(self, recipients: List[str]) -> dict:
+        """SendGrid v3 body with one personalization per recipient, so nobody sees the others."""
+        mail = Mail(from_email=Email(self.from_email), subject=self.subject)
+        mail.add_content(Content("text/html", self.html_body))
+        for recipient in recipients:
+            personalization = Personalization()
+            personalization.add_to(To(recipient))
+            mail.add_personalization(personalization)
+        return mail.get()
+
+
+class Outbox:
+    """
+    SQLite queue of mails that are not delivered yet.
+
+    Messages are written before the first attempt and shrink as batches go out,
+    so a crash or an exhausted retry budget leaves exactly the unsent recipients.
+    `attempts` counts failed sends; flush() skips messages that reached its cap.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_OUTBOX_PATH):
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id TEXT PRIMARY KEY, message TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "last_error TEXT, queued_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def put(self, message: EmailMessage) -> None:
+        """Queue a message; one already queued (a retry) keeps its stored recipients and attempts."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO outbox (id, message, queued_at) VALUES (?, ?, ?)",
+                (message.id, json.dumps(asdict(message)), time.time())
+            )
+            self._db.commit()
+
+    def update(self, message: EmailMessage, error: Optional[str] = None) -> None:
+        """Store the remaining recipients (and the last error) for a queued message."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET message = ?, attempts = attempts + ?, last_error = COALESCE(?, last_error) WHERE id = ?",
+                (json.dumps(asdict(message)), 1 if error else 0, error, message.id)
+            )
+            self._db.commit()
+
+    def remove(self, message_id: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM outbox WHERE id = ?", (message_id,))
+            self._db.commit()
+
+    def pending(self, max_attempts: Optional[int] = None) -> List[EmailMessage]:
+        """Queued messages, oldest first; with `max_attempts`, only those that failed fewer times."""
+        with self._lock:
+            if max_attempts is None:
+                rows = self._db.execute("SELECT message FROM outbox ORDER BY queued_at").fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT message FROM outbox WHERE attempts < ? ORDER BY queued_at", (max_attempts,)
+                ).fetchall()
+        return [EmailMessage(**json.loads(row[0])) for row in rows]
+
+    def exhausted(self, max_attempts: int) -> int:
+        """Messages kept for inspection after failing `max_attempts` times."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE attempts >= ?", (max_attempts,)).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+
+class EmailDelivery:
+    """
+    SendGrid delivery over pooled HTTP clients.
+
+    - One shared sync client and one async client per event loop, reused across sends
+    - Recipients are batched into personalizations (up to 1000 per request)
+    - 429/5xx and transport errors are retried with exponential backoff and jitter,
+      honouring Retry-After; other 4xx fail immediately and are not queued
+    - Mail that ran out of retries stays in the outbox until flush() / flush_async();
+      after `max_attempts` failed sends it is left there and no longer retried
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = SENDGRID_API_URL,
+        outbox: Optional[Outbox] = None,
+        max_retries: int = 4,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        timeout: float = 10.0
+    ):
+        self.api_key = api_key or os.environ.get("SENDGRID_API_KEY")
+        self.base_url = base_url.rstrip("/")
+        self.outbox = outbox if outbox is not None else Outbox()
+        self.max_retries = max_retries
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _headers(self) -> dict:
+        if not self.api_key:
+            raise DeliveryError("SENDGRID_API_KEY is not set")
+        return {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
+
+    @property
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout, limits=self._limits)
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        # An AsyncClient's pool is bound to the loop that first used it
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=self._limits)
+            self._async_loop = loop
+        return self._async_client
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return min(self.backoff * 2 ** attempt, self.max_backoff) * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _outcome(response: Optional[httpx.Response], error: Optional[Exception]) -> tuple[bool, bool, str]:
+        """(delivered, retryable, description) for one attempt."""
+        if error is not None:
+            return False, True, f"{type(error).__name__}: {error}"
+        if response.status_code < 300:
+            return True, False, ""
+        return False, response.status_code in RETRY_STATUSES, f"HTTP {response.status_code}: {response.text[:200]}"
+
+    def _send_batch(self, message: EmailMessage, recipients: List[str]) -> None:
+        payload = message.payload(recipients)
+        for attempt in range(self.max_retries + 1):
+            response, error = None, None
+            try:
+                response = self.client().post("/v3/mail/send", json=payload, headers=self._headers)
+            except httpx.TransportError as e:
+                error = e
+            delivered, retryable, description = self._outcome(response, error)
+            if delivered:
+                return
+            if not retryable or attempt == self.max_retries:
+                raise DeliveryError(description, response.status_code if response is not None else None, retryable)
+            time.sleep(self._delay(attempt, response))
+
+    async def _send_batch_async(self, message: EmailMessage, recipients: List[str]) -> None:
+        payload = message.payload(recipients)
+        for attempt in range(self.max_retries + 1):
+            response, error = None, None
+            try:
+                response = await self.async_client().post("/v3/mail/send", json=payload, headers=self._headers)
+            except httpx.TransportError as e:
+                error = e
+            delivered, retryable, description = self._outcome(response, error)
+            if delivered:
+                return
+            if not retryable or attempt == self.max_retries:
+                raise DeliveryError(description, response.status_code if response is not None else None, retryable)
+            await asyncio.sleep(self._delay(attempt, response))
+
+    def _batch_failed(self, message: EmailMessage, error: DeliveryError) -> DeliveryError:
+        """Keep the unsent recipients queued after retryable failures; drop mail SendGrid rejected."""
+        if error.retryable:
+            self.outbox.update(message, str(error))
+            error.queued = True
+        else:
+            self.outbox.remove(message.id)
+        return error
+
+    def _batch_sent(self, message: EmailMessage, batch: List[str]) -> None:
+        """Drop a delivered batch from the queued copy, so a crash later doesn't re-send it."""
+        message.recipients = message.recipients[len(batch):]
+        if message.recipients:
+            self.outbox.update(message)
+
+    def send(self, message: EmailMessage) -> int:
+        """Deliver a message, batch by batch. Returns recipients sent; raises DeliveryError (mail kept in outbox)."""
+        self.outbox.put(message)
+        queued = replace(message)
+        sent = 0
+        for batch in list(queued.batches()):
+            try:
+                self._send_batch(queued, batch)
+            except DeliveryError as e:
+                raise self._batch_failed(queued, e) from None
+            self._batch_sent(queued, batch)
+            sent += len(batch)
+        self.outbox.remove(message.id)
+        return sent
+
+    async def send_async(self, message: EmailMessage) -> int:
+        """
+        Async version of send(); batches go out one after another on the shared
+        async client, and the outbox writes run in a thread.
+        """
+        await asyncio.to_thread(self.outbox.put, message)
+        queued = replace(message)
+        sent = 0
+        for batch in list(queued.batches()):
+            try:
+                await self._send_batch_async(queued, batch)
+            except DeliveryError as e:
+                raise await asyncio.to_thread(self._batch_failed, queued, e) from None
+            await asyncio.to_thread(self._batch_sent, queued, batch)
+            sent += len(batch)
+        await asyncio.to_thread(self.outbox.remove, message.id)
+        return sent
+
+    def flush(self) -> dict:
+        """
+        Retry the outbox, skipping messages that already failed `max_attempts` times.
+        Returns delivered/failed counts and how many messages are at the cap.
+        """
+        summary = {"delivered": 0, "failed": 0}
+        for message in self.outbox.pending(self.max_attempts):
+            try:
+                self.send(message)
+                summary["delivered"] += 1
+            except DeliveryError:
+                summary["failed"] += 1
+        summary["exhausted"] = self.outbox.exhausted(self.max_attempts)
+        return summary
+
+    async def flush_async(self, concurrency: int = 4) -> dict:
+        summary = {"delivered": 0, "failed": 0}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(message: EmailMessage) -> None:
+            async with semaphore:
+                try:
+                    await self.send_async(message)
+                    summary["delivered"] += 1
+                except DeliveryError:
+                    summary["failed"] += 1
+
+        pending = await asyncio.to_thread(self.outbox.pending, self.max_attempts)
+        await asyncio.gather(*(one(m) for m in pending))
+        summary["exhausted"] = await asyncio.to_thread(self.outbox.exhausted, self.max_attempts)
+        return summary
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+
+_delivery: Optional[EmailDelivery] = None
+_delivery_lock = threading.Lock()
+
+
+def get_delivery() -> EmailDelivery:
+    """Process-wide delivery instance shared by every SendEmailTool."""
+    global _delivery
+    with _delivery_lock:
+        if _delivery is None:
+            _delivery = EmailDelivery()
+        return _delivery
+
+
+def set_delivery(delivery: Optional[EmailDelivery]) -> None:
+    """Swap the shared instance, e.g. for one pointed at a local SendGrid stand-in."""
+    global _delivery
+    with _delivery_lock:
+        _delivery = delivery
+
+
+def configured_message(subject: str, html_body: str) -> EmailMessage:
+    """Message from SENDGRID_FROM_EMAIL to the comma-separated SENDGRID_TO_EMAIL list."""
+    from_email = os.environ.get("SENDGRID_FROM_EMAIL")
+    recipients = [r.strip() for r in os.environ.get("SENDGRID_TO_EMAIL", "").split(",") if r.strip()]
+    if not from_email or not recipients:
+        raise DeliveryError("SENDGRID_FROM_EMAIL and SENDGRID_TO_EMAIL must be set")
+    return EmailMessage(subject=subject, html_body=html_body, recipients=recipients, from_email=from_email)
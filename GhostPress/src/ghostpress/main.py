@@ -1,22 +1,111 @@
 #!/usr/bin/env python
+import argparse
+import os
 import warnings
 from datetime import datetime
 
-from ghostpress.crew import Ghostpress
-
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
 
+def _retry_outbox() -> None:
+    """Retry mail a previous run left in the outbox before sending anything new."""
+    from ghostpress.delivery import get_delivery
+
+    delivery = get_delivery()
+    # Without a key every send fails permanently, which would drop the queued mail
+    if delivery.api_key and len(delivery.outbox):
+        flush()
+
+
+def flush():
+    """Retry mail kept in the outbox after failed sends (see ghostpress.delivery)."""
+    from ghostpress.delivery import get_delivery
+
+    delivery = get_delivery()
+    pending = len(delivery.outbox)
+    summary = delivery.flush()
+    print(
+        f"Outbox: {pending} queued, {summary['delivered']} delivered, {summary['failed']} still failing, "
+        f"{summary['exhausted']} given up after {delivery.max_attempts} attempts"
+    )
+    return summary
+
+
 def run():
-    """Run the Syndicate crew to create content and send email campaign."""
+    """
+    Run the Syndicate crew to create content and send email campaign.
+
+    Set GHOSTPRESS_PROCESS=dag to run independent tasks concurrently
+    (pool size from GHOSTPRESS_MAX_WORKERS), and GHOSTPRESS_REFRESH_RESEARCH=1
+    to ignore a cached research brief. GHOSTPRESS_STREAM=1 streams the blog post
+    and email to `output/*.partial` as they are written; GHOSTPRESS_SSE_PORT also
+    serves the tokens as Server-Sent Events. Mail left in the outbox by an
+    earlier run is retried first.
+    """
     inputs = {
         'topic': 'LiDar Technology in Autonomous Vehicles',
-        'current_year': str(datetime.now().year)
+        'current_year': str(datetime.now().year),
+        'output_dir': 'output'
     }
 
-    result = Ghostpress().crew().kickoff(inputs=inputs)
+    # Imported on call so loading ghostpress.main (and run_batch --help) doesn't pull in crewai
+    from ghostpress.crew import Ghostpress
+    from ghostpress.streaming import SSEBroadcaster
+
+    _retry_outbox()
+    process = os.environ.get("GHOSTPRESS_PROCESS", "sequential")
+    stream = bool(os.environ.get("GHOSTPRESS_STREAM")) or bool(os.environ.get("GHOSTPRESS_SSE_PORT"))
+    sse = None
+    if os.environ.get("GHOSTPRESS_SSE_PORT"):
+        sse = SSEBroadcaster(port=int(os.environ["GHOSTPRESS_SSE_PORT"])).start()
+        print(f"Streaming tokens at {sse.url}")
+
+    try:
+        result = Ghostpress().run(
+            inputs,
+            process=process,
+            refresh_research=bool(os.environ.get("GHOSTPRESS_REFRESH_RESEARCH")),
+            stream=stream,
+            on_chunk=sse.publish if sse else None
+        )
+    finally:
+        if sse:
+            sse.stop()
+    if process == "dag":
+        print(f"DAG run finished in {result.elapsed_s}s: {result.durations}")
     return result
 
 
+def run_batch():
+    """Run one crew per topic from a file, several at a time, each into its own output folder."""
+    parser = argparse.ArgumentParser(description="GhostPress: batch content generation")
+    parser.add_argument("topics", help="TXT (one per line), CSV or JSONL file of topics")
+    parser.add_argument("--output", "-o", default="output", help="Root folder for per-topic outputs")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="Crews running at once")
+    parser.add_argument("--process", choices=["sequential", "dag"], default=os.environ.get("GHOSTPRESS_PROCESS", "sequential"))
+    parser.add_argument("--max-workers", type=int, help="Per-crew task pool size in DAG mode")
+    parser.add_argument("--refresh-research", action="store_true", help="Ignore cached research briefs")
+    parser.add_argument("--stream", action="store_true", help="Stream each blog post and email to <file>.partial as it is written")
+    args = parser.parse_args()
+
+    import asyncio
+    from ghostpress.batch import load_topics, run_topics
+
+    _retry_outbox()
+    summary = asyncio.run(run_topics(
+        load_topics(args.topics),
+        output_root=args.output,
+        concurrency=args.concurrency,
+        process=args.process,
+        max_workers=args.max_workers,
+        refresh_research=args.refresh_research,
+        stream=args.stream
+    ))
+    for record in summary["topics"]:
+        print(f"[{record['status']}] {record['topic']} ({record['duration_s']}s) -> {record['output_dir']}")
+    print(f"Batch done: {summary['completed']} completed, {summary['failed']} failed in {summary['elapsed_s']}s")
+    return summary
+
+
 if __name__ == "__main__":
     run()
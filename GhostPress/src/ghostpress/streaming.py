@@ -0,0 +1,231 @@
+import copy
+import json
+import os
+import queue
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+
+# (task name, text chunk) for every streamed token batch
+ChunkCallback = Callable[[str, str], None]
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write `text` next to `path`, then rename over it so readers never see a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class StreamSink:
+    """
+    Streams one task's tokens to `<path>.partial` as they arrive.
+
+    When the task finishes, its final output is written atomically to `path` and
+    the partial file is removed. The partial file holds everything the agent
+    streamed (including tool-use turns); `path` only ever holds the final result.
+    """
+
+    def __init__(self, task: Task, name: str, path: Path, callbacks: List[ChunkCallback]):
+        self.task_id = str(task.id)
+        self.agent_role = task.agent.role.strip() if task.agent else None
+        self.name = name
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + ".partial")
+        self.callbacks = callbacks
+        self.bytes_streamed = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def write(self, chunk: str) -> None:
+        with self._lock:
+            if self._file is None:
+                self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.partial_path.open("w", encoding="utf-8")
+            self._file.write(chunk)
+            self._file.flush()
+            self.bytes_streamed += len(chunk)
+        for callback in self.callbacks:
+            callback(self.name, chunk)
+
+    def commit(self, output: TaskOutput) -> None:
+        """Task callback: publish the final output and drop the partial file."""
+        self.close()
+        atomic_write(self.path, output.raw)
+        self.partial_path.unlink(missing_ok=True)
+        self.release()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def release(self) -> None:
+        """Stop routing chunks here; a partial file from a failed run is left for inspection."""
+        self.close()
+        _unregister(self)
+
+
+# Live sinks by task id; one event-bus listener feeds them all
+_sinks: Dict[str, StreamSink] = {}
+_sinks_lock = threading.Lock()
+_listener_registered = False
+
+
+def _route(event) -> Optional[StreamSink]:
+    task_id = getattr(event, "task_id", None)
+    with _sinks_lock:
+        if task_id and str(task_id) in _sinks:
+            return _sinks[str(task_id)]
+        # Older events carry only the agent role; use it when it is unambiguous
+        role = (getattr(event, "agent_role", None) or "").strip()
+        matches = [s for s in _sinks.values() if role and s.agent_role == role]
+        return matches[0] if len(matches) == 1 else None
+
+
+def _ensure_listener() -> None:
+    global _listener_registered
+    with _sinks_lock:
+        if _listener_registered:
+            return
+        _listener_registered = True
+
+    from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+
+    @crewai_event_bus.on(LLMStreamChunkEvent)
+    def _on_chunk(source, event):
+        sink = _route(event)
+        if sink is not None and event.chunk:
+            sink.write(event.chunk)
+
+
+def _unregister(sink: StreamSink) -> None:
+    with _sinks_lock:
+        _sinks.pop(sink.task_id, None)
+
+
+def stream_task(task: Task, name: str, path: Path, callbacks: Optional[List[ChunkCallback]] = None) -> StreamSink:
+    """
+    Stream `task`'s tokens to `path` (see StreamSink).
+
+    Takes over the task's output file: crewai's own output_file write is turned
+    off and the sink publishes the result from the task callback instead; a
+    callback the task already had runs after that. The task's agent must use a
+    streaming LLM (see enable_streaming).
+    """
+    _ensure_listener()
+    sink = StreamSink(task, name, path, callbacks or [])
+    task.output_file = None
+    previous = task.callback
+
+    def commit_then_previous(output: TaskOutput) -> None:
+        sink.commit(output)
+        if previous is not None:
+            previous(output)
+
+    task.callback = commit_then_previous
+    with _sinks_lock:
+        _sinks[sink.task_id] = sink
+    return sink
+
+
+def enable_streaming(agent) -> None:
+    """
+    Switch an agent to streaming. Its LLM is copied with only `stream` turned on,
+    so temperature, base_url, api_key, max_tokens etc. carry over and other
+    agents sharing the same LLM object are unaffected.
+    """
+    if getattr(agent.llm, "stream", False):
+        return
+    if agent.llm is None or isinstance(agent.llm, str):
+        from crewai import LLM
+
+        agent.llm = LLM(model=agent.llm or os.environ.get("MODEL", "gpt-4o-mini"), stream=True)
+        return
+    llm = copy.copy(agent.llm)
+    llm.stream = True
+    agent.llm = llm
+
+
+class SSEBroadcaster:
+    """
+    Server-Sent Events endpoint for streamed chunks.
+
+    GET /events streams `data: {"task": ..., "text": ...}` lines to every
+    connected client; use `broadcaster.publish` as a chunk callback.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self._clients: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self._server.server_port}/events"
+
+    def publish(self, task_name: str, text: str) -> None:
+        message = f"data: {json.dumps({'task': task_name, 'text': text})}\n\n".encode()
+        with self._lock:
+            for client in self._clients:
+                client.put(message)
+
+    def start(self) -> "SSEBroadcaster":
+        broadcaster = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/events":
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                client: queue.Queue = queue.Queue()
+                with broadcaster._lock:
+                    broadcaster._clients.append(client)
+                try:
+                    while True:
+                        message = client.get()
+                        if message is None:
+                            return
+                        self.wfile.write(message)
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    with broadcaster._lock:
+                        broadcaster._clients.remove(client)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        with self._lock:
+            for client in self._clients:
+                client.put(None)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
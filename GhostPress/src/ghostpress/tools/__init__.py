@@ -1,3 +1,12 @@
-from .custom_tool import SendEmailTool
+# Tools are imported on first use: crewai_tools and sendgrid are slow to import
+__all__ = ["CachedSerperDevTool", "SendEmailTool"]
 
-__all__ = ["SendEmailTool"]
+
+def __getattr__(name):
+    if name == "CachedSerperDevTool":
+        from .cached_search import CachedSerperDevTool
+        return CachedSerperDevTool
+    if name == "SendEmailTool":
+        from .custom_tool import SendEmailTool
+        return SendEmailTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
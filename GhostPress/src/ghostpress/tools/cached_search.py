@@ -0,0 +1,24 @@
+from typing import Any
+
+from crewai_tools import SerperDevTool
+
+from ghostpress.cache import make_key, search_cache
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool that answers repeated searches from the shared search cache."""
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict[str, Any]:
+        cache = search_cache()
+        if cache is None:
+            return super()._make_api_request(search_query, search_type)
+
+        key = make_key(
+            search_type, " ".join(search_query.lower().split()),
+            self.n_results, self.country, self.location, self.locale
+        )
+        results = cache.get(key)
+        if results is None:
+            results = super()._make_api_request(search_query, search_type)
+            cache.set(key, results)
+        return results
@@ -1,9 +1,8 @@
-import os
 from typing import Type
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-import sendgrid
-from sendgrid.helpers.mail import Mail, Email, To, Content
+
+from ghostpress.delivery import DeliveryError, configured_message, get_delivery
 
 
 class SendEmailInput(BaseModel):
@@ -15,26 +14,28 @@ class SendEmailInput(BaseModel):
 class SendEmailTool(BaseTool):
     name: str = "send_email"
     description: str = (
-        "Sends an HTML email to the configured recipient. "
+        "Sends an HTML email to the configured recipients. "
         "Use this tool when you need to deliver the email campaign. "
         "Provide the email subject line and the full HTML body content."
     )
     args_schema: Type[BaseModel] = SendEmailInput
 
     def _run(self, subject: str, html_body: str) -> str:
-        """Send an HTML email using SendGrid API."""
+        """Send an HTML email through the shared SendGrid delivery (pooled client, retries, outbox)."""
         try:
-            sg = sendgrid.SendGridAPIClient(api_key=os.environ.get('SENDGRID_API_KEY'))
-            
-            from_email = Email(os.environ.get('SENDGRID_FROM_EMAIL'))  
-            to_email = To(os.environ.get('SENDGRID_TO_EMAIL')) 
+            sent = get_delivery().send(configured_message(subject, html_body))
+        except DeliveryError as e:
+            if not e.queued:
+                raise
+            return f"Email not delivered yet ({e}); it is queued in the outbox for retry. Subject: '{subject}'"
+        return f"Email sent successfully to {sent} recipient(s)! Subject: '{subject}'"
 
-            content = Content("text/html", html_body)
-            mail = Mail(from_email, to_email, subject, content).get()
-            
-            response = sg.client.mail.send.post(request_body=mail)
-            
-            return f"Email sent successfully! Subject: '{subject}'"
-        
-        except Exception as e:
-            return f"Failed to send email: {str(e)}"
+    async def _arun(self, subject: str, html_body: str) -> str:
+        """Async variant of _run on the shared async client."""
+        try:
+            sent = await get_delivery().send_async(configured_message(subject, html_body))
+        except DeliveryError as e:
+            if not e.queued:
+                raise
+            return f"Email not delivered yet ({e}); it is queued in the outbox for retry. Subject: '{subject}'"
+        return f"Email sent successfully to {sent} recipient(s)! Subject: '{subject}'"
@@ -0,0 +1,96 @@
+"""
+Local stand-in for the SendGrid v3 mail endpoint.
+
+The server records every accepted payload and can be told to answer the next
+requests with given status codes (e.g. 429, 503) to exercise retries and the outbox.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+import pytest
+
+from ghostpress.delivery import EmailDelivery, Outbox
+
+
+class StubSendGridServer:
+    """Threaded POST /v3/mail/send that answers 202, or the next queued failure status."""
+
+    def __init__(self):
+        self.requests = 0
+        self.accepted: List[dict] = []
+        self._failures: List[int] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def fail_next(self, *statuses: int) -> None:
+        with self._lock:
+            self._failures.extend(statuses)
+
+    def start(self) -> "StubSendGridServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with stub._lock:
+                    stub.requests += 1
+                    status = stub._failures.pop(0) if stub._failures else 202
+                    if status == 202 and self.path == "/v3/mail/send":
+                        stub.accepted.append(body)
+                if self.path != "/v3/mail/send":
+                    status = 404
+                payload = b"" if status == 202 else json.dumps({"errors": [{"message": f"stub {status}"}]}).encode()
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+@pytest.fixture
+def sendgrid():
+    server = StubSendGridServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def delivery(sendgrid, tmp_path):
+    """EmailDelivery pointed at the stand-in, with fast retries and a throwaway outbox."""
+    delivery = EmailDelivery(
+        api_key="stub",
+        base_url=sendgrid.url,
+        outbox=Outbox(tmp_path / "outbox.sqlite"),
+        max_retries=2,
+        backoff=0.01
+    )
+    yield delivery
+    delivery.close()
+
+
+@pytest.fixture
+def recipients():
+    return [f"reader{i}@example.com" for i in range(2500)]
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from ghostpress import main
+from ghostpress.delivery import DeliveryError, EmailMessage, set_delivery
+
+
+def message(recipients, subject="Stub campaign"):
+    return EmailMessage(subject, "<h1>Hello</h1>", recipients, "press@example.com")
+
+
+def accepted_sizes(server):
+    return [len(p["personalizations"]) for p in server.accepted]
+
+
+def test_send_batches_and_retries(delivery, sendgrid, recipients):
+    # One throttled and one failed attempt, then success
+    sendgrid.fail_next(429, 503)
+    assert delivery.send(message(recipients)) == len(recipients)
+    assert accepted_sizes(sendgrid) == [1000, 1000, 500]
+    assert sendgrid.requests == 5
+    assert len(delivery.outbox) == 0
+
+
+def test_send_async(delivery, sendgrid, recipients):
+    async def send():
+        try:
+            return await delivery.send_async(message(recipients))
+        finally:
+            await delivery.aclose()
+
+    sendgrid.fail_next(503)
+    assert asyncio.run(send()) == len(recipients)
+    assert accepted_sizes(sendgrid) == [1000, 1000, 500]
+
+
+def test_exhausted_retries_queue_only_unsent_recipients(delivery, sendgrid, recipients):
+    sendgrid.fail_next(202, 503, 503, 503)
+    with pytest.raises(DeliveryError) as e:
+        delivery.send(message(recipients))
+    assert e.value.queued
+
+    (queued,) = delivery.outbox.pending()
+    assert len(queued.recipients) == 1500
+
+    assert delivery.flush() == {"delivered": 1, "failed": 0, "exhausted": 0}
+    assert len(delivery.outbox) == 0
+    assert accepted_sizes(sendgrid) == [1000, 1000, 500]
+
+
+def test_flush_keeps_counting_attempts(delivery, sendgrid, recipients):
+    sendgrid.fail_next(503, 503, 503)
+    with pytest.raises(DeliveryError):
+        delivery.send(message(recipients[:1]))
+
+    sendgrid.fail_next(503, 503, 503)
+    assert delivery.flush() == {"delivered": 0, "failed": 1, "exhausted": 0}
+    attempts, last_error = delivery.outbox._db.execute("SELECT attempts, last_error FROM outbox").fetchone()
+    assert attempts == 2 and last_error.startswith("HTTP 503")
+
+
+def test_flush_skips_messages_at_max_attempts(delivery, sendgrid, recipients):
+    delivery.max_attempts = 1
+    sendgrid.fail_next(503, 503, 503)
+    with pytest.raises(DeliveryError):
+        delivery.send(message(recipients[:1]))
+
+    requests = sendgrid.requests
+    assert delivery.flush() == {"delivered": 0, "failed": 0, "exhausted": 1}
+    assert sendgrid.requests == requests
+    assert len(delivery.outbox) == 1
+
+
+def test_crash_between_batches_resends_only_the_rest(delivery, sendgrid, recipients):
+    send_batch = delivery._send_batch
+    sent = []
+
+    def crash_after_first(msg, batch):
+        if sent:
+            raise KeyboardInterrupt
+        send_batch(msg, batch)
+        sent.append(batch)
+
+    delivery._send_batch = crash_after_first
+    original = message(recipients)
+    with pytest.raises(KeyboardInterrupt):
+        delivery.send(original)
+    delivery._send_batch = send_batch
+
+    assert len(original.recipients) == 2500
+    (queued,) = delivery.outbox.pending()
+    assert len(queued.recipients) == 1500
+
+    assert delivery.flush()["delivered"] == 1
+    assert accepted_sizes(sendgrid) == [1000, 1000, 500]
+
+
+def test_rejected_mail_is_not_queued(delivery, sendgrid, recipients):
+    sendgrid.fail_next(400)
+    with pytest.raises(DeliveryError) as e:
+        delivery.send(message(recipients[:1]))
+    assert not e.value.queued and e.value.status == 400
+    assert len(delivery.outbox) == 0
+
+
+def test_flush_entry_point_retries_the_outbox(delivery, sendgrid, recipients, capsys):
+    async def send():
+        try:
+            await delivery.send_async(message(recipients[:1]))
+        finally:
+            await delivery.aclose()
+
+    sendgrid.fail_next(503, 503, 503)
+    with pytest.raises(DeliveryError) as e:
+        asyncio.run(send())
+    assert e.value.queued and len(delivery.outbox) == 1
+
+    set_delivery(delivery)
+    try:
+        assert main.flush() == {"delivered": 1, "failed": 0, "exhausted": 0}
+    finally:
+        set_delivery(None)
+    assert len(delivery.outbox) == 0
+    assert "1 queued, 1 delivered" in capsys.readouterr().out
@@ -0,0 +1 @@
+"""Offline benchmarks for the orchestrator-worker engine (run against tests/stubs.py, no API keys needed)."""
@@ -0,0 +1,153 @@
+"""
+Per-call overhead of pooled provider clients versus a new client per call.
+
+    cd OrchestratorWorker && python -m benchmarks.pooling --calls 200 --rounds 20
+
+"unpooled" is what the notebook helpers did: build an OpenAI()/Anthropic()
+client for every worker call. "pooled" goes through ClientRegistry. Both hit
+the local stand-in providers with zero server latency, so the numbers are pure
+client overhead; against real endpoints every new connection also pays DNS
+and a TLS handshake, which the stub does not model, so the gap only grows.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import anthropic
+import openai
+
+from orchestrator_worker.clients import ClientRegistry, PoolSettings
+from orchestrator_worker.engine import worker_messages
+from orchestrator_worker.providers import MODEL_PROVIDERS, Provider, provider_for
+from tests.stubs import StubProviderServer, stub_providers
+
+
+def percentiles(samples: List[float]) -> dict:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "mean": value}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49], 5),
+        "p95": round(cuts[94], 5),
+        "mean": round(statistics.fmean(samples), 5)
+    }
+
+
+def unpooled_call(providers: Dict[str, Provider]) -> Callable[[str, List[dict]], str]:
+    """The notebook's *_use helpers: a fresh SDK client per call."""
+    def call(model: str, messages: List[dict]) -> str:
+        provider = provider_for(model, providers)
+        if provider.api == "anthropic":
+            claude = anthropic.Anthropic(api_key=provider.resolve_api_key(), base_url=provider.base_url)
+            response = claude.messages.create(model=model, messages=messages, max_tokens=1000)
+            return response.content[0].text
+        client = openai.OpenAI(api_key=provider.resolve_api_key(), base_url=provider.base_url)
+        response = client.chat.completions.create(model=model, messages=messages)
+        return response.choices[0].message.content
+    return call
+
+
+def unpooled_acall(providers: Dict[str, Provider]):
+    async def call(model: str, messages: List[dict]) -> str:
+        provider = provider_for(model, providers)
+        if provider.api == "anthropic":
+            async with anthropic.AsyncAnthropic(api_key=provider.resolve_api_key(), base_url=provider.base_url) as claude:
+                response = await claude.messages.create(model=model, messages=messages, max_tokens=1000)
+                return response.content[0].text
+        async with openai.AsyncOpenAI(api_key=provider.resolve_api_key(), base_url=provider.base_url) as client:
+            response = await client.chat.completions.create(model=model, messages=messages)
+            return response.choices[0].message.content
+    return call
+
+
+def bench_sync(server: StubProviderServer, call, calls: int) -> dict:
+    """Sequential calls cycling through the worker models; per-call latency and connections opened."""
+    models = list(MODEL_PROVIDERS)
+    messages = worker_messages("Benchmark question", "Benchmark sub-problem")
+    call(models[0], messages)  # warm-up: imports, first connection
+    connections = server.connections
+    samples = []
+    for i in range(calls):
+        started = time.perf_counter()
+        call(models[i % len(models)], messages)
+        samples.append(time.perf_counter() - started)
+    return {**percentiles(samples), "connections": server.connections - connections}
+
+
+async def bench_async(server: StubProviderServer, call, rounds: int) -> dict:
+    """Fan-out rounds: one concurrent call per worker model, like FanOutEngine.run."""
+    models = list(MODEL_PROVIDERS)
+    messages = worker_messages("Benchmark question", "Benchmark sub-problem")
+    await asyncio.gather(*(call(model, messages) for model in models))
+    connections = server.connections
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await asyncio.gather(*(call(model, messages) for model in models))
+        samples.append(time.perf_counter() - started)
+    return {**percentiles(samples), "connections": server.connections - connections}
+
+
+def run_benchmark(calls: int = 200, rounds: int = 20, latency: float = 0.0, pool: PoolSettings = PoolSettings()) -> dict:
+    with StubProviderServer(default_latency=latency) as server:
+        providers = stub_providers(server)
+        registry = ClientRegistry(providers, settings=pool)
+
+        async def fan_out(call) -> dict:
+            return await bench_async(server, call, rounds)
+
+        async def pooled_fan_out() -> dict:
+            try:
+                return await fan_out(registry.acomplete)
+            finally:
+                await registry.aclose()
+
+        results = {
+            "sync_per_call": {
+                "unpooled": bench_sync(server, unpooled_call(providers), calls),
+                "pooled": bench_sync(server, registry.complete, calls),
+            },
+            "async_fan_out_round": {
+                "unpooled": asyncio.run(fan_out(unpooled_acall(providers))),
+                "pooled": asyncio.run(pooled_fan_out()),
+            },
+        }
+        registry.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pooled vs per-call provider clients")
+    parser.add_argument("--calls", type=int, default=200, help="Sequential sync calls per mode")
+    parser.add_argument("--rounds", type=int, default=20, help="Concurrent fan-out rounds per mode (one call per worker model)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub server latency per call, seconds")
+    parser.add_argument("--max-connections", type=int, default=PoolSettings.max_connections)
+    parser.add_argument("--max-keepalive", type=int, default=PoolSettings.max_keepalive_connections)
+    parser.add_argument("--output", type=str, help="Write results JSON here")
+    args = parser.parse_args()
+
+    pool = PoolSettings(max_connections=args.max_connections, max_keepalive_connections=args.max_keepalive)
+    results = run_benchmark(args.calls, args.rounds, args.latency, pool)
+
+    for name, modes in results.items():
+        print(f"\n{name}")
+        for mode, stats in modes.items():
+            print(
+                f"  {mode:<9} mean {stats['mean'] * 1000:8.2f} ms  p50 {stats['p50'] * 1000:8.2f} ms  "
+                f"p95 {stats['p95'] * 1000:8.2f} ms  connections {stats['connections']}"
+            )
+        speedup = modes["unpooled"]["mean"] / modes["pooled"]["mean"] if modes["pooled"]["mean"] else 0.0
+        print(f"  pooled is {speedup:.1f}x faster per {'call' if name.startswith('sync') else 'round'}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
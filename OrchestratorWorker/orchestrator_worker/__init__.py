@@ -0,0 +1,34 @@
+from orchestrator_worker.clients import ClientRegistry, PoolSettings, call_worker, get_registry, set_registry
+from orchestrator_worker.engine import (
+    FanOutEngine,
+    FanOutResult,
+    WorkerResult,
+    parse_assignments,
+    synthesis_messages,
+    worker_messages,
+)
+from orchestrator_worker.providers import MODEL_PROVIDERS, PROVIDERS, Provider
+from orchestrator_worker.routing import LatencyHistogram, Router, RoutingPlan
+from orchestrator_worker.synthesis import SynthesisResult, Synthesizer
+
+__all__ = [
+    "ClientRegistry",
+    "PoolSettings",
+    "get_registry",
+    "set_registry",
+    "FanOutEngine",
+    "FanOutResult",
+    "WorkerResult",
+    "parse_assignments",
+    "synthesis_messages",
+    "worker_messages",
+    "MODEL_PROVIDERS",
+    "PROVIDERS",
+    "Provider",
+    "LatencyHistogram",
+    "Router",
+    "RoutingPlan",
+    "SynthesisResult",
+    "Synthesizer",
+    "call_worker",
+]
@@ -0,0 +1,157 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import anthropic
+import openai
+
+from orchestrator_worker.providers import PROVIDERS, Provider, provider_for
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Keep-alive connection pool for one provider's HTTP session."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    timeout: float = 600.0
+
+    def http_client(self, sdk, sync: bool = True):
+        """Pooled HTTP client for an SDK module (openai or anthropic), built with that SDK's own defaults."""
+        # The SDKs pin their own httpx flavour; build Limits from the class they use
+        limits = type(sdk.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+        client_class = sdk.DefaultHttpxClient if sync else sdk.DefaultAsyncHttpxClient
+        return client_class(limits=limits, timeout=self.timeout)
+
+
+class ClientRegistry:
+    """
+    Long-lived, pooled SDK clients for every provider, behind one dispatch API.
+
+    - `complete(model, messages)` / `await acomplete(model, messages)` pick the
+      provider from MODEL_PROVIDERS, so callers never branch on the model name
+    - Each provider gets one sync client and one async client per event loop,
+      built lazily on first use and wrapped around a keep-alive connection pool
+      (PoolSettings, overridable per provider via `pools`)
+    - Every model behind a provider shares its session: all local Ollama models
+      reuse one connection pool to localhost, and the Groq orchestrator,
+      worker and synthesizer share theirs
+    """
+
+    def __init__(
+        self,
+        providers: Optional[Dict[str, Provider]] = None,
+        settings: PoolSettings = PoolSettings(),
+        pools: Optional[Dict[str, PoolSettings]] = None
+    ):
+        self.providers = providers or PROVIDERS
+        self.settings = settings
+        self.pools = pools or {}
+        self._clients: Dict[str, Any] = {}
+        self._async_clients: Dict[str, Any] = {}
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _pool(self, provider: Provider) -> PoolSettings:
+        return self.pools.get(provider.name, self.settings)
+
+    def _build(self, provider: Provider, sync: bool):
+        sdk = anthropic if provider.api == "anthropic" else openai
+        if provider.api == "anthropic":
+            client_class = anthropic.Anthropic if sync else anthropic.AsyncAnthropic
+        else:
+            client_class = openai.OpenAI if sync else openai.AsyncOpenAI
+        return client_class(
+            api_key=provider.resolve_api_key(),
+            base_url=provider.base_url,
+            http_client=self._pool(provider).http_client(sdk, sync)
+        )
+
+    def client(self, model: str):
+        """Pooled sync SDK client (OpenAI or Anthropic) for `model`'s provider."""
+        provider = provider_for(model, self.providers)
+        with self._lock:
+            if provider.name not in self._clients:
+                self._clients[provider.name] = self._build(provider, sync=True)
+            return self._clients[provider.name]
+
+    def async_client(self, model: str):
+        """Pooled async SDK client for `model`'s provider, bound to the running loop."""
+        provider = provider_for(model, self.providers)
+        # An AsyncClient's pool is bound to the loop that first used it
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_clients = {}
+            self._async_loop = loop
+        if provider.name not in self._async_clients:
+            self._async_clients[provider.name] = self._build(provider, sync=False)
+        return self._async_clients[provider.name]
+
+    @staticmethod
+    def _request(provider: Provider, model: str, messages: List[dict], max_tokens: int) -> dict:
+        if provider.api == "anthropic":
+            return {"model": model, "messages": messages, "max_tokens": max_tokens}
+        return {"model": model, "messages": messages}
+
+    @staticmethod
+    def _text(provider: Provider, response) -> str:
+        if provider.api == "anthropic":
+            return response.content[0].text
+        return response.choices[0].message.content
+
+    def _create(self, client, provider: Provider):
+        return client.messages.create if provider.api == "anthropic" else client.chat.completions.create
+
+    def complete(self, model: str, messages: List[dict], max_tokens: int = 1000) -> str:
+        """Answer text from `model` for a chat `messages` list."""
+        provider = provider_for(model, self.providers)
+        create = self._create(self.client(model), provider)
+        return self._text(provider, create(**self._request(provider, model, messages, max_tokens)))
+
+    async def acomplete(self, model: str, messages: List[dict], max_tokens: int = 1000) -> str:
+        provider = provider_for(model, self.providers)
+        create = self._create(self.async_client(model), provider)
+        return self._text(provider, await create(**self._request(provider, model, messages, max_tokens)))
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients = {}
+
+    async def aclose(self) -> None:
+        if self._async_loop is asyncio.get_running_loop():
+            for client in self._async_clients.values():
+                await client.close()
+        self._async_clients = {}
+        self._async_loop = None
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ClientRegistry:
+    """Process-wide registry over PROVIDERS."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def set_registry(registry: Optional[ClientRegistry]) -> None:
+    """Swap the process-wide registry (e.g. different pool sizes, or stand-in providers)."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
+
+
+async def call_worker(model: str, messages: List[dict], max_tokens: int = 1000) -> str:
+    """One worker call through the shared registry (the engine's default worker call)."""
+    return await get_registry().acomplete(model, messages, max_tokens)
@@ -0,0 +1,203 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from orchestrator_worker.clients import call_worker
+from orchestrator_worker.providers import PROVIDERS, Provider, provider_for
+
+
+# (model, messages) -> answer text
+WorkerCall = Callable[[str, List[dict]], Awaitable[str]]
+
+# Message of the CancelledError a call sees when it runs past `call_timeout`, so
+# wrappers (Router.observe) can tell a timeout from a deadline or a lost hedge
+CALL_TIMEOUT = "call_timeout"
+
+
+@dataclass
+class WorkerResult:
+    """One sub-problem's outcome: ok, error, timeout (call_timeout) or deadline (cut off by the run deadline)."""
+    sub_problem: str
+    model: str
+    answer: Optional[str] = None
+    status: str = "pending"
+    error: Optional[str] = None
+    latency_s: float = 0.0
+
+
+@dataclass
+class FanOutResult:
+    question: str
+    results: List[WorkerResult] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def completed(self) -> List[WorkerResult]:
+        return [r for r in self.results if r.status == "ok"]
+
+    @property
+    def answers(self) -> List[str]:
+        return [r.answer for r in self.completed]
+
+    @property
+    def partial(self) -> bool:
+        return len(self.completed) < len(self.results)
+
+
+def parse_assignments(answer: str) -> Dict[str, str]:
+    """The orchestrator's {sub-problem: model} JSON, tolerating a ```json fence around it."""
+    text = answer.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    return json.loads(text)
+
+
+def worker_messages(question: str, sub_problem: str) -> List[dict]:
+    """Prompt for one worker: its own sub-problem, with the full question as context."""
+    return [{
+        "role": "user",
+        "content": f"Solve this sub-problem:\n\n{sub_problem}\n\nIt is part of a larger question:\n\n{question}"
+    }]
+
+
+def missing_note(missing: Iterable[str]) -> str:
+    """Synthesis prompt suffix naming the sub-problems without an answer ('' when there are none)."""
+    missing = list(missing)
+    if not missing:
+        return ""
+    return (
+        "\n\nThese sub-problems have no answer (the worker failed or ran out of time); "
+        "cover them briefly yourself or state what is missing:\n- " + "\n- ".join(missing)
+    )
+
+
+def synthesis_messages(question: str, fanout: FanOutResult) -> List[dict]:
+    """Synthesis prompt from whatever finished; missing sub-problems are named so the model can say so."""
+    parts = [f"Sub-problem: {r.sub_problem}\nAnswer ({r.model}):\n{r.answer}" for r in fanout.completed]
+    prompt = (
+        f"Synthesize these worker answers and provide a final response to the question: {question}\n\n"
+        + "\n\n---\n\n".join(parts)
+    )
+    prompt += missing_note(r.sub_problem for r in fanout.results if r.status != "ok")
+    return [{"role": "user", "content": prompt}]
+
+
+class FanOutEngine:
+    """
+    Runs every sub-problem's worker call concurrently.
+
+    Calls to the same provider are capped by a per-provider semaphore
+    (Provider.max_concurrency, or `provider_limits` overrides); each call gets
+    `call_timeout` seconds once it holds its slot. With a `deadline`, `run`
+    returns as soon as it passes, cancelling unfinished workers so synthesis
+    can go ahead on the partial results.
+    """
+
+    def __init__(
+        self,
+        call: WorkerCall = call_worker,
+        providers: Optional[Dict[str, Provider]] = None,
+        call_timeout: Optional[float] = 120.0,
+        provider_limits: Optional[Dict[str, int]] = None
+    ):
+        self.call = call
+        self.providers = providers or PROVIDERS
+        self.call_timeout = call_timeout
+        self.provider_limits = provider_limits or {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def slot(self, model: str) -> asyncio.Semaphore:
+        """The semaphore capping concurrent calls to `model`'s provider (created lazily, inside the running loop)."""
+        provider = provider_for(model, self.providers)
+        if provider.name not in self._semaphores:
+            limit = self.provider_limits.get(provider.name, provider.max_concurrency)
+            self._semaphores[provider.name] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[provider.name]
+
+    async def _timed(self, call: Awaitable[str]) -> str:
+        """wait_for(call, call_timeout), but the call is cancelled with the CALL_TIMEOUT message."""
+        task = asyncio.ensure_future(call)
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.call_timeout)
+        except asyncio.CancelledError as e:
+            task.cancel(*e.args)
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+        if not done:
+            task.cancel(CALL_TIMEOUT)
+            await asyncio.gather(task, return_exceptions=True)
+            raise asyncio.TimeoutError
+        return task.result()
+
+    async def _run_one(self, result: WorkerResult, messages: List[dict]) -> None:
+        started = time.perf_counter()
+        try:
+            async with self.slot(result.model):
+                result.answer = await self._timed(self.call(result.model, messages))
+            result.status = "ok"
+        except asyncio.TimeoutError:
+            result.status = "timeout"
+            result.error = f"no answer within {self.call_timeout}s"
+        except Exception as e:
+            result.status = "error"
+            result.error = f"{type(e).__name__}: {e}"
+        finally:
+            result.latency_s = time.perf_counter() - started
+
+    def prepare(self, assignments: Dict[str, str], question: str) -> FanOutResult:
+        """Pending results for each {sub-problem: model} assignment, in assignment order."""
+        return FanOutResult(question, [WorkerResult(sub, model) for sub, model in assignments.items()])
+
+    async def stream(self, fanout: FanOutResult, deadline: Optional[float] = None) -> AsyncIterator[WorkerResult]:
+        """
+        Run `fanout`'s workers concurrently, yielding each result as it finishes.
+
+        With `deadline` (seconds from now), workers still running when it passes
+        are cancelled and marked "deadline" (they are not yielded). `fanout`
+        holds every result, in assignment order, once the stream is exhausted.
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        ends_at = None if deadline is None else loop.time() + deadline
+        tasks = {
+            asyncio.create_task(self._run_one(result, worker_messages(fanout.question, result.sub_problem))): result
+            for result in fanout.results
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if ends_at is None else max(0.0, ends_at - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    yield tasks[task]
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for result in fanout.results:
+                if result.status == "pending":
+                    result.status = "deadline"
+                    result.error = f"still running at the {deadline}s deadline"
+            fanout.elapsed_s = time.perf_counter() - started
+
+    async def run(
+        self,
+        assignments: Dict[str, str],
+        question: str,
+        deadline: Optional[float] = None
+    ) -> FanOutResult:
+        """
+        Solve each {sub-problem: model} assignment concurrently.
+
+        Results come back in assignment order. With `deadline` (seconds from now),
+        workers still running when it passes are cancelled and marked "deadline".
+        """
+        fanout = self.prepare(assignments, question)
+        async for _ in self.stream(fanout, deadline):
+            pass
+        return fanout
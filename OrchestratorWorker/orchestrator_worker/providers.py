@@ -0,0 +1,52 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class Provider:
+    """Where a worker model is served and how to call it."""
+    name: str
+    api: str = "openai"  # "openai" (chat completions compatible) or "anthropic"
+    base_url: Optional[str] = None
+    api_key_env: Optional[str] = None
+    api_key: Optional[str] = None
+    max_concurrency: int = 4
+
+    def resolve_api_key(self) -> Optional[str]:
+        if self.api_key:
+            return self.api_key
+        return os.getenv(self.api_key_env) if self.api_key_env else None
+
+
+PROVIDERS: Dict[str, Provider] = {
+    "openai": Provider("openai", api_key_env="OPENAI_API_KEY", max_concurrency=8),
+    "anthropic": Provider("anthropic", api="anthropic", api_key_env="ANTHROPIC_API_KEY", max_concurrency=4),
+    "google": Provider(
+        "google",
+        base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+        api_key_env="GOOGLE_API_KEY",
+        max_concurrency=4
+    ),
+    "groq": Provider("groq", base_url="https://api.groq.com/openai/v1", api_key_env="GROQ_API_KEY", max_concurrency=4),
+    # A local model serves one request at a time well; more just queue inside Ollama
+    "ollama": Provider("ollama", base_url="http://localhost:11434/v1", api_key="ollama", max_concurrency=1),
+}
+
+# The notebook's `the_workers`, mapped to the provider that serves each one
+MODEL_PROVIDERS: Dict[str, str] = {
+    "gpt-5-nano": "openai",
+    "claude-sonnet-4-5": "anthropic",
+    "gemini-2.5-flash": "google",
+    "openai/gpt-oss-120b": "groq",
+    "llama3.2": "ollama",
+}
+
+
+def provider_for(model: str, providers: Optional[Dict[str, Provider]] = None) -> Provider:
+    providers = providers or PROVIDERS
+    try:
+        return providers[MODEL_PROVIDERS[model]]
+    except KeyError:
+        raise ValueError(f"Unknown worker model {model!r} - expected one of {list(MODEL_PROVIDERS)}") from None
+
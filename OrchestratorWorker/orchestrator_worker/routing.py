@@ -0,0 +1,340 @@
+import asyncio
+import json
+import math
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncContextManager, Callable, Deque, Dict, List, Optional, Tuple
+
+from orchestrator_worker.engine import CALL_TIMEOUT, WorkerCall
+from orchestrator_worker.providers import MODEL_PROVIDERS, PROVIDERS, Provider, provider_for
+
+
+# Upper bounds (seconds) of the histogram buckets
+BUCKETS_S = (0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0, math.inf)
+
+
+class LatencyHistogram:
+    """
+    Rolling latency/outcome window for one model: the last `window` calls no
+    older than `max_age_s`. Quantiles come from the raw samples; `buckets()`
+    gives the coarse histogram for display.
+    """
+
+    def __init__(self, window: int = 200, max_age_s: float = 6 * 3600):
+        self.window = window
+        self.max_age_s = max_age_s
+        # (timestamp, latency_s, ok)
+        self.samples: Deque[Tuple[float, float, bool]] = deque(maxlen=window)
+
+    def add(self, latency_s: float, ok: bool, at: Optional[float] = None) -> None:
+        self.samples.append((time.time() if at is None else at, latency_s, ok))
+
+    def _live(self) -> List[Tuple[float, float, bool]]:
+        cutoff = time.time() - self.max_age_s
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+        return list(self.samples)
+
+    def __len__(self) -> int:
+        return len(self._live())
+
+    def quantile(self, q: float) -> Optional[float]:
+        latencies = sorted(s[1] for s in self._live())
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    def error_rate(self) -> float:
+        live = self._live()
+        return sum(1 for s in live if not s[2]) / len(live) if live else 0.0
+
+    def buckets(self) -> Dict[str, int]:
+        counts = Counter()
+        for _, latency, _ in self._live():
+            bound = next(b for b in BUCKETS_S if latency <= b)
+            counts[f"<={bound:g}s" if bound != math.inf else f">{BUCKETS_S[-2]:g}s"] += 1
+        return dict(counts)
+
+
+@dataclass
+class Override:
+    sub_problem: str
+    requested: str
+    chosen: str
+    reason: str
+
+
+@dataclass
+class RoutingPlan:
+    assignments: Dict[str, str]
+    overrides: List[Override] = field(default_factory=list)
+    # Estimated seconds until the last worker finishes, from observed p90 latencies and provider limits
+    estimated_s: float = 0.0
+
+
+@dataclass
+class HedgeEvent:
+    model: str
+    backup: str
+    winner: str
+    after_s: float
+
+
+class Router:
+    """
+    Latency/cost-aware worker routing from observed calls.
+
+    - `observe(call)` wraps a worker call so every call feeds a per-model
+      rolling latency histogram and error rate (`call_timeout` expiries count
+      as errors); `provider_summary()` rolls them up per provider
+    - `route(assignments, deadline)` keeps the orchestrator's choice where it
+      fits, and overrides it when the model is failing (error rate above
+      `max_error_rate`) or its p90 latency, queued behind the other work on the
+      same provider, would miss the deadline. Replacements are the cheapest
+      model (by `costs`, if given) expected to make it, else the fastest
+    - `hedged(call, slot)` duplicates a slow call to a model on another
+      provider once it runs past the primary's p95 (or `hedge_delay` before
+      there is history); the first answer wins and the other call is cancelled
+
+    Models without `min_samples` observations have a zero error rate and are
+    never overridden for the deadline, so an empty router changes nothing
+    until it has data; `prior_latency_s` stands in for their latency when
+    ranking replacements and estimating the plan.
+    """
+
+    def __init__(
+        self,
+        providers: Optional[Dict[str, Provider]] = None,
+        models: Optional[List[str]] = None,
+        costs: Optional[Dict[str, float]] = None,
+        latency_quantile: float = 0.9,
+        max_error_rate: float = 0.3,
+        min_samples: int = 3,
+        prior_latency_s: float = 30.0,
+        hedge_quantile: float = 0.95,
+        hedge_delay: float = 20.0,
+        window: int = 200
+    ):
+        self.providers = providers or PROVIDERS
+        self.models = list(models or MODEL_PROVIDERS)
+        self.costs = costs or {}
+        self.latency_quantile = latency_quantile
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.prior_latency_s = prior_latency_s
+        self.hedge_quantile = hedge_quantile
+        self.hedge_delay = hedge_delay
+        self.window = window
+        self.stats: Dict[str, LatencyHistogram] = {}
+        self.hedges: List[HedgeEvent] = []
+
+    # OBSERVATIONS
+    def histogram(self, model: str) -> LatencyHistogram:
+        if model not in self.stats:
+            self.stats[model] = LatencyHistogram(self.window)
+        return self.stats[model]
+
+    def record(self, model: str, latency_s: float, ok: bool = True) -> None:
+        self.histogram(model).add(latency_s, ok)
+
+    def observe(self, call: WorkerCall) -> WorkerCall:
+        """
+        Wrap `call` so each call is recorded. A call the engine cancels at its
+        `call_timeout` counts as an error; other cancelled calls (deadlines, lost
+        hedges) count as a latency sample of at least the time they ran, not as errors.
+        """
+        async def observed(model: str, messages: List[dict]) -> str:
+            started = time.perf_counter()
+            try:
+                answer = await call(model, messages)
+            except asyncio.CancelledError as e:
+                self.record(model, time.perf_counter() - started, ok=CALL_TIMEOUT not in e.args)
+                raise
+            except Exception:
+                self.record(model, time.perf_counter() - started, ok=False)
+                raise
+            self.record(model, time.perf_counter() - started, ok=True)
+            return answer
+        return observed
+
+    def _has_history(self, model: str) -> bool:
+        return model in self.stats and len(self.stats[model]) >= self.min_samples
+
+    def expected_latency(self, model: str, q: Optional[float] = None) -> float:
+        if not self._has_history(model):
+            return self.prior_latency_s
+        return self.stats[model].quantile(q or self.latency_quantile)
+
+    def error_rate(self, model: str) -> float:
+        return self.stats[model].error_rate() if self._has_history(model) else 0.0
+
+    def healthy(self, model: str) -> bool:
+        return self.error_rate(model) <= self.max_error_rate
+
+    # ROUTING
+    def _finish(self, model: str, load: Counter) -> float:
+        """Estimated finish time for one more call to `model`, queued behind `load` on its provider."""
+        provider = provider_for(model, self.providers)
+        waves = load[provider.name] // max(1, provider.max_concurrency) + 1
+        return waves * self.expected_latency(model)
+
+    def _rank(self, model: str, load: Counter, deadline: Optional[float]) -> tuple:
+        # Models that make the deadline first, cheapest of those; if none can, the fastest
+        finish = self._finish(model, load)
+        misses = deadline is not None and finish > deadline
+        return (misses, 0.0 if misses else self.costs.get(model, 0.0), finish)
+
+    def route(self, assignments: Dict[str, str], deadline: Optional[float] = None) -> RoutingPlan:
+        """Assignments adjusted for observed health and the `deadline` (seconds for the whole fan-out)."""
+        load: Counter = Counter()
+        plan = RoutingPlan({})
+        for sub_problem, model in assignments.items():
+            reason = None
+            if model not in MODEL_PROVIDERS:
+                reason = "unknown model"
+            elif not self.healthy(model):
+                reason = f"error rate {self.error_rate(model):.0%}"
+            elif deadline is not None and self._has_history(model) and self._finish(model, load) > deadline:
+                reason = f"expected {self._finish(model, load):.1f}s would miss the {deadline:g}s deadline"
+
+            chosen = model
+            if reason:
+                candidates = [m for m in self.models if self.healthy(m)] or self.models
+                chosen = min(candidates, key=lambda m: self._rank(m, load, deadline))
+                if chosen != model:
+                    plan.overrides.append(Override(sub_problem, model, chosen, reason))
+
+            plan.estimated_s = max(plan.estimated_s, self._finish(chosen, load))
+            load[provider_for(chosen, self.providers).name] += 1
+            plan.assignments[sub_problem] = chosen
+        return plan
+
+    # HEDGING
+    def hedge_after(self, model: str) -> float:
+        if not self._has_history(model):
+            return self.hedge_delay
+        return self.stats[model].quantile(self.hedge_quantile)
+
+    def backup_for(self, model: str) -> Optional[str]:
+        """Fastest healthy model on a different provider, if any."""
+        provider = MODEL_PROVIDERS.get(model)
+        candidates = [m for m in self.models if MODEL_PROVIDERS[m] != provider and self.healthy(m)]
+        return min(candidates, key=self.expected_latency, default=None)
+
+    def hedged(self, call: WorkerCall, slot: Optional[Callable[[str], AsyncContextManager]] = None) -> WorkerCall:
+        """
+        Observed `call` with a backup request to another provider when the primary is slow.
+
+        Pass the engine's `slot` (FanOutEngine.slot) so the backup waits for a
+        free slot on its own provider instead of exceeding that provider's limit;
+        the primary already holds its slot when the engine calls in.
+        """
+        observed = self.observe(call)
+
+        async def backup_call(model: str, messages: List[dict]) -> str:
+            if slot is None:
+                return await observed(model, messages)
+            async with slot(model):
+                return await observed(model, messages)
+
+        async def hedged_call(model: str, messages: List[dict]) -> str:
+            delay = self.hedge_after(model)
+            primary = asyncio.create_task(observed(model, messages))
+            tasks = {primary: model}
+            # Why this call was cancelled, passed on so a timeout counts against the models it ran
+            reason = ()
+            try:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                backup_model = self.backup_for(model)
+                if done or backup_model is None:
+                    return await primary
+
+                backup = asyncio.create_task(backup_call(backup_model, messages))
+                tasks[backup] = backup_model
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            self.hedges.append(HedgeEvent(model, backup_model, tasks[task], delay))
+                            return task.result()
+                # Both failed: surface the primary's error
+                return primary.result()
+            except asyncio.CancelledError as e:
+                reason = e.args
+                raise
+            finally:
+                for task in tasks:
+                    task.cancel(*reason)
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return hedged_call
+
+    # REPORTING
+    def summary(self) -> List[dict]:
+        rows = []
+        for model in self.models:
+            histogram = self.stats.get(model)
+            if not histogram or not len(histogram):
+                continue
+            rows.append({
+                "model": model,
+                "provider": MODEL_PROVIDERS[model],
+                "calls": len(histogram),
+                "p50_s": round(histogram.quantile(0.5), 2),
+                "p90_s": round(histogram.quantile(0.9), 2),
+                "error_rate": round(histogram.error_rate(), 3),
+                "buckets": histogram.buckets()
+            })
+        return rows
+
+    def provider_summary(self) -> List[dict]:
+        """summary() rolled up per provider, over every call to any of its models."""
+        samples: Dict[str, list] = {}
+        for model, histogram in self.stats.items():
+            if model in MODEL_PROVIDERS:
+                samples.setdefault(MODEL_PROVIDERS[model], []).extend(histogram._live())
+        rows = []
+        for provider, live in samples.items():
+            if not live:
+                continue
+            merged = LatencyHistogram(window=len(live), max_age_s=math.inf)
+            merged.samples.extend(live)
+            rows.append({
+                "provider": provider,
+                "models": sorted(m for m in self.stats if MODEL_PROVIDERS.get(m) == provider),
+                "calls": len(live),
+                "p50_s": round(merged.quantile(0.5), 2),
+                "p90_s": round(merged.quantile(0.9), 2),
+                "error_rate": round(merged.error_rate(), 3)
+            })
+        return rows
+
+    def prompt_hint(self) -> str:
+        """Observed worker performance, for the orchestrator's assignment prompt ('' without history)."""
+        rows = self.summary()
+        if not rows:
+            return ""
+        lines = [
+            f"- {r['model']}: p50 {r['p50_s']}s, p90 {r['p90_s']}s, {r['error_rate']:.0%} errors over {r['calls']} calls"
+            for r in rows
+        ]
+        return "Observed worker latency and reliability (prefer faster, reliable models when quality is similar):\n" + "\n".join(lines)
+
+    def save(self, path: Path) -> None:
+        data = {model: list(h.samples) for model, h in self.stats.items()}
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(data))
+
+    def load(self, path: Path) -> "Router":
+        """Add samples saved by `save` (missing file is fine), so routing starts from past runs."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return self
+        for model, samples in data.items():
+            for at, latency, ok in samples:
+                self.histogram(model).add(latency, ok, at)
+        return self
@@ -0,0 +1,255 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+from orchestrator_worker.clients import call_worker
+from orchestrator_worker.engine import FanOutResult, WorkerCall, WorkerResult, missing_note
+
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token; close enough for budgeting across providers' tokenizers."""
+    return max(1, len(text) // 4)
+
+
+def truncate_tokens(text: str, tokens: int) -> str:
+    if estimate_tokens(text) <= tokens:
+        return text
+    return text[:tokens * 4].rstrip() + "\n[truncated]"
+
+
+@dataclass
+class Part:
+    """A worker answer, or a merge of several, waiting to be synthesized."""
+    title: str
+    text: str
+    level: int = 0
+
+    @classmethod
+    def from_result(cls, result: WorkerResult) -> "Part":
+        return cls(result.sub_problem, result.answer or "")
+
+    def render(self) -> str:
+        return f"### {self.title}\n{self.text}"
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.render())
+
+
+@dataclass
+class LevelStats:
+    level: int
+    calls: int = 0
+    # Largest estimated input (answer text) in one prompt at this level
+    max_input_tokens: int = 0
+    elapsed_s: float = 0.0
+
+
+@dataclass
+class SynthesisResult:
+    answer: str
+    mode: str
+    levels: Dict[int, LevelStats] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+    # Merge calls that failed or timed out; their groups went up a level unmerged
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return sum(level.calls for level in self.levels.values())
+
+
+def merge_messages(question: str, parts: List[Part], target_tokens: int) -> List[dict]:
+    body = "\n\n".join(part.render() for part in parts)
+    return [{"role": "user", "content": (
+        f"These are partial answers to sub-problems of the question: {question}\n\n{body}\n\n"
+        f"Merge them into one answer that keeps every concrete fact, figure and recommendation, "
+        f"drops repetition, and notes any disagreement between them. "
+        f"Use at most about {target_tokens * 3 // 4} words. Answer only with the merged text."
+    )}]
+
+
+def final_messages(question: str, parts: List[Part], missing: Iterable[str] = ()) -> List[dict]:
+    body = "\n\n".join(part.render() for part in parts)
+    prompt = f"Synthesize these worker answers and provide the final response to the question: {question}\n\n{body}"
+    return [{"role": "user", "content": prompt + missing_note(missing)}]
+
+
+async def _carry(part: Part) -> Part:
+    # A group of one goes up a level unmerged
+    return part
+
+
+class Synthesizer:
+    """
+    Bounded-size synthesis of worker answers.
+
+    No prompt ever carries more than `level_budget` tokens of answer text:
+    answers are packed into groups of at most `fan_in` that fit the budget
+    (each answer is cut to half the budget, so every group merges at least
+    two), and each merge is asked for about `merge_tokens` tokens. Levels
+    repeat until the remaining parts fit one final prompt, so synthesis
+    latency grows with log(workers) rather than total answer length.
+
+    Each call gets `call_timeout` seconds once it holds a slot. A merge that
+    fails or times out does not sink the synthesis: its group goes up a level
+    unmerged, cut to `merge_tokens`, and the error is kept in `result.errors`.
+
+    - `tree_reduce(question, parts)` merges the groups of each level concurrently
+    - `stream(engine, fanout)` starts merging while workers are still running,
+      as soon as `fan_in` answers (or a budget's worth) have arrived
+    """
+
+    def __init__(
+        self,
+        call: WorkerCall = call_worker,
+        model: str = "openai/gpt-oss-120b",
+        level_budget: int = 6000,
+        merge_tokens: int = 800,
+        fan_in: int = 4,
+        max_concurrency: int = 4,
+        call_timeout: Optional[float] = 120.0
+    ):
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.call = call
+        self.model = model
+        self.level_budget = level_budget
+        self.merge_tokens = merge_tokens
+        self.fan_in = fan_in
+        self.max_concurrency = max_concurrency
+        self.call_timeout = call_timeout
+
+    def _fits(self, parts: List[Part]) -> bool:
+        return len(parts) <= self.fan_in and sum(p.tokens for p in parts) <= self.level_budget
+
+    def _pack(self, parts: List[Part]) -> List[List[Part]]:
+        """Consecutive groups of <= fan_in parts whose text fits the level budget."""
+        limit = self.level_budget // 2
+        groups: List[List[Part]] = [[]]
+        for part in parts:
+            if part.tokens > limit:
+                part = Part(part.title, truncate_tokens(part.text, limit - estimate_tokens(part.title) - 8), part.level)
+            group = groups[-1]
+            if group and (len(group) >= self.fan_in or sum(p.tokens for p in group) + part.tokens > self.level_budget):
+                groups.append([part])
+            else:
+                group.append(part)
+        return [g for g in groups if g]
+
+    async def _merge(self, question: str, group: List[Part], result: SynthesisResult, semaphore: asyncio.Semaphore) -> Part:
+        level = max(p.level for p in group) + 1
+        stats = result.levels.setdefault(level, LevelStats(level))
+        stats.calls += 1
+        stats.max_input_tokens = max(stats.max_input_tokens, sum(p.tokens for p in group))
+        started = time.perf_counter()
+        title = " + ".join(p.title for p in group)
+        try:
+            async with semaphore:
+                text = await asyncio.wait_for(
+                    self.call(self.model, merge_messages(question, group, self.merge_tokens)), self.call_timeout
+                )
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                result.errors.append(f"level {level} merge of {title}: no answer within {self.call_timeout}s")
+            else:
+                result.errors.append(f"level {level} merge of {title}: {type(e).__name__}: {e}")
+            # Carry the group up unmerged, cut to the size a merge would have been
+            text = truncate_tokens("\n\n".join(p.render() for p in group), self.merge_tokens)
+        stats.elapsed_s = max(stats.elapsed_s, time.perf_counter() - started)
+        return Part(truncate_tokens(title, 60), text, level)
+
+    async def _finish(self, question: str, parts: List[Part], missing: Iterable[str], result: SynthesisResult,
+                      semaphore: asyncio.Semaphore) -> SynthesisResult:
+        # Reduce level by level until one prompt can hold what is left
+        while not self._fits(parts):
+            groups = self._pack(parts)
+            merged = await asyncio.gather(*(
+                self._merge(question, group, result, semaphore) if len(group) > 1 else _carry(group[0])
+                for group in groups
+            ))
+            parts = list(merged)
+
+        level = max((p.level for p in parts), default=0) + 1
+        stats = result.levels.setdefault(level, LevelStats(level))
+        stats.calls += 1
+        stats.max_input_tokens = max(stats.max_input_tokens, sum(p.tokens for p in parts))
+        started = time.perf_counter()
+        async with semaphore:
+            result.answer = await asyncio.wait_for(
+                self.call(self.model, final_messages(question, parts, missing)), self.call_timeout
+            )
+        stats.elapsed_s = time.perf_counter() - started
+        return result
+
+    async def tree_reduce(self, question: str, parts: List[Part], missing: Iterable[str] = ()) -> SynthesisResult:
+        """Final answer from `parts`, merging groups concurrently level by level."""
+        started = time.perf_counter()
+        result = SynthesisResult("", "tree")
+        await self._finish(question, list(parts), missing, result, asyncio.Semaphore(self.max_concurrency))
+        result.elapsed_s = time.perf_counter() - started
+        return result
+
+    async def synthesize(self, fanout: FanOutResult) -> SynthesisResult:
+        """Tree-reduce a finished fan-out; sub-problems without an answer are named in the final prompt."""
+        missing = [r.sub_problem for r in fanout.results if r.status != "ok"]
+        return await self.tree_reduce(fanout.question, [Part.from_result(r) for r in fanout.completed], missing)
+
+    async def stream(self, engine, fanout: FanOutResult, deadline: Optional[float] = None) -> SynthesisResult:
+        """
+        Run `fanout` on `engine` and merge answers as they arrive.
+
+        Whenever `fan_in` parts of the same level are waiting (or they fill the
+        budget), they are merged in the background while the other workers keep
+        running; merged parts re-enter the queue at the next level. When the
+        workers are done, whatever is left is finished as in tree_reduce.
+        """
+        started = time.perf_counter()
+        result = SynthesisResult("", "stream")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        ready: List[Part] = []
+        merging: set = set()
+
+        def launch_ready_groups() -> None:
+            for level in sorted({p.level for p in ready}):
+                waiting = [p for p in ready if p.level == level]
+                for group in self._pack(waiting):
+                    full = len(group) >= self.fan_in or sum(p.tokens for p in group) > self.level_budget // 2
+                    if len(group) > 1 and full:
+                        for part in group:
+                            ready.remove(part)
+                        merging.add(asyncio.create_task(self._merge(fanout.question, group, result, semaphore)))
+
+        results: AsyncIterator[WorkerResult] = engine.stream(fanout, deadline)
+        next_result: Optional[asyncio.Task] = asyncio.ensure_future(results.__anext__())
+        try:
+            while next_result is not None or merging:
+                waiting = merging | ({next_result} if next_result is not None else set())
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is next_result:
+                        try:
+                            worker = task.result()
+                        except StopAsyncIteration:
+                            next_result = None
+                            continue
+                        if worker.status == "ok":
+                            ready.append(Part.from_result(worker))
+                        next_result = asyncio.ensure_future(results.__anext__())
+                    else:
+                        merging.discard(task)
+                        ready.append(task.result())
+                launch_ready_groups()
+        finally:
+            pending = merging | ({next_result} if next_result is not None else set())
+            for task in pending:
+                task.cancel()
+            # The generator must be out of __anext__ before aclose() can run engine.stream's cleanup
+            await asyncio.gather(*pending, return_exceptions=True)
+            await results.aclose()
+
+        missing = [r.sub_problem for r in fanout.results if r.status != "ok"]
+        await self._finish(fanout.question, ready, missing, result, semaphore)
+        result.elapsed_s = time.perf_counter() - started
+        return result
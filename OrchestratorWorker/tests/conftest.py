@@ -0,0 +1,18 @@
+import pytest
+
+from orchestrator_worker.clients import ClientRegistry
+from tests.stubs import StubProviderServer, stub_providers
+
+
+@pytest.fixture
+def server():
+    server = StubProviderServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_registry(server):
+    """Builds a ClientRegistry on the stand-in; call it inside the test's event loop and aclose() it there."""
+    return lambda: ClientRegistry(stub_providers(server))
+
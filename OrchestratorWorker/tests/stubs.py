@@ -0,0 +1,148 @@
+"""
+Local stand-in providers for the worker models.
+
+One threaded server answers both OpenAI-style POST /v1/chat/completions and
+Anthropic-style POST /v1/messages, sleeping a configurable time per model.
+`stub_providers(server)` points every provider at it, so the real SDK clients
+and the engine run end to end without API keys or network. `connections`
+counts TCP connections accepted, which shows whether clients reuse a pool.
+Used by the tests (see conftest.py) and benchmarks/pooling.py.
+"""
+import json
+import socket
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from orchestrator_worker.providers import PROVIDERS, Provider
+
+
+class StubProviderServer:
+    """Chat completion / messages stand-in with per-model latency and failures."""
+
+    def __init__(self, latency: Optional[Dict[str, float]] = None, default_latency: float = 0.05):
+        self.latency = dict(latency or {})
+        self.default_latency = default_latency
+        self.failing: set = set()
+        # Pad every answer to this many characters (0: short one-line answers)
+        self.answer_chars = 0
+        self.requests: List[str] = []
+        self.connections = 0
+        self.in_flight = 0
+        self.peak_in_flight: Dict[str, int] = {}
+        self._in_flight_by_model: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def _enter(self, model: str) -> None:
+        with self._lock:
+            self.requests.append(model)
+            self.in_flight += 1
+            count = self._in_flight_by_model.get(model, 0) + 1
+            self._in_flight_by_model[model] = count
+            self.peak_in_flight[model] = max(self.peak_in_flight.get(model, 0), count)
+
+    def _leave(self, model: str) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._in_flight_by_model[model] -= 1
+
+    def start(self) -> "StubProviderServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; don't let Nagle hold the body back on keep-alive
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                model = body.get("model", "")
+                prompt = body.get("messages", [{}])[-1].get("content", "")
+                stub._enter(model)
+                try:
+                    time.sleep(stub.latency.get(model, stub.default_latency))
+                finally:
+                    stub._leave(model)
+
+                text = f"[{model}] answer to: {prompt[:80]}"
+                if stub.answer_chars > len(text):
+                    text += " " + "lorem ipsum " * ((stub.answer_chars - len(text)) // 12)
+                if model in stub.failing:
+                    # 400 rather than 5xx so the SDKs don't retry it
+                    status, payload = 400, {"error": {"type": "invalid_request_error", "message": "stub failure"}}
+                elif self.path.endswith("/chat/completions"):
+                    status, payload = 200, {
+                        "id": "chatcmpl-stub", "object": "chat.completion", "created": int(time.time()),
+                        "model": model,
+                        "choices": [{
+                            "index": 0, "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": text}
+                        }],
+                        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4,
+                                  "total_tokens": (len(prompt) + len(text)) // 4}
+                    }
+                elif self.path.endswith("/messages"):
+                    status, payload = 200, {
+                        "id": "msg_stub", "type": "message", "role": "assistant", "model": model,
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn", "stop_sequence": None,
+                        "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4}
+                    }
+                else:
+                    status, payload = 404, {"error": {"message": f"no stub for {self.path}"}}
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                try:
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client gave up (timeout, deadline or lost hedge)
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def stub_providers(server: StubProviderServer) -> Dict[str, Provider]:
+    """PROVIDERS with every base URL pointed at the stub (limits unchanged)."""
+    return {
+        name: replace(
+            provider,
+            # The Anthropic SDK adds /v1/messages itself; OpenAI-style clients expect /v1 in the base URL
+            base_url=server.url if provider.api == "anthropic" else f"{server.url}/v1",
+            api_key="stub"
+        )
+        for name, provider in PROVIDERS.items()
+    }
@@ -0,0 +1,66 @@
+import asyncio
+
+from orchestrator_worker.engine import FanOutEngine, synthesis_messages
+
+
+QUESTION = "How should a small bakery expand into online sales?"
+
+ASSIGNMENTS = {
+    "Pick an e-commerce platform": "gpt-5-nano",
+    "Plan delivery logistics": "claude-sonnet-4-5",
+    "Estimate the marketing budget": "gemini-2.5-flash",
+    "Draft a pricing strategy": "openai/gpt-oss-120b",
+    "Summarise local regulations": "llama3.2",
+}
+
+
+def run_engine(make_registry, assignments, deadline=None, **engine_options):
+    async def run():
+        registry = make_registry()
+        try:
+            engine = FanOutEngine(registry.acomplete, registry.providers, **engine_options)
+            return await engine.run(assignments, QUESTION, deadline=deadline)
+        finally:
+            await registry.aclose()
+
+    return asyncio.run(run())
+
+
+def test_workers_run_concurrently(server, make_registry):
+    # All five at once: elapsed tracks the slowest worker, not the sum
+    server.latency.update({model: 0.3 for model in ASSIGNMENTS.values()})
+    fanout = run_engine(make_registry, ASSIGNMENTS)
+    assert not fanout.partial and len(fanout.answers) == 5, [r.status for r in fanout.results]
+    assert fanout.elapsed_s < 0.3 * 3
+    assert [r.sub_problem for r in fanout.results] == list(ASSIGNMENTS)
+
+
+def test_provider_limit(server, make_registry):
+    # Four sub-problems on the single-slot local model run one at a time
+    server.latency["llama3.2"] = 0.3
+    local = {f"Local task {i}": "llama3.2" for i in range(4)}
+    fanout = run_engine(make_registry, local)
+    assert server.peak_in_flight["llama3.2"] == 1 and fanout.elapsed_s >= 0.3 * 4
+
+    server.peak_in_flight.clear()
+    run_engine(make_registry, local, provider_limits={"ollama": 4})
+    assert server.peak_in_flight["llama3.2"] == 4
+
+
+def test_timeouts_and_errors_are_recorded(server, make_registry):
+    server.latency["gemini-2.5-flash"] = 2.0
+    server.failing.add("openai/gpt-oss-120b")
+    fanout = run_engine(make_registry, ASSIGNMENTS, call_timeout=0.8)
+    statuses = {r.model: r.status for r in fanout.results}
+    assert statuses["gemini-2.5-flash"] == "timeout" and statuses["openai/gpt-oss-120b"] == "error"
+    assert fanout.partial and len(fanout.answers) == 3
+
+
+def test_deadline_cancels_stragglers(server, make_registry):
+    server.latency["gemini-2.5-flash"] = 5.0
+    fanout = run_engine(make_registry, ASSIGNMENTS, deadline=1.0)
+    statuses = {r.model: r.status for r in fanout.results}
+    assert statuses["gemini-2.5-flash"] == "deadline" and fanout.elapsed_s < 2.0
+    # Synthesis goes ahead and names the sub-problem left unanswered
+    prompt = synthesis_messages(QUESTION, fanout)[0]["content"]
+    assert "Estimate the marketing budget" in prompt.split("have no answer", 1)[1]
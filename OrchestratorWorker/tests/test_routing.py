@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+from orchestrator_worker.engine import FanOutEngine
+from orchestrator_worker.providers import MODEL_PROVIDERS
+from orchestrator_worker.routing import Router
+
+
+MESSAGES = [{"role": "user", "content": "warm-up"}]
+
+
+async def warm_up(router, call, rounds=3):
+    observed = router.observe(call)
+    for _ in range(rounds):
+        for model in MODEL_PROVIDERS:
+            try:
+                await observed(model, MESSAGES)
+            except Exception:
+                pass
+
+
+def slow_and_failing(server):
+    # History: gemini is slow, the groq model fails, the rest answer in ~0.1s
+    server.default_latency = 0.1
+    server.latency["gemini-2.5-flash"] = 0.8
+    server.failing.add("openai/gpt-oss-120b")
+
+
+def test_route_avoids_slow_and_failing_models(server, make_registry):
+    slow_and_failing(server)
+
+    async def run():
+        registry = make_registry()
+        router = Router(registry.providers, min_samples=3)
+        try:
+            await warm_up(router, registry.acomplete)
+        finally:
+            await registry.aclose()
+        return router
+
+    router = asyncio.run(run())
+    assert router.error_rate("openai/gpt-oss-120b") == 1.0
+    assert router.expected_latency("gemini-2.5-flash") >= 0.8
+
+    plan = router.route({
+        "Budget": "gemini-2.5-flash",
+        "Pricing": "openai/gpt-oss-120b",
+        "Platform": "gpt-5-nano",
+    }, deadline=0.5)
+    chosen = {o.requested: o.chosen for o in plan.overrides}
+    assert set(chosen) == {"gemini-2.5-flash", "openai/gpt-oss-120b"}
+    assert plan.assignments["Platform"] == "gpt-5-nano" and plan.estimated_s <= 0.5
+
+
+def test_hedge_to_another_provider(server, make_registry):
+    slow_and_failing(server)
+
+    async def run():
+        registry = make_registry()
+        router = Router(registry.providers, min_samples=3, hedge_delay=0.3)
+        try:
+            await warm_up(router, registry.acomplete)
+            # gemini stalls this time; past its p95 (~0.8s) a backup on another provider wins
+            server.latency["gemini-2.5-flash"] = 5.0
+            started = time.perf_counter()
+            answer = await router.hedged(registry.acomplete)("gemini-2.5-flash", MESSAGES)
+            return router, answer, time.perf_counter() - started
+        finally:
+            await registry.aclose()
+
+    router, answer, elapsed = asyncio.run(run())
+    hedge = router.hedges[-1]
+    assert hedge.winner == hedge.backup != "gemini-2.5-flash" and elapsed < 2.0
+    assert answer.startswith(f"[{hedge.backup}]")
+
+
+def test_hedges_respect_the_backup_provider_limit(server, make_registry):
+    slow_and_failing(server)
+
+    async def run():
+        registry = make_registry()
+        router = Router(registry.providers, min_samples=3)
+        try:
+            await warm_up(router, registry.acomplete)
+            backup = router.backup_for("gemini-2.5-flash")
+            server.latency["gemini-2.5-flash"] = 5.0
+            server.latency[backup] = 0.3
+            server.peak_in_flight.clear()
+            # Three stalled gemini calls all hedge to the same backup provider, capped at one slot
+            engine = FanOutEngine(
+                registry.acomplete, registry.providers,
+                provider_limits={MODEL_PROVIDERS[backup]: 1}
+            )
+            engine.call = router.hedged(registry.acomplete, engine.slot)
+            fanout = await engine.run({f"Task {i}": "gemini-2.5-flash" for i in range(3)}, "question")
+            return fanout, backup
+        finally:
+            await registry.aclose()
+
+    fanout, backup = asyncio.run(run())
+    assert len(fanout.answers) == 3 and all(a.startswith(f"[{backup}]") for a in fanout.answers)
+    assert server.peak_in_flight[backup] == 1
+
+
+def test_timeouts_count_as_errors(server, make_registry):
+    server.latency["gemini-2.5-flash"] = 2.0
+    server.latency["gpt-5-nano"] = 2.0
+
+    async def run():
+        registry = make_registry()
+        router = Router(registry.providers, min_samples=3)
+        try:
+            engine = FanOutEngine(router.observe(registry.acomplete), registry.providers, call_timeout=0.3)
+            await engine.run({f"Task {i}": "gemini-2.5-flash" for i in range(3)}, "question")
+            # Cut off by the deadline instead: slow, but not an error
+            await engine.run({"Task": "gpt-5-nano"}, "question", deadline=0.1)
+        finally:
+            await registry.aclose()
+        return router
+
+    router = asyncio.run(run())
+    assert router.stats["gemini-2.5-flash"].error_rate() == 1.0
+    assert router.stats["gpt-5-nano"].error_rate() == 0.0 and len(router.stats["gpt-5-nano"]) == 1
+    (gemini,) = [row for row in router.provider_summary() if "gemini-2.5-flash" in row["models"]]
+    assert gemini["calls"] == 3 and gemini["error_rate"] == 1.0
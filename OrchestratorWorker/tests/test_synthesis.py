@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+from orchestrator_worker.engine import FanOutEngine
+from orchestrator_worker.providers import MODEL_PROVIDERS
+from orchestrator_worker.synthesis import Part, Synthesizer
+
+
+QUESTION = "How should a regional grocery chain cut food waste?"
+
+
+def test_budget_holds_and_streaming_is_faster(server, make_registry):
+    models = list(MODEL_PROVIDERS)
+    assignments = {f"Sub-problem {i}": models[i % len(models)] for i in range(16)}
+
+    # ~500-token answers, and merges that ignore the length target: the budget still holds at every level
+    server.answer_chars = 2000
+    server.default_latency = 0.1
+    server.latency["gemini-2.5-flash"] = 1.0
+
+    async def run():
+        registry = make_registry()
+        try:
+            engine = FanOutEngine(registry.acomplete, registry.providers, provider_limits={"ollama": 16})
+            synthesizer = Synthesizer(registry.acomplete, level_budget=1200, merge_tokens=300, fan_in=4)
+            started = time.perf_counter()
+            tree = await synthesizer.synthesize(await engine.run(assignments, QUESTION))
+            tree_s = time.perf_counter() - started
+            # Streaming merges the fast workers' answers while the slow ones are still running
+            stream = await synthesizer.stream(engine, engine.prepare(assignments, QUESTION))
+            return synthesizer, tree, tree_s, stream
+        finally:
+            await registry.aclose()
+
+    synthesizer, tree, tree_s, stream = asyncio.run(run())
+    for result in (tree, stream):
+        assert result.answer
+        assert all(level.max_input_tokens <= synthesizer.level_budget for level in result.levels.values())
+    assert len(tree.levels) >= 3
+    assert stream.elapsed_s < tree_s
+
+
+def test_failed_merges_carry_their_group_up(server, make_registry):
+    # Every merge call fails; the final call still answers from the unmerged, truncated groups
+    server.answer_chars = 2000
+    parts = [Part(f"Sub-problem {i}", "x" * 2000) for i in range(16)]
+
+    async def run():
+        registry = make_registry()
+
+        async def merges_fail(model, messages):
+            if "Merge them into one answer" in messages[0]["content"]:
+                raise RuntimeError("merge model unavailable")
+            return await registry.acomplete(model, messages)
+
+        try:
+            synthesizer = Synthesizer(merges_fail, level_budget=1200, merge_tokens=300, fan_in=4)
+            return synthesizer, await synthesizer.tree_reduce(QUESTION, parts)
+        finally:
+            await registry.aclose()
+
+    synthesizer, result = asyncio.run(run())
+    assert result.answer and len(result.errors) == result.calls - 1
+    assert all("RuntimeError: merge model unavailable" in error for error in result.errors)
+    assert all(level.max_input_tokens <= synthesizer.level_budget for level in result.levels.values())
+
+
+def test_cancelling_stream_stops_the_workers(server, make_registry):
+    server.latency["gemini-2.5-flash"] = 5.0
+    assignments = {f"Sub-problem {i}": model for i, model in enumerate(MODEL_PROVIDERS)}
+
+    async def run():
+        registry = make_registry()
+        try:
+            engine = FanOutEngine(registry.acomplete, registry.providers)
+            fanout = engine.prepare(assignments, QUESTION)
+            synthesis = asyncio.create_task(Synthesizer(registry.acomplete).stream(engine, fanout))
+            await asyncio.sleep(0.5)
+            synthesis.cancel()
+            try:
+                await synthesis
+            except asyncio.CancelledError:
+                cancelled = True
+            else:
+                cancelled = False
+            leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            return cancelled, fanout, leftover
+        finally:
+            await registry.aclose()
+
+    cancelled, fanout, leftover = asyncio.run(run())
+    assert cancelled and not leftover
+    assert all(r.status != "pending" for r in fanout.results)